@@ -16,6 +16,7 @@
 
 import functools
 import logging
+import time
 
 import neutronclient.common.exceptions as neutron_exc
 
@@ -110,6 +111,8 @@ class CeilometerBaseTest(fuel_health.nmanager.PlatformServicesBaseClass):
         self.check_clients_state()
         if not self.ceilometer_client:
             self.skipTest('Ceilometer is unavailable.')
+        # Seconds it took for samples or events to arrive, by object name.
+        self.arrival_latency = {}
 
     def create_server(self, name, **kwargs):
         server = self._create_server(self.compute_client, name, **kwargs)
@@ -214,9 +217,52 @@ class CeilometerBaseTest(fuel_health.nmanager.PlatformServicesBaseClass):
             return self.ceilometer_client.statistics.list(meter_name, q=query,
                                                           period=period)
 
-    def wait_for_ceilo_objects(self, object_list, query, ceilo_obj_type):
-        for obj in object_list:
-            self.wait_for_object_sample(obj, query, ceilo_obj_type)
+    def wait_for_ceilo_objects(self, object_list, query, ceilo_obj_type,
+                               timeout=600, sleep_for=10):
+        """This method is to wait for samples (or events) of all objects
+        from object_list to be added to database.
+
+        All outstanding objects are checked on each polling cycle within
+        a shared timeout. Time it took for each object to arrive is logged
+        and saved to the arrival_latency dictionary.
+        """
+        start = time.time()
+        pending = list(object_list)
+
+        def has_object(obj):
+            kwargs = {"q": list(query)}
+            if ceilo_obj_type == 'sample':
+                method = self.ceilometer_client.samples.list
+                kwargs["meter_name"] = obj
+            elif ceilo_obj_type == "event":
+                kwargs["q"].append(
+                    {'field': 'event_type', 'op': 'eq', 'value': obj})
+                method = self.ceilometer_client.events.list
+            try:
+                return bool(method(**kwargs))
+            except Exception:
+                return False
+
+        def check_status():
+            for obj in list(pending):
+                if has_object(obj):
+                    pending.remove(obj)
+                    latency = time.time() - start
+                    self.arrival_latency[obj] = latency
+                    LOG.debug('Ceilometer {0} "{1}" arrived in {2:.1f} '
+                              'seconds.'.format(ceilo_obj_type, obj, latency))
+            if not pending:
+                return True
+            LOG.debug('Waiting for {0}s: {1}'.format(ceilo_obj_type,
+                                                     ', '.join(pending)))
+
+        if not fuel_health.test.call_until_true(check_status, timeout,
+                                                sleep_for):
+            self.fail(
+                "Timed out waiting for objects: {objs} "
+                "with query:{query}".format(objs=', '.join(pending),
+                                            query=query))
+        return dict((obj, self.arrival_latency[obj]) for obj in object_list)
 
     def create_image_sample(self, image_id):
         sample = self.ceilometer_client.samples.create(
@@ -13,8 +13,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
 import os
 import sys
+import threading
 import time
 
 path = os.getcwd()
@@ -35,196 +37,398 @@ class CleanUpClientManager(fuel_health.nmanager.OfficialClientManager):
     calling various OpenStack APIs.
     """
 
-    def wait_for_server_termination(self, server, ignore_error=False):
-        """Waits for server to reach termination."""
+    def __init__(self):
+        super(CleanUpClientManager, self).__init__()
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def get_client(self, service):
+        """Returns the client of given service, creating it only once.
+
+        Clients already built by OfficialClientManager are reused, so
+        cleanup phases do not pay a keystone authentication per call.
+        """
+        with self._clients_lock:
+            if service not in self._clients:
+                client = getattr(self, '{0}_client'.format(service), None)
+                if client is None:
+                    client = getattr(
+                        self, '_get_{0}_client'.format(service))()
+                self._clients[service] = client
+            return self._clients[service]
+
+    def wait_for_servers_termination(self, server_ids, ignore_error=False):
+        """Waits for all given servers to reach termination.
+
+        Servers are checked with one list call per polling round.
+        Servers in ERROR status are not waited for anymore (unless
+        ignore_error is set); they are reported after all other
+        servers are gone.
+        """
+        pending = set(server_ids)
+        failed = []
+        build_timeout = self.config.compute.build_timeout
+        build_interval = self.config.compute.build_interval
         start_time = int(time.time())
         while True:
-            try:
-                self._get_compute_client().servers.get(server)
-            except exceptions.NotFound:
-                return
+            servers = [server for server
+                       in self.get_client('compute').servers.list()
+                       if server.id in pending]
+            pending = set(server.id for server in servers)
+
+            if not ignore_error:
+                for server in servers:
+                    if server.status == 'ERROR':
+                        LOG.error('Server {0} is in ERROR status, it is '
+                                  'not waited for'.format(server.id))
+                        failed.append(server.id)
+                        pending.discard(server.id)
+
+            if not pending:
+                break
+
+            if int(time.time()) - start_time >= build_timeout:
+                raise exceptions.TimeoutException
 
-            server_status = server.status
-            if server_status == 'ERROR' and not ignore_error:
-                raise exceptions.BuildErrorException(server_id=server.id)
+            time.sleep(build_interval)
 
-            if int(time.time()) - start_time >= self.build_timeout:
-                raise exceptions.TimeoutException
+        if failed:
+            raise exceptions.BuildErrorException(
+                server_id=', '.join(failed))
+
+
+class CleanupPhase(object):
+    """Single step of the cluster cleanup.
+
+    Phase removes resources of one type and starts only after all
+    phases listed in requires are finished, so independent phases
+    can be executed concurrently.
+    """
 
-            time.sleep(self.build_interval)
+    def __init__(self, name, action, requires=()):
+        self.name = name
+        self.action = action
+        self.requires = tuple(requires)
+        self.done = threading.Event()
+        self.deleted = []
+        self.duration = None
 
+    def run(self, phases, dry_run=False):
+        for name in self.requires:
+            if name in phases:
+                phases[name].done.wait()
 
-def cleanup(cluster_deployment_info):
+        start_time = time.time()
+        try:
+            self.deleted = self.action(dry_run=dry_run) or []
+        except Exception:
+            LOG.exception('Failed during {0} cleanup'.format(self.name))
+        finally:
+            self.duration = time.time() - start_time
+            self.done.set()
+
+
+def cleanup(cluster_deployment_info, dry_run=False):
     """Function performs cleaning up for current cluster.
 
     Because clusters can be deployed in different way
     function uses cluster_deployment_info argument which
     contains list of deployment tags of needed cluster.
 
-    This approach that consists in using one cleanup function
-    for all possible testsets is not so good because of
-    constant checking of component presence in deployment info.
+    Cleanup is split into phases (one per resource type) which
+    are ordered by their dependencies, e.g. security groups are
+    removed only after servers are gone. Independent phases are
+    run in separate threads.
 
-    More better way is to create separate functions for each
-    set of tests so refactoring of this chunk of code is higly
-    appreciated.
+    If dry_run is set nothing is deleted, function only reports
+    resources that would be deleted.
+
+    Returns report with names of deleted resources and duration
+    of each phase.
     """
     manager = CleanUpClientManager()
 
-    if 'sahara' in cluster_deployment_info:
-        try:
-            sahara_client = manager._get_sahara_client()
-            if sahara_client is not None:
-                _delete_it(client=sahara_client.clusters,
-                           log_message='Start sahara cluster deletion',
-                           name='ostf-test-', delete_type='id')
-                _delete_it(client=sahara_client.cluster_templates,
-                           log_message='Start sahara cluster'
-                                       ' template deletion',
-                           delete_type='id')
-                _delete_it(client=sahara_client.node_group_templates,
-                           log_message='Start sahara node'
-                                       ' group template deletion',
-                           delete_type='id')
-        except Exception:
-            LOG.exception('Failed sahara cluster cleanup')
-
-    if 'murano' in cluster_deployment_info:
-        try:
-            murano_client = manager._get_murano_client()
-            compute_client = manager._get_compute_client()
-
-            if murano_client is not None:
-                endpoint = manager.config.murano.api_url + '/v1/'
-                headers = {'X-Auth-Token': murano_client.auth_token,
-                           'content-type': 'application/json'}
-                environments = requests.get(endpoint + 'environments',
-                                            headers=headers).json()
-                for e in environments["environments"]:
-                    if e['name'].startswith('ostf_test-'):
-                        try:
-                            LOG.info('Start environment deletion.')
-                            requests.delete('{0}environments/{1}'.format(
-                                endpoint, e['id']), headers=headers)
-                        except Exception:
-                            LOG.exception('Failed to delete murano \
-                                          environment')
-
-            if compute_client is not None:
-                flavors = compute_client.flavors.list()
-                for flavor in flavors:
-                    if 'ostf_test_Murano' in flavor.name:
-                        try:
-                            LOG.info('Start flavor deletion.')
-                            compute_client.flavors.delete(flavor.id)
-                        except Exception:
-                            LOG.exception('Failed to delete flavor')
+    phases = dict((phase.name, phase) for phase
+                  in _get_phases(manager, cluster_deployment_info))
+
+    threads = []
+    for phase in phases.values():
+        thread = threading.Thread(target=phase.run,
+                                  args=(phases,),
+                                  kwargs={'dry_run': dry_run},
+                                  name='cleanup-{0}'.format(phase.name))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    report = {}
+    for name, phase in phases.items():
+        report[name] = {'deleted': phase.deleted,
+                        'duration': phase.duration}
+        LOG.info('Cleanup phase {name}: {action} {count} resource(s) '
+                 'in {duration:.2f}s: {deleted}'.format(
+                     name=name,
+                     action='would delete' if dry_run else 'deleted',
+                     count=len(phase.deleted),
+                     duration=phase.duration,
+                     deleted=', '.join(phase.deleted)))
+
+    return report
+
+
+def _get_phases(manager, cluster_deployment_info):
+    def phase(name, action, requires=()):
+        return CleanupPhase(name, functools.partial(action, manager),
+                            requires=requires)
+
+    phases = []
+    optional_phases = [
+        ('sahara', _cleanup_sahara),
+        ('murano', _cleanup_murano),
+        ('ceilometer', _cleanup_ceilometer),
+        ('heat', _cleanup_heat),
+        ('ironic', _cleanup_ironic),
+    ]
+    for component, action in optional_phases:
+        if component in cluster_deployment_info:
+            phases.append(phase(component, action))
+
+    phases.extend([
+        phase('servers', _cleanup_servers),
+        phase('keypairs', _cleanup_keypairs, requires=['servers']),
+        phase('users', _cleanup_users),
+        phase('tenants', _cleanup_tenants,
+              requires=['users', 'servers', 'volumes']),
+        phase('roles', _cleanup_roles,
+              requires=['users', 'servers', 'volumes']),
+        phase('images', _cleanup_images, requires=['servers']),
+        phase('volumes', _cleanup_volumes, requires=['servers']),
+        phase('flavors', _cleanup_flavors,
+              requires=['servers', 'sahara', 'murano', 'heat']),
+        phase('volume_types', _cleanup_volume_types, requires=['volumes']),
+        phase('security_groups', _cleanup_security_groups,
+              requires=['servers', 'sahara', 'murano', 'heat']),
+    ])
+
+    return phases
+
+
+def _cleanup_sahara(manager, dry_run=False):
+    deleted = []
+    sahara_client = manager.get_client('sahara')
+    if sahara_client is not None:
+        deleted.extend(_delete_it(client=sahara_client.clusters,
+                                  log_message='Start sahara cluster deletion',
+                                  name='ostf-test-', delete_type='id',
+                                  dry_run=dry_run))
+        deleted.extend(_delete_it(client=sahara_client.cluster_templates,
+                                  log_message='Start sahara cluster'
+                                              ' template deletion',
+                                  delete_type='id', dry_run=dry_run))
+        deleted.extend(_delete_it(client=sahara_client.node_group_templates,
+                                  log_message='Start sahara node'
+                                              ' group template deletion',
+                                  delete_type='id', dry_run=dry_run))
+    return deleted
+
+
+def _cleanup_murano(manager, dry_run=False):
+    deleted = []
+    murano_client = manager.get_client('murano')
+    compute_client = manager.get_client('compute')
+
+    if murano_client is not None:
+        endpoint = manager.config.murano.api_url + '/v1/'
+        session = requests.Session()
+        session.headers.update({'X-Auth-Token': murano_client.auth_token,
+                                'content-type': 'application/json'})
+        environments = session.get(endpoint + 'environments').json()
+        for e in environments["environments"]:
+            if e['name'].startswith('ostf_test-'):
+                deleted.append(e['name'])
+                if dry_run:
+                    continue
+                try:
+                    LOG.info('Start environment deletion.')
+                    session.delete('{0}environments/{1}'.format(
+                        endpoint, e['id']))
+                except Exception:
+                    LOG.exception('Failed to delete murano environment')
+
+    if compute_client is not None:
+        flavors = compute_client.flavors.list()
+        for flavor in flavors:
+            if 'ostf_test_Murano' in flavor.name:
+                deleted.append(flavor.name)
+                if dry_run:
+                    continue
+                try:
+                    LOG.info('Start flavor deletion.')
+                    compute_client.flavors.delete(flavor.id)
+                except Exception:
+                    LOG.exception('Failed to delete flavor')
 
-        except Exception:
-            LOG.exception('Failed murano cluster cleanup')
+    return deleted
 
-    if 'ceilometer' in cluster_deployment_info:
-        try:
-            ceilometer_client = manager._get_ceilometer_client()
-            if ceilometer_client is not None:
-                alarms = ceilometer_client.alarms.list()
-                for a in alarms:
-                    if a.name.startswith('ost1_test-'):
-                        try:
-                            LOG.info('Start alarms deletion.')
-                            ceilometer_client.alarms.delete(a.id)
-                        except Exception as exc:
-                            LOG.debug(exc)
-        except Exception as exc:
-            LOG.warning('Something wrong with ceilometer client. '
-                        'Exception: {0}'.format(exc))
-
-    if 'heat' in cluster_deployment_info:
-        try:
-            heat_client = manager._get_heat_client()
-            if heat_client is not None:
-                stacks = heat_client.stacks.list()
-                for s in stacks:
-                    if s.stack_name.startswith('ost1_test-'):
-                        try:
-                            LOG.info('Start stacks deletion.')
-                            heat_client.stacks.delete(s.id)
-                        except Exception:
-                            LOG.exception('Failed stacks deletion')
-        except Exception:
-            LOG.exception('Failed during heat cluster deletion')
 
-    if 'ironic' in cluster_deployment_info:
-        try:
-            ironic_client = manager._get_ironic_client()
-            if ironic_client is not None:
-                nodes = ironic_client.node.list()
-                for n in nodes:
-                    if "NodeTest" in ironic_client.node.extra.items():
-                        try:
-                            LOG.info('Start nodes deletion.')
-                            ironic_client.node.delete(n.uuid)
-                        except Exception as exc:
-                            LOG.debug(exc)
-        except Exception as exc:
-            LOG.warning('Something wrong with ironic client. '
-                        'Exception: {0}'.format(exc))
-
-    instances_id = []
-    servers = manager._get_compute_client().servers.list()
-    floating_ips = manager._get_compute_client().floating_ips.list()
-
-    if servers:
-        for s in servers:
-            if s.name.startswith('ost1_test-'):
-                instances_id.append(s.id)
-                for f in floating_ips:
-                    if f.instance_id in instances_id:
-                        try:
-                            LOG.info('Delete floating ip {0}'.format(f.ip))
-                            manager._get_compute_client().floating_ips.delete(
-                                f.id)
-                        except Exception:
-                            LOG.exception('Failed during floating ip delete')
+def _cleanup_ceilometer(manager, dry_run=False):
+    deleted = []
+    ceilometer_client = manager.get_client('ceilometer')
+    if ceilometer_client is not None:
+        alarms = ceilometer_client.alarms.list()
+        for a in alarms:
+            if a.name.startswith('ost1_test-'):
+                deleted.append(a.name)
+                if dry_run:
+                    continue
                 try:
-                    LOG.info('Delete server with name {0}'.format(s.name))
-                    manager._get_compute_client().servers.delete(s.id)
+                    LOG.info('Start alarms deletion.')
+                    ceilometer_client.alarms.delete(a.id)
+                except Exception as exc:
+                    LOG.debug(exc)
+    return deleted
+
+
+def _cleanup_heat(manager, dry_run=False):
+    deleted = []
+    heat_client = manager.get_client('heat')
+    if heat_client is not None:
+        stacks = heat_client.stacks.list()
+        for s in stacks:
+            if s.stack_name.startswith('ost1_test-'):
+                deleted.append(s.stack_name)
+                if dry_run:
+                    continue
+                try:
+                    LOG.info('Start stacks deletion.')
+                    heat_client.stacks.delete(s.id)
                 except Exception:
-                    LOG.exception()
-    else:
+                    LOG.exception('Failed stacks deletion')
+    return deleted
+
+
+def _cleanup_ironic(manager, dry_run=False):
+    deleted = []
+    ironic_client = manager.get_client('ironic')
+    if ironic_client is not None:
+        nodes = ironic_client.node.list()
+        for n in nodes:
+            if "NodeTest" in n.extra.items():
+                deleted.append(n.uuid)
+                if dry_run:
+                    continue
+                try:
+                    LOG.info('Start nodes deletion.')
+                    ironic_client.node.delete(n.uuid)
+                except Exception as exc:
+                    LOG.debug(exc)
+    return deleted
+
+
+def _cleanup_servers(manager, dry_run=False):
+    deleted = []
+    compute_client = manager.get_client('compute')
+    servers = [s for s in compute_client.servers.list()
+               if s.name.startswith('ost1_test-')]
+    if not servers:
         LOG.info('No servers found')
-
-        for s in servers:
+        return deleted
+
+    # floating ips are listed once and indexed by instance
+    # instead of being listed again for every server
+    floating_ips = {}
+    for f in compute_client.floating_ips.list():
+        floating_ips.setdefault(f.instance_id, []).append(f)
+
+    for s in servers:
+        for f in floating_ips.get(s.id, []):
+            deleted.append(f.ip)
+            if dry_run:
+                continue
             try:
-                LOG.info('Wait for server terminations')
-                manager.wait_for_server_termination(s)
+                LOG.info('Delete floating ip {0}'.format(f.ip))
+                compute_client.floating_ips.delete(f.id)
             except Exception:
-                LOG.exception('Failure on waiting for server termination')
-
-    _delete_it(manager._get_compute_client().keypairs,
-               'Start keypair deletion')
-    _delete_it(manager._get_identity_client().users, 'Start deletion of users')
-    _delete_it(manager._get_identity_client().tenants, 'Start tenant deletion')
-    roles = manager._get_identity_client().roles.list()
-    if roles:
-        _delete_it(manager._get_identity_client().roles,
-                   'Start roles deletion')
-    else:
-        LOG.info('no roles')
-    _delete_it(manager._get_compute_client().images, 'Start images deletion')
-    _delete_it(manager._get_volume_client().volumes, 'Start volumes deletion')
-    _delete_it(manager._get_compute_client().flavors, 'start flavors deletion')
-    _delete_it(manager._get_volume_client().volume_types,
-               'start deletion of volume types')
-    _delete_it(manager._get_compute_client().security_groups,
-               'Start deletion of security groups', delete_type='id')
-
-
-def _delete_it(client, log_message, name='ost1_test-', delete_type='name'):
+                LOG.exception('Failed during floating ip delete')
+
+        deleted.append(s.name)
+        if dry_run:
+            continue
+        try:
+            LOG.info('Delete server with name {0}'.format(s.name))
+            compute_client.servers.delete(s.id)
+        except Exception:
+            LOG.exception('Failed during server delete')
+
+    if not dry_run:
+        try:
+            LOG.info('Wait for server terminations')
+            manager.wait_for_servers_termination([s.id for s in servers])
+        except Exception:
+            LOG.exception('Failure on waiting for server termination')
+
+    return deleted
+
+
+def _cleanup_keypairs(manager, dry_run=False):
+    return _delete_it(manager.get_client('compute').keypairs,
+                      'Start keypair deletion', dry_run=dry_run)
+
+
+def _cleanup_users(manager, dry_run=False):
+    return _delete_it(manager.get_client('identity').users,
+                      'Start deletion of users', dry_run=dry_run)
+
+
+def _cleanup_tenants(manager, dry_run=False):
+    return _delete_it(manager.get_client('identity').tenants,
+                      'Start tenant deletion', dry_run=dry_run)
+
+
+def _cleanup_roles(manager, dry_run=False):
+    return _delete_it(manager.get_client('identity').roles,
+                      'Start roles deletion', dry_run=dry_run)
+
+
+def _cleanup_images(manager, dry_run=False):
+    return _delete_it(manager.get_client('compute').images,
+                      'Start images deletion', dry_run=dry_run)
+
+
+def _cleanup_volumes(manager, dry_run=False):
+    return _delete_it(manager.get_client('volume').volumes,
+                      'Start volumes deletion', dry_run=dry_run)
+
+
+def _cleanup_flavors(manager, dry_run=False):
+    return _delete_it(manager.get_client('compute').flavors,
+                      'start flavors deletion', dry_run=dry_run)
+
+
+def _cleanup_volume_types(manager, dry_run=False):
+    return _delete_it(manager.get_client('volume').volume_types,
+                      'start deletion of volume types', dry_run=dry_run)
+
+
+def _cleanup_security_groups(manager, dry_run=False):
+    return _delete_it(manager.get_client('compute').security_groups,
+                      'Start deletion of security groups', delete_type='id',
+                      dry_run=dry_run)
+
+
+def _delete_it(client, log_message, name='ost1_test-', delete_type='name',
+               dry_run=False):
+    deleted = []
     try:
         for item in client.list():
             try:
                 if item.name.startswith(name):
+                    deleted.append(item.name)
+                    if dry_run:
+                        continue
                     try:
                         LOG.info(log_message)
                         if delete_type == 'name':
@@ -232,13 +436,19 @@ def _delete_it(client, log_message, name='ost1_test-', delete_type='name'):
                         else:
                             client.delete(item.id)
                     except Exception:
-                        LOG.exception()
+                        LOG.exception('Failed to delete {0}'.format(
+                            item.name))
             except AttributeError:
                 if item.display_name.startswith(name):
-                    client.delete(item)
+                    deleted.append(item.display_name)
+                    if not dry_run:
+                        client.delete(item)
     except Exception:
-        LOG.exception()
+        LOG.exception('Failed to list resources to delete')
+    return deleted
 
 
 if __name__ == "__main__":
-    cleanup()
+    args = sys.argv[1:]
+    cleanup([arg for arg in args if arg != '--dry-run'],
+            dry_run='--dry-run' in args)
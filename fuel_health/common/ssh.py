@@ -118,12 +118,15 @@ class Client(object):
             LOG.exception('Closed on connecting to server')
             return
 
-    def exec_command(self, command):
+    def exec_command(self, command, stdin=None):
         """Execute the specified command on the server.
 
         Note that this method is reading whole command outputs to memory, thus
         shouldn't be used for large outputs.
 
+        If stdin is given it is written to standard input of the command
+        (without pseudo-terminal, so it isn't echoed to the output).
+
         :returns: data read from standard output of the command.
         :raises: SSHExecCommandFailed if command returns nonzero
                  status. The exception contains command status stderr content.
@@ -131,9 +134,12 @@ class Client(object):
         ssh = self._get_ssh_connection()
         transport = ssh.get_transport()
         channel = transport.open_session()
-        channel.get_pty()
+        if stdin is None:
+            channel.get_pty()
         channel.fileno()  # Register event pipe
         channel.exec_command(command)
+        if stdin is not None:
+            channel.sendall(stdin)
         channel.shutdown_write()
         out_data = []
         err_data = []
@@ -13,6 +13,17 @@
 # under the License.
 
 import signal
+import threading
+import time
+
+try:
+    import gevent
+except ImportError:
+    gevent = None
+try:
+    import greenlet
+except ImportError:
+    greenlet = None
 
 from fuel_health.common import log as logging
 
@@ -169,26 +180,115 @@ class FuelTestAssertMixin(object):
         :action: action that is performed by the method.
         """
         LOG.info("STEP:{0}, verify action: '{1}'".format(step, action))
+        step_timeout = timeout(secs, action)
+        outcome = 'success'
         try:
-            with timeout(secs, action):
+            with step_timeout:
                 result = func(*args, **kwargs)
         except Exception as exc:
             LOG.exception(exc)
+            if step_timeout.expired:
+                outcome = 'timeout'
+            elif isinstance(exc, AssertionError):
+                outcome = 'failure'
+            else:
+                outcome = 'error'
             if type(exc) is AssertionError:
                 msg = str(exc)
             self.fail("Step %s failed: " % step + msg +
                       " Please refer to OpenStack logs for more details.")
         else:
             return result
+        finally:
+            self._record_step(step, action, step_timeout.elapsed, secs,
+                              outcome)
+
+    def _record_step(self, step, action, duration, budget, outcome):
+        """Appends verified step to the timeline of the test.
+
+        Timeline is stored in steps_timeline attribute of the test case
+        and is saved by the OSTF adapter along with the test result.
+        """
+        LOG.info("STEP:{0}, action '{1}' took {2:.3f}s of {3}s".format(
+            step, action, duration or 0, budget))
+        if getattr(self, 'steps_timeline', None) is None:
+            self.steps_timeline = []
+        self.steps_timeline.append({
+            'step': step,
+            'action': action,
+            'duration': duration,
+            'timeout': budget,
+            'outcome': outcome
+        })
 
 
 class TimeOutError(Exception):
-    def __init__(self):
+    def __init__(self, timeout=None):
         Exception.__init__(self)
+        # timeout context whose deadline has expired
+        self.timeout = timeout
+
+
+# Stacks of active timeout contexts. Every thread and every greenlet
+# has its own stack, so deadlines can be nested and don't interfere
+# with each other.
+_ACTIVE_TIMEOUTS = {}
+
+
+def _current_execution_id():
+    if greenlet is not None:
+        return id(greenlet.getcurrent())
+    return threading.current_thread().ident
+
+
+def _active_timeouts():
+    return _ACTIVE_TIMEOUTS.get(_current_execution_id(), [])
+
+
+def _expired_timeout(now=None):
+    """Returns timeout context with the earliest expired deadline."""
+    now = now or time.time()
+    expired = None
+    for context in _active_timeouts():
+        if context.deadline <= now and (
+                expired is None or context.deadline < expired.deadline):
+            expired = context
+    return expired
+
+
+def remaining_time():
+    """Returns seconds left until the nearest active deadline or None if
+    code is not running within timeout context.
+    """
+    active = _active_timeouts()
+    if not active:
+        return None
+    deadline = min(context.deadline for context in active)
+    return max(0, deadline - time.time())
+
+
+def check_timeout():
+    """Raises TimeOutError if any active deadline has expired.
+
+    Code that can not be interrupted (e.g. running in worker thread)
+    should call it between the units of work to honor deadlines.
+    """
+    expired = _expired_timeout()
+    if expired is not None:
+        raise TimeOutError(expired)
 
 
 def _raise_TimeOut(sig, stack):
-    raise TimeOutError()
+    raise TimeOutError(_expired_timeout(time.time() + 0.001))
+
+
+def _is_in_greenlet():
+    return gevent is not None and \
+        isinstance(gevent.getcurrent(), gevent.Greenlet)
+
+
+def _is_in_main_thread():
+    return isinstance(threading.current_thread(), threading._MainThread)
 
 
 class timeout(object):
@@ -197,24 +297,83 @@ class timeout(object):
 
     >>with timeout(2):
     ...     requests.get("http://msdn.com")
+
+    Timeout is based on the deadline which is calculated when context
+    is entered. Deadlines can be nested and may be fractional. Code is
+    interrupted with gevent.Timeout when running in a greenlet and with
+    the real-time interval timer in the main thread. Elsewhere deadline
+    is honored cooperatively (see check_timeout) and is verified when
+    the context exits. Time spent within context is stored in elapsed.
     """
-    def __init__(self, timeout, action):
+    def __init__(self, timeout, action=''):
         self.timeout = timeout
         self.action = action
+        self.started_at = None
+        self.deadline = None
+        self.elapsed = None
+        self.expired = False
+        self._greenlet_timer = None
+        self._previous_handler = None
 
     def __enter__(self):
-        signal.signal(signal.SIGALRM, _raise_TimeOut)
-        signal.alarm(self.timeout)
+        self.started_at = time.time()
+        self.deadline = self.started_at + self.timeout
+
+        execution_id = _current_execution_id()
+        active = _ACTIVE_TIMEOUTS.setdefault(execution_id, [])
+        active.append(self)
+
+        if _is_in_greenlet():
+            self._greenlet_timer = gevent.Timeout(self.timeout,
+                                                  TimeOutError(self))
+            self._greenlet_timer.start()
+        elif _is_in_main_thread():
+            if len(active) == 1:
+                self._previous_handler = signal.signal(signal.SIGALRM,
+                                                       _raise_TimeOut)
+            self._set_timer()
+        return self
+
+    def _set_timer(self):
+        remaining = remaining_time()
+        if remaining is None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        else:
+            # zero value disables the timer, so deadline which has
+            # already passed is fired as soon as possible
+            signal.setitimer(signal.ITIMER_REAL, max(remaining, 0.001))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        signal.alarm(0)  # disable the alarm
-        if exc_type is not TimeOutError:
+        self.elapsed = time.time() - self.started_at
+
+        execution_id = _current_execution_id()
+        active = _ACTIVE_TIMEOUTS.get(execution_id, [])
+        if self in active:
+            active.remove(self)
+        if not active:
+            _ACTIVE_TIMEOUTS.pop(execution_id, None)
+
+        if self._greenlet_timer is not None:
+            self._greenlet_timer.cancel()
+        elif _is_in_main_thread():
+            self._set_timer()
+            if not active:
+                signal.signal(signal.SIGALRM,
+                              self._previous_handler or signal.SIG_DFL)
+
+        if exc_type is TimeOutError:
+            if exc_val.timeout not in (None, self):
+                return False  # deadline of outer context is expired
+        elif exc_type is not None:
             return False  # never swallow other exceptions
-        else:
-            LOG.info("Timeout {timeout}s exceeded for {call}".format(
-                call=self.action,
-                timeout=self.timeout
-            ))
-            msg = ("Time limit exceeded while waiting for {call} to "
-                   "finish.").format(call=self.action)
-            raise AssertionError(msg)
+        elif self.elapsed <= self.timeout:
+            return False
+
+        self.expired = True
+        LOG.info("Timeout {timeout}s exceeded for {call}".format(
+            call=self.action,
+            timeout=self.timeout
+        ))
+        msg = ("Time limit exceeded while waiting for {call} to "
+               "finish.").format(call=self.action)
+        raise AssertionError(msg)
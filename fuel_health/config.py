@@ -228,7 +228,15 @@ ImageGroup = [
     cfg.StrOpt('http_image',
                default='http://download.cirros-cloud.net/0.3.1/'
                        'cirros-0.3.1-x86_64-uec.tar.gz',
-               help='http accessable image')
+               help='http accessable image'),
+    cfg.IntOpt('test_image_size',
+               default=1024,
+               help='Size (in bytes) of image data uploaded by Glance tests.'),
+    cfg.StrOpt('test_image_payload',
+               default='random',
+               help='Data of images uploaded by Glance tests: "random" to '
+                    'read it from os.urandom or "pattern" to repeat '
+                    'a random block.')
 ]
 
 
@@ -457,6 +465,54 @@ def register_ironic_opts(conf):
         conf.register_opt(opt, group='ironic')
 
 
+class NodesIndex(object):
+    """Index of cluster nodes by role and online state.
+
+    It is built with a single pass over the nodes returned by Nailgun.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        # (role, online) -> nodes; online is None for all the nodes
+        self._by_role = {}
+        self._by_hostname = {}
+        self._public_ips = {}
+        for node in self.nodes:
+            online = node.get('online') is True
+            for role in node.get('roles', []):
+                self._by_role.setdefault((role, None), []).append(node)
+                self._by_role.setdefault((role, online), []).append(node)
+            if node.get('hostname'):
+                self._by_hostname[node['hostname']] = node
+            for network in node.get('network_data', []):
+                if network.get('name') == 'public' and network.get('ip'):
+                    self._public_ips[node['id']] = \
+                        network['ip'].split('/')[0]
+                    break
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def by_role(self, role, online=None):
+        """Returns nodes with the role. If online is True (False) only
+        online (offline) nodes are returned.
+        """
+        return list(self._by_role.get((role, online), []))
+
+    def by_hostname(self, hostname):
+        return self._by_hostname.get(hostname)
+
+    def is_online(self, hostname):
+        node = self.by_hostname(hostname)
+        return node is not None and node.get('online') is True
+
+    def public_ip(self, node):
+        return self._public_ips.get(node['id'])
+
+
 def process_singleton(cls):
     """Wrapper for classes... To be instantiated only one time per process."""
     instances = {}
@@ -532,6 +588,8 @@ class FileConfig(object):
         self.sahara = cfg.CONF.sahara
         self.fuel = cfg.CONF.fuel
         self.ironic = cfg.CONF.ironic
+        # Cluster nodes are known only from Nailgun
+        self.nodes = NodesIndex([])
 
 
 class ConfigGroup(object):
@@ -584,6 +642,7 @@ class NailgunConfig(object):
                                                    self.nailgun_port)
         token = os.environ.get('NAILGUN_TOKEN')
         self.cluster_id = os.environ.get('CLUSTER_ID', None)
+        self.nodes = NodesIndex([])
         self.req_session = requests.Session()
         self.req_session.trust_env = False
         self.req_session.verify = False
@@ -684,37 +743,21 @@ class NailgunConfig(object):
         # to make backward compatible
         if 'objects' in data:
             data = data['objects']
-        controller_nodes = filter(lambda node: 'controller' in node['roles'],
-                                  data)
-        online_controllers = filter(
-            lambda node: 'controller' in node['roles'] and
-                         node['online'] is True, data)
-
-        cinder_nodes = []
-        cinder_roles = ['cinder', 'cinder-block-device']
-        for cinder_role in cinder_roles:
-            cinder_nodes.extend(
-                filter(lambda node: cinder_role in node['roles'], data))
-
-        cinder_vmware_nodes = filter(lambda node: 'cinder-vmware' in
-                                     node['roles'], data)
+        self.nodes = NodesIndex(data)
+
         controller_ips = []
         controller_names = []
         public_ips = []
-        online_controllers_ips = []
-        online_controller_names = []
-        for node in controller_nodes:
-            public_network = next(network for network in node['network_data']
-                                  if network['name'] == 'public')
-            ip = public_network['ip'].split('/')[0]
-            public_ips.append(ip)
+        for node in self.nodes.by_role('controller'):
+            public_ips.append(self.nodes.public_ip(node))
             controller_ips.append(node['ip'])
             controller_names.append(node['fqdn'])
         LOG.info("IP %s NAMES %s" % (controller_ips, controller_names))
 
-        for node in online_controllers:
-            online_controllers_ips.append(node['ip'])
-            online_controller_names.append(node['fqdn'])
+        online_controllers = self.nodes.by_role('controller', online=True)
+        online_controllers_ips = [node['ip'] for node in online_controllers]
+        online_controller_names = [node['fqdn']
+                                   for node in online_controllers]
         LOG.info("Online controllers ips is %s" % online_controllers_ips)
 
         self.compute.nodes = data
@@ -723,24 +766,17 @@ class NailgunConfig(object):
         self.compute.controller_names = controller_names
         self.compute.online_controllers = online_controllers_ips
         self.compute.online_controller_names = online_controller_names
-        if not cinder_nodes:
+        if not (self.nodes.by_role('cinder') or
+                self.nodes.by_role('cinder-block-device')):
             self.volume.cinder_node_exist = False
-        if not cinder_vmware_nodes:
+        if not self.nodes.by_role('cinder-vmware'):
             self.volume.cinder_vmware_node_exist = False
 
-        compute_nodes = filter(lambda node: 'compute' in node['roles'],
-                               data)
-        online_computes = filter(
-            lambda node: 'compute' in node['roles'] and
-                         node['online'] is True, data)
-        online_computes_ips = []
-        for node in online_computes:
-            online_computes_ips.append(node['ip'])
+        online_computes = self.nodes.by_role('compute', online=True)
+        online_computes_ips = [node['ip'] for node in online_computes]
         LOG.info('Online compute ips is {0}'.format(online_computes_ips))
         self.compute.online_computes = online_computes_ips
-        compute_ips = []
-        for node in compute_nodes:
-            compute_ips.append(node['ip'])
+        compute_ips = [node['ip'] for node in self.nodes.by_role('compute')]
         LOG.info("COMPUTES IPS %s" % compute_ips)
 
         sriov_physnets = []
@@ -788,16 +824,10 @@ class NailgunConfig(object):
                                 break
 
         self.compute.compute_nodes = compute_ips
-        ceph_nodes = filter(lambda node: 'ceph-osd' in node['roles'],
-                            data)
-        self.compute.ceph_nodes = ceph_nodes
-
-        online_ironic = filter(
-            lambda node: 'ironic' in node['roles'] and
-                         node['online'] is True, data)
-        self.ironic.online_conductors = []
-        for node in online_ironic:
-            self.ironic.online_conductors.append(node['ip'])
+        self.compute.ceph_nodes = self.nodes.by_role('ceph-osd')
+
+        self.ironic.online_conductors = [
+            node['ip'] for node in self.nodes.by_role('ironic', online=True)]
         LOG.info('Online Ironic conductors\' ips are {0}'.format(
             self.ironic.online_conductors))
 
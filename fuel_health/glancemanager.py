@@ -18,8 +18,8 @@ try:
     from oslo.serialization import jsonutils
 except ImportError:
     from oslo_serialization import jsonutils
-import random
-import StringIO
+import os
+import time
 
 import fuel_health.common.ssh
 from fuel_health.common.utils.data_utils import rand_name
@@ -30,6 +30,72 @@ import fuel_health.test
 LOG = logging.getLogger(__name__)
 
 
+class ImagePayload(object):
+    """File-like object which generates image data of given size on the fly
+    instead of keeping it in memory.
+
+    Payload kinds:
+        random - every chunk is read from os.urandom;
+        pattern - a single random block is repeated over and over.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, size, kind='random'):
+        if kind not in ('random', 'pattern'):
+            raise ValueError('Unknown image payload: {0}'.format(kind))
+        self.size = size
+        self.kind = kind
+        self.position = 0
+        self._block = None
+        if kind == 'pattern':
+            self._block = memoryview(os.urandom(self.CHUNK_SIZE))
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.position = min(max(offset, 0), self.size)
+
+    def read(self, size=-1):
+        left = self.size - self.position
+        if size is None or size < 0 or size > left:
+            size = left
+        if self.kind == 'random':
+            data = os.urandom(size)
+        else:
+            parts = []
+            offset = self.position % self.CHUNK_SIZE
+            remains = size
+            while remains:
+                part = self._block[offset:offset + remains]
+                parts.append(part.tobytes())
+                remains -= len(part)
+                offset = 0
+            data = ''.join(parts)
+        self.position += size
+        return data
+
+
+def throughput(size, duration):
+    """Returns throughput in MB/s."""
+    return size / (1024.0 * 1024.0) / max(duration, 1e-6)
+
+
 class GlanceTest(fuel_health.nmanager.NovaNetworkScenarioTest):
     """Manager that provides access to the Glance python client for
     calling Glance API.
@@ -39,6 +105,8 @@ class GlanceTest(fuel_health.nmanager.NovaNetworkScenarioTest):
     def setUpClass(cls):
         super(GlanceTest, cls).setUpClass()
         cls.images = []
+        # Upload and download throughput (in MB/s) by image id.
+        cls.images_throughput = {}
         if cls.manager.clients_initialized:
             if not cls.glance_client_v1:
                 LOG.warning('Glance client v1 was not initialized')
@@ -55,28 +123,62 @@ class GlanceTest(fuel_health.nmanager.NovaNetworkScenarioTest):
     def _list_images(self, client):
         return client.images.list()
 
+    def get_image_payload(self):
+        return ImagePayload(self.config.image.test_image_size,
+                            self.config.image.test_image_payload)
+
     def image_create(self, client, **kwargs):
         container_format = 'bare'
-        data = StringIO.StringIO(
-            ''.join([chr(random.randint(0, 255)) for i in range(1024)]))
+        data = self.get_image_payload()
         disk_format = 'raw'
         image_name = rand_name('ostf_test-image_glance-')
+        start = time.time()
         if client is self.glance_client_v1:
             image = client.images.create(name=image_name,
                                          container_format=container_format,
                                          data=data,
                                          disk_format=disk_format, **kwargs)
             self.images.append(image.id)
-            return image
         elif client is self.glance_client:
             # TODO(vryzhenkin): Rework this function using Glance Tasks v2,
             # TODO(vryzhenkin) when Tasks will be supported by OpenStack Glance
             image = client.images.create(name=image_name,
                                          container_format=container_format,
                                          disk_format=disk_format, **kwargs)
-            client.images.upload(image.id, 'dummy_data')
             self.images.append(image.id)
-            return image
+            client.images.upload(image.id, data, image_size=data.size)
+        else:
+            return None
+        self._save_throughput(image.id, 'upload', data.size,
+                              time.time() - start)
+        return image
+
+    def download_image(self, client, image_id):
+        """Reads data of the image chunk by chunk and returns its size."""
+        start = time.time()
+        size = 0
+        for chunk in client.images.data(image_id) or []:
+            size += len(chunk)
+        self._save_throughput(image_id, 'download', size, time.time() - start)
+        return size
+
+    def check_image_data(self, client, image_id):
+        """Checks that the image exists and its data can be downloaded
+        completely.
+        """
+        image = self.find_image_by_id(client, image_id)
+        size = self.download_image(client, image_id)
+        expected_size = self.config.image.test_image_size
+        if size != expected_size:
+            self.fail('Downloaded {0} bytes of image {1} instead of '
+                      '{2}'.format(size, image_id, expected_size))
+        return image
+
+    def _save_throughput(self, image_id, action, size, duration):
+        value = throughput(size, duration)
+        self.images_throughput.setdefault(image_id, {})[action] = value
+        LOG.info('Image {0} {1}: {2} bytes in {3:.2f} s, {4:.2f} MB/s'.format(
+            image_id, action, size, duration, value))
 
     def find_image_by_id(self, client, image_id):
         return client.images.get(image_id)
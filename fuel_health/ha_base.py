@@ -13,6 +13,7 @@
 # under the License.
 
 from distutils import version
+import io
 import json
 import logging
 from lxml import etree
@@ -25,21 +26,63 @@ from fuel_health.test import BaseTestCase
 
 LOG = logging.getLogger(__name__)
 
+# Connects to all given AMQP hosts concurrently and prints connection
+# latency and error of each host as JSON. The script is formatted with
+# hosts and timeout and passed to python on stdin, so it needs no file
+# on the controller and credentials don't appear on the command line.
+AMQP_PROBE_SCRIPT = """
+import json
+import threading
+import time
+
+import kombu
+
+hosts = json.loads(%(hosts)r)
+timeout = %(timeout)r
+results = {}
+
+
+def probe(name, url):
+    start = time.time()
+    try:
+        connection = kombu.Connection(url, connect_timeout=timeout)
+        connection.connect()
+        connection.release()
+        results[name] = {'latency': time.time() - start, 'error': None}
+    except Exception as exc:
+        results[name] = {'latency': time.time() - start, 'error': str(exc)}
+
+threads = [threading.Thread(target=probe, args=item)
+           for item in hosts.items()]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(json.dumps(results))
+"""
+
 
 class RabbitSanityClass(BaseTestCase):
     """TestClass contains RabbitMQ sanity checks."""
 
+    # Hiera hashes fetched by get_hiera_data
+    HIERA_HASHES = ('rabbit', 'rabbit_hash', 'network_metadata')
+
     @classmethod
     def setUpClass(cls):
         cls.config = fuel_health.config.FuelConfig()
         cls._controllers = cls.config.compute.online_controllers
-        cls.nodes = cls.config.compute.nodes
+        cls.nodes = cls.config.nodes
         cls._usr = cls.config.compute.controller_node_ssh_user
         cls._pwd = cls.config.compute.controller_node_ssh_password
         cls._key = cls.config.compute.path_to_private_key
         cls._ssh_timeout = cls.config.compute.ssh_timeout
         cls._password = None
         cls._userid = None
+        cls._amqp_hosts_name = None
+        # Hiera values of the controller fetched once per test class,
+        # see get_hiera_data
+        cls._hiera_data = None
         cls.messages = []
         cls.queues = []
         cls.release_version = \
@@ -53,42 +96,36 @@ class RabbitSanityClass(BaseTestCase):
             return self._password
 
         if self._password is None:
-            self._password = self.get_hiera_values(
-                hiera_hash='rabbit',
-                hash_key='password'
-            )
-        # FIXME(mattmymo): Remove this after merging
-        # https://review.openstack.org/#/c/276797/
-        if not self._password:
-            self._password = self.get_hiera_values(
-                hiera_hash='rabbit_hash',
-                hash_key='password'
-            )
+            hiera_data = self.get_hiera_data()
+            # FIXME(mattmymo): Remove 'rabbit_hash' after merging
+            # https://review.openstack.org/#/c/276797/
+            type(self)._password = (
+                (hiera_data['rabbit'] or {}).get('password') or
+                (hiera_data['rabbit_hash'] or {}).get('password') or '')
 
         return self._password
 
     @property
     def amqp_hosts_name(self):
+        if self._amqp_hosts_name is not None:
+            return self._amqp_hosts_name
+
         amqp_hosts_name = {}
         if version.StrictVersion(self.release_version)\
                 < version.StrictVersion('7.0'):
             for controller_ip in self._controllers:
                 amqp_hosts_name[controller_ip] = [controller_ip, '5673']
+            type(self)._amqp_hosts_name = amqp_hosts_name
             return amqp_hosts_name
 
-        nodes = self.get_hiera_values(hiera_hash='network_metadata',
-                                      hash_key='nodes',
-                                      json_parse=True)
+        nodes = self.get_hiera_data()['network_metadata']['nodes']
         for ip, port in self.get_amqp_hosts():
             for node in nodes:
                 ips = [nodes[node]['network_roles'][role]
                        for role in nodes[node]['network_roles']]
-                if ip in ips:
-                    nailgun_nodes = [n for n in self.nodes
-                                     if nodes[node]['name'] == n['hostname']
-                                     and n['online']]
-                    if len(nailgun_nodes) == 1:
-                        amqp_hosts_name[nodes[node]['name']] = [ip, port]
+                if ip in ips and self.nodes.is_online(nodes[node]['name']):
+                    amqp_hosts_name[nodes[node]['name']] = [ip, port]
+        type(self)._amqp_hosts_name = amqp_hosts_name
         return amqp_hosts_name
 
     @property
@@ -99,17 +136,12 @@ class RabbitSanityClass(BaseTestCase):
             return self._userid
 
         if self._userid is None:
-            self._userid = self.get_hiera_values(
-                hiera_hash='rabbit',
-                hash_key='user'
-            )
-        # FIXME(mattmymo): Remove this after merging
-        # https://review.openstack.org/#/c/276797/
-        if not self._userid:
-            self._userid = self.get_hiera_values(
-                hiera_hash='rabbit_hash',
-                hash_key='user'
-            )
+            hiera_data = self.get_hiera_data()
+            # FIXME(mattmymo): Remove 'rabbit_hash' after merging
+            # https://review.openstack.org/#/c/276797/
+            type(self)._userid = (
+                (hiera_data['rabbit'] or {}).get('user') or
+                (hiera_data['rabbit_hash'] or {}).get('user') or '')
         return self._userid
 
     def get_ssh_connection_to_controller(self, controller):
@@ -200,6 +232,34 @@ class RabbitSanityClass(BaseTestCase):
             LOG.exception("Fail to get data from Hiera DB!")
             self.fail("Fail to get data from Hiera DB!")
 
+    def get_hiera_data(self, conf_path="/etc/hiera.yaml"):
+        """Get all the hiera values needed by RabbitMQ checks with
+        a single ruby call and cache them for the test class.
+        """
+        if self._hiera_data is not None:
+            return self._hiera_data
+
+        hashes = ', '.join('"{0}"'.format(key) for key in self.HIERA_HASHES)
+        cmd = ('ruby -e \'require "hiera"; require "json"; '
+               'hiera = Hiera.new(:config => "{0}"); data = {{}}; '
+               '[{1}].each {{ |key| '
+               'data[key] = hiera.lookup(key, {{}}, {{}}, nil, :hash) }}; '
+               'data["amqp_hosts"] = hiera.lookup("amqp_hosts", nil, {{}}); '
+               'puts JSON.dump(data);\'').format(conf_path, hashes)
+
+        if not self._controllers:
+            self.fail('There are no online controllers')
+        LOG.debug("Try to execute cmd {0}".format(cmd))
+        remote = self.get_ssh_connection_to_controller(self._controllers[0])
+        try:
+            res = remote.exec_command(cmd)
+            LOG.debug("result is {0}".format(res))
+            type(self)._hiera_data = json.loads(res.strip())
+        except Exception:
+            LOG.exception("Fail to get data from Hiera DB!")
+            self.fail("Fail to get data from Hiera DB!")
+        return self._hiera_data
+
     def get_conf_values(self, variable="rabbit_password",
                         sections="DEFAULT",
                         conf_path="/etc/nova/nova.conf"):
@@ -219,33 +279,48 @@ class RabbitSanityClass(BaseTestCase):
             self.fail("Fail to get data from config")
 
     def get_amqp_hosts(self):
-        if not self._controllers:
-            self.fail('There are no online controllers')
-        remote = self.get_ssh_connection_to_controller(self._controllers[0])
-        cmd = 'hiera amqp_hosts'
-        LOG.debug("Try to execute cmd '{0}' on controller...".format(cmd))
-        result = remote.exec_command(cmd)
-        LOG.debug("Result: {0}".format(result))
+        result = self.get_hiera_data()['amqp_hosts'] or ''
+        LOG.debug("AMQP hosts: {0}".format(result))
         hosts = result.strip().split(',')
         return [host.lstrip().split(':')[0:2] for host in hosts]
 
-    def check_rabbit_connections(self):
+    def probe_amqp_hosts(self, connect_timeout=10):
+        """Connect to all AMQP hosts at once from the controller.
+
+        The probe script is run with a single SSH command, it returns
+        connection latency (in seconds) and error for each host:
+            {host_name: {'latency': float, 'error': str or None}}
+        """
         if not self._controllers:
             self.fail('There are no online controllers')
+        hosts = dict(
+            (name, 'amqp://{0}:{1}@{2}:{3}//'.format(
+                self.userid, self.password, ip, port))
+            for name, (ip, port) in self.amqp_hosts_name.items())
+        script = AMQP_PROBE_SCRIPT % {'hosts': json.dumps(hosts),
+                                      'timeout': float(connect_timeout)}
         remote = self.get_ssh_connection_to_controller(self._controllers[0])
-        for key in self.amqp_hosts_name.keys():
-            ip, port = self.amqp_hosts_name[key]
-            cmd = ("python -c 'import kombu;"
-                   " c = kombu.Connection(\"amqp://{1}:{2}@{0}:{3}//\");"
-                   " c.connect()'".format(ip, self.userid,
-                                          self.password, port))
-            try:
-                LOG.debug('Checking AMQP host "{0}"...'.format(ip))
-                remote.exec_command(cmd)
-            except Exception:
-                LOG.exception("Failed to establish AMQP connection")
+        LOG.debug('Probing AMQP hosts {0}...'.format(hosts.keys()))
+        return json.loads(remote.exec_command('python -', stdin=script)
+                          .strip())
+
+    def check_rabbit_connections(self):
+        try:
+            results = self.probe_amqp_hosts()
+        except Exception:
+            LOG.exception("Failed to establish AMQP connection")
+            self.fail("Failed to establish AMQP connections "
+                      "from controller node!")
+        for name, (ip, port) in sorted(self.amqp_hosts_name.items()):
+            result = results.get(name) or {'error': 'no probe result'}
+            if result['error']:
+                LOG.error('AMQP host "{0}" is not accessible: {1}'.format(
+                    ip, result['error']))
                 self.fail("Failed to establish AMQP connection to {1}/tcp "
                           "port on {0} from controller node!".format(ip, port))
+            LOG.debug('AMQP host "{0}" connected in {1:.3f} s'.format(
+                ip, result['latency']))
+        return results
 
     def create_queue(self):
         if not self._controllers:
@@ -350,47 +425,84 @@ class RabbitSanityClass(BaseTestCase):
                 self.fail('Failed to delete queue "{0}"!'.format(test_queue))
 
 
-class TestPacemakerBase(BaseTestCase):
-    """TestPacemakerStatus class base methods."""
-
-    @classmethod
-    def setUpClass(cls):
-        super(TestPacemakerBase, cls).setUpClass()
-        cls.config = fuel_health.config.FuelConfig()
-        cls.controller_names = cls.config.compute.controller_names
-        cls.online_controller_names = (
-            cls.config.compute.online_controller_names)
-        cls.offline_controller_names = list(
-            set(cls.controller_names) - set(cls.online_controller_names))
-
-        cls.online_controller_ips = cls.config.compute.online_controllers
-        cls.controller_key = cls.config.compute.path_to_private_key
-        cls.controller_user = cls.config.compute.ssh_user
-        cls.controllers_pwd = cls.config.compute.controller_node_ssh_password
-        cls.timeout = cls.config.compute.ssh_timeout
-
-    def setUp(self):
-        super(TestPacemakerBase, self).setUp()
-        if 'ha' not in self.config.mode:
-            self.skipTest('Cluster is not HA mode, skipping tests')
-        if not self.online_controller_names:
-            self.skipTest('There are no controller nodes')
-
-    def _run_ssh_cmd(self, host, cmd):
-        """Open SSH session with host and execute command."""
-        try:
-            sshclient = ssh.Client(host, self.controller_user,
-                                   self.controllers_pwd,
-                                   key_filename=self.controller_key,
-                                   timeout=self.timeout)
-            return sshclient.exec_longrun_command(cmd)
-        except Exception:
-            LOG.exception("Failed on run ssh cmd")
-            self.fail("%s command failed." % cmd)
-
-    def _register_resource(self, res, res_name, resources):
-        if res_name not in resources:
-            resources[res_name] = {
+class PacemakerState(object):
+    """Status, nodes and constraints of pacemaker as seen by one controller.
+
+    The state is built from a single XML document which contains output
+    of 'pcs status xml' (crm_mon) and/or of 'cibadmin --query --scope
+    constraints'. The document is parsed incrementally: every <nodes>,
+    <resources> and <constraints> section is processed and dropped as soon
+    as it is read.
+    """
+
+    # Command which prints both pacemaker status and constraints
+    # as one XML document.
+    CMD = ("echo '<pacemaker>'; "
+           "pcs status xml | grep -v '^<?xml'; "
+           "cibadmin --query --scope constraints | grep -v '^<?xml'; "
+           "echo '</pacemaker>'")
+
+    def __init__(self, xml):
+        # {
+        #   str: {                        # Resource name
+        #     'started': int,             # count of Master/Started
+        #     'stopped': int,             # count of Stopped resources
+        #     'nodes':  [node_name, ...], # All node names where the
+        #                                 # resource is started
+        #     'master': [node_name, ...], # Node names for 'Master'
+        #                                 # ('master' is also in 'nodes')
+        #     'active': bool,             # Is resource active?
+        #     'managed': bool,            # Is resource managed?
+        #     'failed': bool,             # Has resource failed?
+        #   },
+        #   ...
+        # }
+        self.resources = {}
+        self.nodes = {'Online': [], 'Offline': []}
+        # {string:                # Resource name,
+        #     {'attrs': list,     # List of dicts for resource
+        #                         #     attributes on each node,
+        #      'enabled': list    # List of strings with node names where
+        #                         #     the resource allowed to start,
+        #      'with-rsc': string # Name of an another resource
+        #                         #     from which this resource depends on.
+        #     }
+        # }
+        self.constraints = {}
+        # node name -> set of names of resources started on the node
+        self.resources_by_node = {}
+        # name of resource -> names of resources which depend on it
+        self.dependants = {}
+        self._resolved = {}
+
+        self._parse(xml)
+
+    def _parse(self, xml):
+        handlers = {
+            'nodes': self._parse_nodes,
+            'resources': self._parse_resources,
+            'constraints': self._parse_constraints,
+        }
+        for _, elem in etree.iterparse(io.BytesIO(xml), events=('end',)):
+            handler = handlers.get(elem.tag)
+            if handler is not None:
+                handler(elem)
+                elem.clear()
+
+        for rsc, resource in self.resources.items():
+            for node in resource['nodes']:
+                self.resources_by_node.setdefault(node, set()).add(rsc)
+
+    def _parse_nodes(self, nodes_group):
+        for node in nodes_group:
+            if 'true' in node.get('online', ''):
+                self.nodes['Online'].append(node.get('name'))
+            else:
+                self.nodes['Offline'].append(node.get('name'))
+
+    def _register_resource(self, res, res_name):
+        if res_name not in self.resources:
+            self.resources[res_name] = {
                 'master': [],
                 'nodes': [],
                 'started': 0,
@@ -399,162 +511,107 @@ class TestPacemakerBase(BaseTestCase):
                 'managed': False,
                 'failed': False,
             }
+        resource = self.resources[res_name]
 
         if 'true' in res.get('active'):
-            resources[res_name]['active'] = True
+            resource['active'] = True
 
         if 'true' in res.get('managed'):
-            resources[res_name]['managed'] = True
+            resource['managed'] = True
 
         if 'true' in res.get('failed'):
-            resources[res_name]['failed'] = True
+            resource['failed'] = True
 
         res_role = res.get('role')
         num_nodes = int(res.get('nodes_running_on'))
 
         if num_nodes:
-            resources[res_name]['started'] += num_nodes
+            resource['started'] += num_nodes
 
             for rnode in res.iter('node'):
                 if 'Master' in res_role:
-                    resources[res_name]['master'].append(
-                        rnode.get('name'))
-                resources[res_name]['nodes'].append(
-                    rnode.get('name'))
+                    resource['master'].append(rnode.get('name'))
+                resource['nodes'].append(rnode.get('name'))
         else:
-            resources[res_name]['stopped'] += 1
-
-    def get_pcs_resources(self, pcs_status):
-        """Get pacemaker resources status to a python dict:
-            return:
-                {
-                  str: {                        # Resource name
-                    'started': int,             # count of Master/Started
-                    'stopped': int,             # count of Stopped resources
-                    'nodes':  [node_name, ...], # All node names where the
-                                                # resource is started
-                    'master': [node_name, ...], # Node names for 'Master'
-                                                # ('master' is also in 'nodes')
-                    'active': bool,             # Is resource active?
-                    'managed': bool,            # Is resource managed?
-                    'failed': bool,             # Has resource failed?
-                  },
-                  ...
-                }
-        """
-        root = etree.fromstring(pcs_status)
-        resources = {}
-
-        for res_group in root.iter('resources'):
-            for res in res_group:
-                res_name = res.get('id')
-                if 'resource' in res.tag:
-                    self._register_resource(res, res_name, resources)
-                elif 'clone' in res.tag:
-                    for r in res:
-                        self._register_resource(r, res_name, resources)
-                elif 'group' in res.tag:
-                    for r in res:
-                        res_name_ingroup = r.get('id')
-                        self._register_resource(r, res_name_ingroup, resources)
-                        self._register_resource(r, res_name, resources)
-
-        return resources
-
-    def get_pcs_nodes(self, pcs_status):
-        root = etree.fromstring(pcs_status)
-        nodes = {'Online': [], 'Offline': []}
-        for nodes_group in root.iter('nodes'):
-            for node in nodes_group:
-                if 'true' in node.get('online'):
-                    nodes['Online'].append(node.get('name'))
-                else:
-                    nodes['Offline'].append(node.get('name'))
-        return nodes
-
-    def get_pcs_constraints(self, constraints_xml):
-        """Parse pacemaker constraints
-
-        :param constraints_xml: XML string contains pacemaker constraints
-        :return dict:
-            {string:                # Resource name,
-                {'attrs': list,     # List of dicts for resource
-                                    #     attributes on each node,
-                 'enabled': list    # List of strings with node names where
-                                    #     the resource allowed to start,
-                 'with-rsc': string # Name of an another resource
-                                    #     from which this resource depends on.
-                }
-            }
-
-        """
-
-        root = etree.fromstring(constraints_xml)
-        constraints = {}
+            resource['stopped'] += 1
+
+    def _parse_resources(self, res_group):
+        for res in res_group:
+            res_name = res.get('id')
+            if 'resource' in res.tag:
+                self._register_resource(res, res_name)
+            elif 'clone' in res.tag:
+                for r in res:
+                    self._register_resource(r, res_name)
+            elif 'group' in res.tag:
+                for r in res:
+                    self._register_resource(r, r.get('id'))
+                    self._register_resource(r, res_name)
+
+    def _parse_constraints(self, con_group):
         # 1. Get all attributes from constraints for each resource
-        for con_group in root.iter('constraints'):
-            for con in con_group:
-                if 'rsc_location' in con.tag or 'rsc_colocation' in con.tag:
-                    if 'score' not in con.keys():
-                        # TODO(ddmitriev): process resource dependences
-                        # for 'rule' section
-                        continue
-
-                    rsc = con.get('rsc')
-                    if rsc not in constraints:
-                        constraints[rsc] = {'attrs': [con.attrib]}
-                    else:
-                        constraints[rsc]['attrs'].append(con.attrib)
+        for con in con_group:
+            if 'rsc_location' in con.tag or 'rsc_colocation' in con.tag:
+                if 'score' not in con.keys():
+                    # TODO(ddmitriev): process resource dependences
+                    # for 'rule' section
+                    continue
+
+                rsc = con.get('rsc')
+                self.constraints.setdefault(rsc, {'attrs': []})
+                self.constraints[rsc]['attrs'].append(dict(con.attrib))
 
         # 2. Make list of nodes for each resource where it is allowed to start.
         #    Remove from 'enabled' list all nodes with score '-INFINITY'
-        for rsc in constraints:
-            attrs = constraints[rsc]['attrs']
+        for rsc, constraint in self.constraints.items():
             enabled = []
             disabled = []
-            for attr in attrs:
+            for attr in constraint['attrs']:
                 if 'with-rsc' in attr:
-                    constraints[rsc]['with-rsc'] = attr['with-rsc']
+                    constraint['with-rsc'] = attr['with-rsc']
+                    self.dependants.setdefault(
+                        attr['with-rsc'], set()).add(rsc)
                 elif 'node' in attr:
                     if attr['score'] == '-INFINITY':
                         disabled.append(attr['node'])
                     else:
                         enabled.append(attr['node'])
-            constraints[rsc]['enabled'] = list(set(enabled) - set(disabled))
+            constraint['enabled'] = list(set(enabled) - set(disabled))
 
-        return constraints
+    def resource_nodes(self, rsc, _chain=None):
+        """Get nodes where the resource is allowed to start, where it is
+        actually started and where it is started but not allowed to.
 
-    def get_resource_nodes(self, rsc, constraints, cluster_resources,
-                           orig_rsc):
-        if rsc in orig_rsc:
+        Results are memoized, so every resource of a constraint chain
+        is resolved only once.
+        """
+        if rsc in self._resolved:
+            return self._resolved[rsc]
+
+        chain = _chain or []
+        if rsc in chain:
             # Constraints loop detected!
             msg = ('There is a dependency loop in constraints configuration: '
                    'resource "{0}" depends on the resource "{1}". Please check'
                    ' the pacemaker configuration!'
-                   .format(orig_rsc[-1], rsc))
+                   .format(chain[-1], rsc))
             raise fuel_health.exceptions.InvalidConfiguration(msg)
-        else:
-            orig_rsc.append(rsc)
+        chain.append(rsc)
 
+        constraint = self.constraints[rsc]
         # Nodes where the resource is allowed to start
-        allowed = constraints[rsc]['enabled']
-        # Nodes where the parent resource is actually started
-        if rsc in cluster_resources:
-            started = cluster_resources[rsc]['nodes']
-        else:
-            started = []
+        allowed = constraint['enabled']
+        # Nodes where the resource is actually started
+        started = self.resources.get(rsc, {}).get('nodes', [])
 
-        if 'with-rsc' in constraints[rsc]:
-            # Recursively get nodes for the parent resource
+        if 'with-rsc' in constraint:
+            # Get nodes for the parent resource
             (parent_allowed,
              parent_started,
-             parent_disallowed) = self.get_resource_nodes(
-                 constraints[rsc]['with-rsc'],
-                 constraints,
-                 cluster_resources,
-                 orig_rsc)
-            if 'score' in constraints[rsc]:
-                if constraints[rsc]['score'] == '-INFINITY':
+             parent_disallowed) = self.resource_nodes(constraint['with-rsc'],
+                                                      chain)
+            if 'score' in constraint:
+                if constraint['score'] == '-INFINITY':
                     # If resource banned to start on the same nodes where
                     # parent resource is started, then nodes where parent
                     # resource is started should be removed from 'allowed'
@@ -568,4 +625,69 @@ class TestPacemakerBase(BaseTestCase):
         # List of nodes, where resource is started, but not allowed to start
         disallowed = list(set(started) - set(allowed))
 
-        return allowed, started, disallowed
+        chain.pop()
+        self._resolved[rsc] = (allowed, started, disallowed)
+        return self._resolved[rsc]
+
+
+class TestPacemakerBase(BaseTestCase):
+    """TestPacemakerStatus class base methods."""
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestPacemakerBase, cls).setUpClass()
+        cls.config = fuel_health.config.FuelConfig()
+        cls.controller_names = cls.config.compute.controller_names
+        cls.online_controller_names = (
+            cls.config.compute.online_controller_names)
+        cls.offline_controller_names = list(
+            set(cls.controller_names) - set(cls.online_controller_names))
+
+        cls.online_controller_ips = cls.config.compute.online_controllers
+        cls.controller_key = cls.config.compute.path_to_private_key
+        cls.controller_user = cls.config.compute.ssh_user
+        cls.controllers_pwd = cls.config.compute.controller_node_ssh_password
+        cls.timeout = cls.config.compute.ssh_timeout
+
+    def setUp(self):
+        super(TestPacemakerBase, self).setUp()
+        if 'ha' not in self.config.mode:
+            self.skipTest('Cluster is not HA mode, skipping tests')
+        if not self.online_controller_names:
+            self.skipTest('There are no controller nodes')
+
+    def _run_ssh_cmd(self, host, cmd):
+        """Open SSH session with host and execute command."""
+        try:
+            sshclient = ssh.Client(host, self.controller_user,
+                                   self.controllers_pwd,
+                                   key_filename=self.controller_key,
+                                   timeout=self.timeout)
+            return sshclient.exec_longrun_command(cmd)
+        except Exception:
+            LOG.exception("Failed on run ssh cmd")
+            self.fail("%s command failed." % cmd)
+
+    def get_pacemaker_state(self, host):
+        """Get status and constraints of pacemaker on the host with a single
+        SSH command and return them as PacemakerState.
+        """
+        output = self._run_ssh_cmd(host, PacemakerState.CMD)[0]
+        return PacemakerState(output)
+
+    def get_pcs_resources(self, pcs_status):
+        """Get pacemaker resources status to a python dict.
+
+        See PacemakerState.resources for the format.
+        """
+        return PacemakerState(pcs_status).resources
+
+    def get_pcs_nodes(self, pcs_status):
+        return PacemakerState(pcs_status).nodes
+
+    def get_pcs_constraints(self, constraints_xml):
+        """Parse pacemaker constraints.
+
+        See PacemakerState.constraints for the format.
+        """
+        return PacemakerState(constraints_xml).constraints
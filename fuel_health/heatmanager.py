@@ -14,6 +14,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
 import logging
 import os
 
@@ -26,6 +27,74 @@ import fuel_health.test
 LOG = logging.getLogger(__name__)
 
 
+class StackWatcher(object):
+    """Follows events of the stack.
+
+    Each poll requests only the events which appeared after the last seen
+    one, keeps the last known status of the stack and of its resources and
+    measures how long every resource action (CREATE, UPDATE, ...) took.
+    """
+
+    TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+    def __init__(self, heat_client, stack_id, stack_name=None):
+        self.heat_client = heat_client
+        self.stack_id = stack_id
+        self.stack_name = stack_name
+        self.marker = None
+        self.stack_status = None
+        self.resources = {}
+        # (resource name, action) -> seconds
+        self.durations = {}
+        self._started = {}
+
+    @classmethod
+    def _parse_time(cls, event_time):
+        try:
+            return datetime.datetime.strptime(event_time[:19],
+                                              cls.TIME_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    def _is_stack_event(self, event):
+        return (getattr(event, 'physical_resource_id', None) ==
+                self.stack_id or
+                (self.stack_name is not None and
+                 event.resource_name == self.stack_name))
+
+    def _handle_event(self, event):
+        status = event.resource_status
+        if self._is_stack_event(event):
+            self.stack_status = status
+            return
+        self.resources[event.resource_name] = status
+
+        action, _, state = status.partition('_')
+        key = (event.resource_name, action)
+        event_time = self._parse_time(getattr(event, 'event_time', None))
+        if state == 'IN_PROGRESS':
+            self._started[key] = event_time
+        elif key in self._started:
+            started = self._started.pop(key)
+            if started is not None and event_time is not None:
+                self.durations[key] = (event_time - started).total_seconds()
+                LOG.debug('Resource "{0}" {1} took {2} s ({3}).'.format(
+                    event.resource_name, action, self.durations[key], state))
+
+    def poll(self):
+        """Fetches new events of the stack and returns them."""
+
+        kwargs = {'sort_dir': 'asc'}
+        if self.marker is not None:
+            kwargs['marker'] = self.marker
+        events = self.heat_client.events.list(self.stack_id, **kwargs)
+        for event in events:
+            self._handle_event(event)
+        if events:
+            self.marker = events[-1].id
+        return events
+
+
 class HeatBaseTest(fuel_health.nmanager.PlatformServicesBaseClass):
     """Base class for Heat sanity and platform tests."""
 
@@ -35,6 +104,8 @@ class HeatBaseTest(fuel_health.nmanager.PlatformServicesBaseClass):
 
         cls.wait_interval = cls.config.compute.build_interval
         cls.wait_timeout = cls.config.compute.build_timeout
+        # (stack id, resource name, action) -> seconds
+        cls.resource_durations = {}
 
     def setUp(self):
         super(HeatBaseTest, self).setUp()
@@ -130,37 +201,58 @@ class HeatBaseTest(fuel_health.nmanager.PlatformServicesBaseClass):
 
         It addresses `stack_status` instead of `status` field and
         checks for FAILED instead of ERROR status.
-        The rest is the same.
+        Progress is tracked by events of the stack (see StackWatcher),
+        the stack itself is requested only if there are no stack events.
         """
         if timeout is None:
             timeout = self.wait_timeout
         if interval is None:
             interval = self.wait_interval
 
+        watcher = StackWatcher(self.heat_client, stack_id)
+
+        def current_status():
+            try:
+                watcher.poll()
+            except Exception as exc:
+                LOG.debug('Failed to get events of stack {0}: {1}'.format(
+                    stack_id, exc))
+            if watcher.stack_status is not None:
+                return watcher.stack_status
+            return self.get_stack(stack_id).stack_status
+
         def check_status():
-            stack = self.get_stack(stack_id)
-            new_status = stack.stack_status
+            new_status = current_status()
             if 'FAIL' in new_status:
                 self.fail('Failed to get to expected status. '
                           'Currently in {0} status.'.format(new_status))
             elif new_status == expected_status:
                 return True
-            LOG.debug('Waiting for {0} to get to {1} status. '
-                      'Currently in {2} status.'.format(
-                      stack, expected_status, new_status))
+            LOG.debug('Waiting for stack {0} to get to {1} status. '
+                      'Currently in {2} status, resources: {3}.'.format(
+                          stack_id, expected_status, new_status,
+                          watcher.resources))
 
-        if not fuel_health.test.call_until_true(check_status,
-                                                timeout,
-                                                interval):
-            self.fail('Timeout exceeded while waiting for '
-                      'stack status becomes {0}'.format(expected_status))
+        try:
+            if not fuel_health.test.call_until_true(check_status,
+                                                    timeout,
+                                                    interval):
+                self.fail('Timeout exceeded while waiting for '
+                          'stack status becomes {0}'.format(expected_status))
+        finally:
+            for (resource, action), duration in watcher.durations.items():
+                self.resource_durations[(stack_id, resource, action)] = \
+                    duration
 
     def get_instances_by_name_mask(self, mask_name):
         """This method retuns list of instances with certain names."""
 
         instances = []
 
-        instance_list = self.compute_client.servers.list()
+        # Nova filters servers by name as a regular expression, so only
+        # the servers which are likely to match are returned.
+        instance_list = self.compute_client.servers.list(
+            search_opts={'name': '^{0}'.format(mask_name)})
         LOG.debug('Instances list is {0}'.format(instance_list))
         LOG.debug('Expected instance name should inlude {0}'.format(mask_name))
 
@@ -26,6 +26,11 @@ except ImportError:
 
 import muranoclient.common.exceptions as exceptions
 import requests
+from requests import adapters
+try:
+    from requests.packages.urllib3.util import retry
+except ImportError:
+    retry = None
 
 from fuel_health.common.utils.data_utils import rand_name
 import fuel_health.nmanager
@@ -37,11 +42,78 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
     """Manager that provides access to the Murano python client for
     calling Murano API.
     """
+    # Retries of idempotent requests to Murano API.
+    http_retries = 3
+
     @classmethod
     def setUpClass(cls):
         super(MuranoTest, cls).setUpClass()
         cls.packages = []
         cls.environments = []
+        # Murano REST API is accessed through one HTTP session per test
+        # class, so connections are reused between requests.
+        cls.http_session = cls._create_http_session()
+        # "<method> <path template>" -> request latency statistics
+        cls.endpoint_latency = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        for endpoint, stats in sorted(cls.endpoint_latency.items()):
+            LOG.debug('Murano API {0}: {1} requests, {2:.3f} s average, '
+                      '{3:.3f} s max'.format(endpoint, stats['count'],
+                                             stats['total'] / stats['count'],
+                                             stats['max']))
+        cls.http_session.close()
+        super(MuranoTest, cls).tearDownClass()
+
+    @classmethod
+    def _create_http_session(cls):
+        if retry is not None:
+            # the last 5xx response is returned to the caller, which
+            # checks its status code, instead of raising RetryError
+            max_retries = retry.Retry(total=cls.http_retries,
+                                      backoff_factor=0.5,
+                                      status_forcelist=[502, 503, 504],
+                                      raise_on_status=False)
+        else:
+            max_retries = cls.http_retries
+        session = requests.Session()
+        session.verify = False
+        session.mount('http://', adapters.HTTPAdapter(max_retries=max_retries))
+        session.mount('https://',
+                      adapters.HTTPAdapter(max_retries=max_retries))
+        return session
+
+    def murano_request(self, method, path, *args, **kwargs):
+        """This method sends request to Murano API via the session of
+        the test class.
+
+        Input parameters:
+          method - HTTP method
+          path - path template relative to Murano endpoint, it is
+                 formatted with args
+          kwargs - passed to requests
+
+        Latency of the request is accounted for the path template.
+
+        Returns response.
+        """
+
+        headers = self.headers.copy()
+        headers.update(kwargs.pop('headers', {}))
+        url = self.endpoint + path.format(*args)
+        start = time.time()
+        try:
+            return self.http_session.request(method, url, headers=headers,
+                                             **kwargs)
+        finally:
+            latency = time.time() - start
+            stats = self.endpoint_latency.setdefault(
+                '{0} {1}'.format(method, path),
+                {'count': 0, 'total': 0.0, 'max': 0.0})
+            stats['count'] += 1
+            stats['total'] += latency
+            stats['max'] = max(stats['max'], latency)
 
     def setUp(self):
         super(MuranoTest, self).setUp()
@@ -77,6 +149,7 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
 
         if self.murano_available:
             if self.environments:
+                self.invalidate_compute_capacity()
                 for environment_id in self.environments:
                     try:
                         self.delete_environment(environment_id)
@@ -131,8 +204,7 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
         Returns the list of environments.
         """
 
-        resp = requests.get(self.endpoint + 'environments',
-                            headers=self.headers, verify=False)
+        resp = self.murano_request('GET', 'environments')
         return resp.json()
 
     def create_environment(self, name):
@@ -185,18 +257,15 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
         return self.environments.remove(environment_id)
 
     def environment_delete_check(self, environment_id, timeout=120):
-        resp = requests.get('{0}environments/{1}'.format(self.endpoint,
-                                                         environment_id),
-                            headers=self.headers, verify=False)
+        resp = self.murano_request('GET', 'environments/{0}', environment_id)
         self.delete_environment(environment_id)
         point = time.time()
         while resp.status_code == 200:
             if time.time() - point > timeout:
                 self.fail("Can't delete environment more than {0} seconds".
                           format(timeout))
-            resp = requests.get('{0}environments/{1}'.format(self.endpoint,
-                                                             environment_id),
-                                headers=self.headers, verify=False)
+            resp = self.murano_request('GET', 'environments/{0}',
+                                       environment_id)
             try:
                 env = resp.json()
                 if env["status"] == "delete failure":
@@ -251,10 +320,9 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
         Returns specific session.
         """
 
-        endpoint = '{0}environments/{1}/sessions/{2}/deploy'.format(
-            self.endpoint, environment_id, session_id)
-        return requests.post(endpoint, data=None, headers=self.headers,
-                             verify=False)
+        return self.murano_request('POST',
+                                   'environments/{0}/sessions/{1}/deploy',
+                                   environment_id, session_id)
 
     def create_service(self, environment_id, session_id, json_data):
         """This method allows to create service.
@@ -266,12 +334,10 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
 
         Returns specific service.
         """
-        headers = self.headers.copy()
-        headers.update({'x-configuration-session': session_id})
-        endpoint = '{0}environments/{1}/services'.format(self.endpoint,
-                                                         environment_id)
-        return requests.post(endpoint, data=jsonutils.dumps(json_data),
-                             headers=headers, verify=False).json()
+        return self.murano_request(
+            'POST', 'environments/{0}/services', environment_id,
+            data=jsonutils.dumps(json_data),
+            headers={'x-configuration-session': session_id}).json()
 
     def list_services(self, environment_id, session_id=None):
         """This method allows to get list of services.
@@ -324,18 +390,20 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
         Returns environment.
         """
 
-        environment = self.get_environment(environment.id)
-        while environment.status != 'ready':
+        status = self.murano_request('GET', 'environments/{0}',
+                                     environment.id).json()['status']
+        while status != 'ready':
             time.sleep(5)
-            environment = self.get_environment(environment.id)
-            if environment.status == 'deploy failure':
+            status = self.murano_request('GET', 'environments/{0}',
+                                         environment.id).json()['status']
+            if status == 'deploy failure':
                 LOG.error(
                     'Environment has incorrect status'
-                    ' %s' % environment.status)
+                    ' %s' % status)
                 self.fail(
                     'Environment has incorrect status'
-                    ' %s .' % environment.status)
-        return environment
+                    ' %s .' % status)
+        return self.get_environment(environment.id)
 
     def deployments_status_check(self, environment_id):
         """This method allows to check that deployment status is 'success'.
@@ -346,16 +414,14 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
         Returns 'OK'.
         """
 
-        endpoint = '{0}environments/{1}/deployments'.format(self.endpoint,
-                                                            environment_id)
-        deployments = requests.get(endpoint,
-                                   headers=self.headers,
-                                   verify=False).json()['deployments']
+        deployments = self.murano_request(
+            'GET', 'environments/{0}/deployments',
+            environment_id).json()['deployments']
         for deployment in deployments:
             # Save the information about all deployments
             LOG.debug("Environment state: {0}".format(deployment['state']))
-            r = requests.get('{0}/{1}'.format(endpoint, deployment['id']),
-                             headers=self.headers, verify=False).json()
+            r = self.murano_request('GET', 'environments/{0}/deployments/{1}',
+                                    environment_id, deployment['id']).json()
             LOG.debug("Reports: {0}".format(r))
 
             self.assertEqual('success', deployment['state'])
@@ -462,8 +528,7 @@ class MuranoTest(fuel_health.nmanager.PlatformServicesBaseClass):
             self.murano_client.packages.delete(package_id)
 
     def get_list_categories(self):
-        resp = requests.get(self.endpoint + 'catalog/packages/categories',
-                            headers=self.headers, verify=False)
+        resp = self.murano_request('GET', 'catalog/packages/categories')
 
         self.assertEqual(200, resp.status_code)
         self.assertIsInstance(resp.json()['categories'], list)
@@ -16,6 +16,7 @@
 import logging
 
 import fuel_health.nmanager
+import fuel_health.test
 
 LOG = logging.getLogger(__name__)
 
@@ -127,15 +128,46 @@ class NeutronBaseTest(fuel_health.nmanager.NovaNetworkScenarioTest):
                     cls.error_msg.append(exc)
                     LOG.exception(exc)
 
+    @classmethod
+    def _wait_for_neutron_deletion(cls, list_method, resource_key, ids,
+                                   duration=20, sleep_for=2):
+        """Block until neutron resources with given ids are gone.
+
+        All pending resources of one type are checked with a single
+        list call filtered by id on each polling round.
+        """
+        pending = set(ids)
+
+        def is_deletion_complete():
+            try:
+                existing = list_method(id=list(pending))[resource_key]
+            except Exception as exc:
+                cls.error_msg.append(exc)
+                LOG.exception(exc)
+                return False
+            pending.intersection_update(item['id'] for item in existing)
+            return not pending
+
+        if not pending:
+            return True
+        return fuel_health.test.call_until_true(is_deletion_complete,
+                                                duration, sleep_for)
+
     @classmethod
     def _clear_networks(cls):
+        servers = []
         try:
-            [cls.compute_client.servers.delete(srv)
-             for srv in cls.compute_client.servers.list()
-             if 'ost1_' in srv.name]
+            servers = [srv for srv in cls.compute_client.servers.list()
+                       if 'ost1_' in srv.name]
+            for srv in servers:
+                cls.compute_client.servers.delete(srv)
         except Exception as exc:
             cls.error_msg.append(exc)
             LOG.exception(exc)
+        # Subnets can not be removed while instance ports still use them,
+        # so wait for all the servers at once before touching the network.
+        cls._wait_for_batch_deletion(servers)
+
         for router in cls.routers:
             try:
                 cls.neutron_client.remove_gateway_router(
@@ -156,12 +188,16 @@ class NeutronBaseTest(fuel_health.nmanager.NovaNetworkScenarioTest):
                 cls.error_msg.append(exc)
                 LOG.exception(exc)
 
+        deleted_networks = []
         for network in cls.networks:
             try:
                 cls.neutron_client.delete_network(network['id'])
+                deleted_networks.append(network['id'])
             except Exception as exc:
                 cls.error_msg.append(exc)
                 LOG.exception(exc)
+        cls._wait_for_neutron_deletion(cls.neutron_client.list_networks,
+                                       'networks', deleted_networks)
 
         try:
             sec_groups = cls.compute_client.security_groups.list()
@@ -174,12 +210,16 @@ class NeutronBaseTest(fuel_health.nmanager.NovaNetworkScenarioTest):
 
     @classmethod
     def _cleanup_ports(cls):
+        deleted_ports = []
         for port in cls.ports:
             try:
                 cls.neutron_client.delete_port(port['port']['id'])
+                deleted_ports.append(port['port']['id'])
             except Exception as exc:
                 cls.error_msg.append(exc)
                 LOG.exception(exc)
+        cls._wait_for_neutron_deletion(cls.neutron_client.list_ports,
+                                       'ports', deleted_ports)
 
     @classmethod
     def tearDownClass(cls):
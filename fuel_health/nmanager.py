@@ -540,43 +540,127 @@ class OfficialClientTest(fuel_health.test.TestCase):
                     cls.error_msg.append(exc)
                     LOG.exception(exc)
 
+    @classmethod
+    def _is_thing_deleted(cls, thing):
+        try:
+            thing.get()
+        except Exception as exc:
+            # Clients are expected to return an exception
+            # called 'NotFound' if retrieval fails.
+            if exc.__class__.__name__ == 'NotFound':
+                return True
+            cls.error_msg.append(exc)
+            LOG.exception(exc)
+        return False
+
+    @classmethod
+    def _wait_for_batch_deletion(cls, things, duration=20, sleep_for=2):
+        """Block until all given resources are deleted or time is out.
+
+        Pending resources are grouped by their client manager, so every
+        polling round costs one list() call per resource type instead of
+        one get() call per resource. Managers which can not be listed
+        fall back to the per-resource get().
+
+        :param things: resources whose delete() has already been issued.
+        :param duration: overall time to wait for all the deletions.
+        :param sleep_for: pause between polling rounds.
+        :returns: True if every resource is gone, False otherwise.
+        """
+        pending = {}
+        for thing in things:
+            # Deletion testing is only required for objects whose
+            # existence cannot be checked via retrieval.
+            if isinstance(thing, dict) or not hasattr(thing, 'manager'):
+                continue
+            pending.setdefault(thing.manager, {})[thing.id] = thing
+
+        def is_deletion_complete():
+            for manager, group in list(pending.items()):
+                try:
+                    existing_ids = set(item.id for item in manager.list())
+                except Exception as exc:
+                    LOG.debug("Unable to list resources of {0}, checking "
+                              "them one by one: {1}".format(manager, exc))
+                    deleted_ids = [thing_id for thing_id, thing
+                                   in group.items()
+                                   if cls._is_thing_deleted(thing)]
+                else:
+                    deleted_ids = [thing_id for thing_id in group
+                                   if thing_id not in existing_ids]
+
+                for thing_id in deleted_ids:
+                    del group[thing_id]
+                if not group:
+                    del pending[manager]
+
+            if pending:
+                LOG.debug("Waiting for deletion of %s",
+                          [thing for group in pending.values()
+                           for thing in group.values()])
+            return not pending
+
+        return fuel_health.test.call_until_true(is_deletion_complete,
+                                                duration, sleep_for)
+
+    # Shared resources are deleted tier by tier: resources of a tier may
+    # still be used by resources of the previous tiers (e.g. a volume by
+    # its snapshots, a network by servers), so a tier is deleted only
+    # after deletion of the previous one has completed.
+    deletion_tiers = (
+        ('Server',),
+        ('Snapshot',),
+        ('Volume',),
+        ('Port', 'Network'),
+    )
+    # seconds to wait for deletion of every resource of a tier
+    deletion_timeout = 20
+
+    @classmethod
+    def _deletion_tier(cls, thing):
+        if isinstance(thing, dict):
+            kind = 'Port' if 'port' in thing else None
+        else:
+            kind = thing.__class__.__name__
+        for tier, kinds in enumerate(cls.deletion_tiers):
+            if kind in kinds:
+                return tier
+        # keypairs, identity objects etc. go last
+        return len(cls.deletion_tiers)
+
     @classmethod
     def tearDownClass(cls):
         cls.error_msg = []
+        tiers = {}
         while cls.os_resources:
+            # resources of a tier are deleted in reverse creation order
             thing = cls.os_resources.pop()
-            LOG.debug("Deleting %r from shared resources of %s" %
-                      (thing, cls.__name__))
+            tiers.setdefault(cls._deletion_tier(thing), []).append(thing)
 
-            try:
-                # OpenStack resources are assumed to have a delete()
-                # method which destroys the resource...
-                thing.delete()
-            except Exception as exc:
-                # If the resource is already missing, mission accomplished.
-                if exc.__class__.__name__ == 'NotFound':
-                    continue
-                cls.error_msg.append(exc)
-                LOG.exception(exc)
+        for tier in sorted(tiers):
+            deleted = []
+            for thing in tiers[tier]:
+                LOG.debug("Deleting %r from shared resources of %s" %
+                          (thing, cls.__name__))
 
-            def is_deletion_complete():
-                # Deletion testing is only required for objects whose
-                # existence cannot be checked via retrieval.
-                if isinstance(thing, dict):
-                    return True
                 try:
-                    thing.get()
+                    # OpenStack resources are assumed to have a delete()
+                    # method which destroys the resource...
+                    thing.delete()
                 except Exception as exc:
-                    # Clients are expected to return an exception
-                    # called 'NotFound' if retrieval fails.
+                    # If the resource is already missing, mission
+                    # accomplished.
                     if exc.__class__.__name__ == 'NotFound':
-                        return True
+                        continue
                     cls.error_msg.append(exc)
                     LOG.exception(exc)
-                return False
 
-            # Block until resource deletion has completed or timed-out
-            fuel_health.test.call_until_true(is_deletion_complete, 20, 10)
+                deleted.append(thing)
+
+            # Block until deletion of the tier has completed or timed-out
+            if deleted:
+                cls._wait_for_batch_deletion(
+                    deleted, duration=cls.deletion_timeout * len(deleted))
 
 
 class NovaNetworkScenarioTest(OfficialClientTest):
@@ -968,17 +1052,104 @@ class NovaNetworkScenarioTest(OfficialClientTest):
             cls._clear_networks()
 
 
+class ComputeCapacity(object):
+    """Snapshot of free resources of all compute nodes."""
+
+    def __init__(self, hypervisors):
+        self.hosts = []
+        self.best_host = None
+        for hypervisor in hypervisors:
+            host = {
+                'name': hypervisor.hypervisor_hostname,
+                'free_ram_mb': hypervisor.free_ram_mb,
+                'free_disk_gb': hypervisor.free_disk_gb,
+                'free_vcpus': hypervisor.vcpus - hypervisor.vcpus_used
+            }
+            self.hosts.append(host)
+            if (self.best_host is None or
+                    host['free_ram_mb'] > self.best_host['free_ram_mb']):
+                self.best_host = host
+
+    @property
+    def max_free_ram_mb(self):
+        if self.best_host is None:
+            return 0
+        return self.best_host['free_ram_mb']
+
+    def vms_count(self, min_ram, min_hdd, min_vcpus):
+        """Returns how many VMs with given parameters fit into
+        the compute nodes.
+        """
+        vms_count = 0
+        for host in self.hosts:
+            if (host['free_ram_mb'] >= min_ram and
+                    host['free_disk_gb'] >= min_hdd and
+                    host['free_vcpus'] >= min_vcpus):
+                vms_count += min(int(host['free_ram_mb'] / min_ram),
+                                 int(host['free_disk_gb'] / min_hdd),
+                                 int(host['free_vcpus'] / min_vcpus))
+        return vms_count
+
+
 class PlatformServicesBaseClass(NovaNetworkScenarioTest):
 
+    # Capacity of compute nodes shared by all platform tests of the test run.
+    # It is taken on the first request and dropped whenever a server is
+    # created or deleted through the manager and after each test which
+    # created (and so could have left) resources in the cloud.
+    _compute_capacity = None
+
+    @classmethod
+    def get_compute_capacity(cls):
+        if PlatformServicesBaseClass._compute_capacity is None:
+            PlatformServicesBaseClass._compute_capacity = ComputeCapacity(
+                cls.compute_client.hypervisors.list())
+            LOG.debug('Compute capacity: {0}'.format(
+                PlatformServicesBaseClass._compute_capacity.hosts))
+        return PlatformServicesBaseClass._compute_capacity
+
+    @staticmethod
+    def invalidate_compute_capacity():
+        PlatformServicesBaseClass._compute_capacity = None
+
+    def doCleanups(self):
+        resources_created = bool(self._cleanups)
+        result = super(PlatformServicesBaseClass, self).doCleanups()
+        if resources_created:
+            self.invalidate_compute_capacity()
+        return result
+
+    def set_resource(self, key, thing):
+        super(PlatformServicesBaseClass, self).set_resource(key, thing)
+        if thing.__class__.__name__ == 'Server':
+            self.invalidate_compute_capacity()
+
+    def _delete_server(self, server):
+        try:
+            return super(PlatformServicesBaseClass, self)._delete_server(
+                server)
+        finally:
+            self.invalidate_compute_capacity()
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            super(PlatformServicesBaseClass, cls).tearDownClass()
+        finally:
+            # shared resources, servers among them, are deleted
+            cls.invalidate_compute_capacity()
+
     def get_max_free_compute_node_ram(self, min_required_ram_mb):
-        max_free_ram_mb = 0
-        for hypervisor in self.compute_client.hypervisors.list():
-            if hypervisor.free_ram_mb >= min_required_ram_mb:
-                return hypervisor.free_ram_mb
-            else:
-                if hypervisor.free_ram_mb > max_free_ram_mb:
-                    max_free_ram_mb = hypervisor.free_ram_mb
+        """Returns free RAM of the compute node which has the most of it.
 
+        Snapshot of capacity is taken again if it doesn't have enough
+        RAM for min_required_ram_mb, so a test is never skipped because
+        of a stale snapshot.
+        """
+        max_free_ram_mb = self.get_compute_capacity().max_free_ram_mb
+        if max_free_ram_mb < min_required_ram_mb:
+            self.invalidate_compute_capacity()
+            max_free_ram_mb = self.get_compute_capacity().max_free_ram_mb
         return max_free_ram_mb
 
     # Methods for creating network resources.
@@ -1099,21 +1270,12 @@ class PlatformServicesBaseClass(NovaNetworkScenarioTest):
         on all compute nodes for cases when we will create more than 1 VM.
 
         This function returns the count of VMs with required parameters which
-        we can successfully run on existing cloud.
+        we can successfully run on existing cloud. Snapshot of capacity is
+        taken again, because earlier tests could have used its resources.
         """
-        vms_count = 0
-        for hypervisor in self.compute_client.hypervisors.list():
-            if hypervisor.free_ram_mb >= min_ram:
-                if hypervisor.free_disk_gb >= min_hdd:
-                    if hypervisor.vcpus - hypervisor.vcpus_used >= min_vcpus:
-                        # We need to determine how many VMs we can run
-                        # on this hypervisor
-                        free_cpu = hypervisor.vcpus - hypervisor.vcpus_used
-                        k1 = int(hypervisor.free_ram_mb / min_ram)
-                        k2 = int(hypervisor.free_disk_gb / min_hdd)
-                        k3 = int(free_cpu / min_vcpus)
-                        vms_count += min(k1, k2, k3)
-        return vms_count
+        self.invalidate_compute_capacity()
+        return self.get_compute_capacity().vms_count(min_ram, min_hdd,
+                                                     min_vcpus)
 
     # Methods for finding and checking Sahara images.
     def find_and_check_image(self, tag_plugin, tag_version):
@@ -157,44 +157,84 @@ class SaharaTestsManager(nmanager.PlatformServicesBaseClass):
         """This method checks deployment of Hadoop services on cluster.
 
         It checks whether all Hadoop processes are running on cluster nodes
-        or not.
+        or not. Ports of all processes on all nodes are checked together.
         """
 
         LOG.debug('Checking deployment of Hadoop services on cluster...')
         node_ips_and_processes = self._get_node_ips_and_processes(cluster_id)
+        ports_to_check = {}
         for node_ip, processes in node_ips_and_processes.items():
-            LOG.debug('Checking Hadoop processes '
-                      'on node {0}...'.format(node_ip))
             for process in processes:
-                if process in processes_map:
-                    LOG.debug('Checking process "{0}"...'.format(process))
-                    for port in processes_map[process]:
-                        self._check_port(node_ip, port)
-                        LOG.debug('Process "{0}" is running and listening '
-                                  'to port {1}.'.format(process, port))
-            LOG.debug('All Hadoop processes are '
-                      'running on node {0}.'.format(node_ip))
+                for port in processes_map.get(process, []):
+                    ports_to_check[(node_ip, port)] = process
+
+        self._check_ports(ports_to_check)
+        for (node_ip, port), process in sorted(ports_to_check.items()):
+            LOG.debug('Process "{0}" is running on node {1} and listening '
+                      'to port {2}.'.format(process, node_ip, port))
         LOG.debug(
             'All Hadoop services have been successfully deployed on cluster.')
 
-    def _check_port(self, node_ip, port):
-        """This method checks accessibility of specific port on cluster node.
+    def _check_ports(self, ports):
+        """This method checks accessibility of ports on cluster nodes.
 
-        It tries to establish connection to the process on specific port every
-        second for some timeout.
+        It probes all the (node IP, port) pairs at once every <request_timeout>
+        seconds for some timeout. Only pairs which were unreachable on
+        the previous attempt are probed again.
         """
 
+        pending = set(ports)
         start = time.time()
-        while time.time() - start < self.process_timeout:
-            cmd = ("timeout {0} bash -c 'telnet {1} {2}'".format(
-                self.request_timeout, node_ip, port))
-            output, output_err = self._run_ssh_cmd(cmd)
-            if 'Connected to {0}'.format(node_ip) in output:
-                return
-            time.sleep(self.request_timeout)
+        while pending and time.time() - start < self.process_timeout:
+            reachability = self._probe_ports(pending)
+            pending = set(pair for pair in pending
+                          if not reachability.get(pair))
+            if pending:
+                LOG.debug('{0} port(s) are still unreachable: {1}'.format(
+                    len(pending), self._format_ports(pending)))
+                time.sleep(self.request_timeout)
+
+        if pending:
+            self.fail('Ports {0} are unreachable for {1} seconds.'.format(
+                self._format_ports(pending), self.process_timeout))
+
+    def _check_port(self, node_ip, port):
+        """This method checks accessibility of specific port on cluster node.
+        """
+
+        self._check_ports([(node_ip, port)])
+
+    def _probe_ports(self, ports):
+        """This method probes given (node IP, port) pairs once.
+
+        A single script is sent to the controller which tries to connect
+        to all the ports in parallel. Returns a dictionary which maps
+        each (node IP, port) pair to its reachability.
+        """
 
-        self.fail('Port {0} on node {1} is unreachable for '
-                  '{2} seconds.'.format(port, node_ip, self.process_timeout))
+        probes = []
+        for node_ip, port in ports:
+            probes.append(
+                "(timeout {0} telnet {1} {2} </dev/null 2>/dev/null | "
+                "grep -qF 'Connected to {1}' && echo '{1} {2} open' || "
+                "echo '{1} {2} closed') &".format(
+                    self.request_timeout, node_ip, port))
+        output, output_err = self._run_ssh_cmd(' '.join(probes) + ' wait')
+
+        pairs = dict(((node_ip, str(port)), (node_ip, port))
+                     for node_ip, port in ports)
+        reachability = dict((pair, False) for pair in ports)
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) == 3 and tuple(parts[:2]) in pairs:
+                reachability[pairs[tuple(parts[:2])]] = parts[2] == 'open'
+
+        return reachability
+
+    @staticmethod
+    def _format_ports(ports):
+        return ', '.join('{0}:{1}'.format(node_ip, port)
+                         for node_ip, port in sorted(ports))
 
     def _get_node_ips_and_processes(self, cluster_id):
         """This method makes dictionary with information of cluster nodes.
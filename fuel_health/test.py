@@ -52,6 +52,10 @@ def call_until_true(func, duration, sleep_for, *args):
         successful call of the function.
     :param sleep_for: The number of seconds to sleep after an unsuccessful
                       invocation of the function.
+
+    Deadline of the enclosing test_mixins.timeout context (if any) is
+    honored: sleep never oversteps it and TimeOutError is raised as soon
+    as it is expired.
     """
     now = time.time()
     timeout = now + duration
@@ -61,8 +65,13 @@ def call_until_true(func, duration, sleep_for, *args):
                 return True
         elif func():
             return True
-        LOG.debug("Sleeping for %d seconds", sleep_for)
-        time.sleep(sleep_for)
+        sleep_time = sleep_for
+        remaining = test_mixins.remaining_time()
+        if remaining is not None:
+            sleep_time = min(sleep_for, remaining)
+        LOG.debug("Sleeping for %s seconds", sleep_time)
+        time.sleep(sleep_time)
+        test_mixins.check_timeout()
         now = time.time()
     return False
 
@@ -27,7 +27,7 @@ class BaseMysqlTest(test.BaseTestCase):
     @classmethod
     def setUpClass(cls):
         super(BaseMysqlTest, cls).setUpClass()
-        cls.nodes = cls.config.compute.nodes
+        cls.nodes = cls.config.nodes
         cls.controllers = cls.config.compute.online_controllers
         if cls.controllers:
             cls.controller_ip = cls.controllers[0]
@@ -67,12 +67,8 @@ class BaseMysqlTest(test.BaseTestCase):
         database_nodes = ssh_client.exec_command(hiera_cmd)
         # get online nodes
         database_nodes = database_nodes.splitlines()
-        databases = []
-        for node in cls.config.compute.nodes:
-            hostname = node['hostname']
-            if hostname in database_nodes and node['online']:
-                databases.append(hostname)
-        return databases
+        return [hostname for hostname in database_nodes
+                if cls.nodes.is_online(hostname)]
 
 
 class TestMysqlStatus(BaseMysqlTest):
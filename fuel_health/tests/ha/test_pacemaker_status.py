@@ -38,23 +38,25 @@ class TestPacemakerStatus(ha_base.TestPacemakerBase):
         Duration: 10 s.
         Available since release: 2015.1.0-7.0
         """
-        # 1. Get pacemaker status
+        # 1. Get pacemaker status and constraints
+        states = {}
         cluster_resources = {}
         nodes = {}
-        cmd = 'pcs status xml'
         for i, ip in enumerate(self.online_controller_ips):
             fqdn = self.online_controller_names[i]
             err_msg = ('Cannot get pacemaker status. Execution of the "{0}" '
-                       'failed on the controller {0}.'.format(cmd, fqdn))
+                       'failed on the controller {1}.'
+                       .format(ha_base.PacemakerState.CMD, fqdn))
 
-            pcs_status = self.verify(20, self._run_ssh_cmd, 1, err_msg,
-                                     'get pacemaker status', ip, cmd)[0]
+            states[fqdn] = self.verify(20, self.get_pacemaker_state, 1,
+                                       err_msg, 'get pacemaker status', ip)
             self.verify_response_true(
-                pcs_status, 'Step 1 failed: Cannot get pacemaker status. Check'
+                states[fqdn].resources or states[fqdn].nodes['Online'],
+                'Step 1 failed: Cannot get pacemaker status. Check'
                 ' the pacemaker service on the controller {0}.'.format(fqdn))
 
-            cluster_resources[fqdn] = self.get_pcs_resources(pcs_status)
-            nodes[fqdn] = self.get_pcs_nodes(pcs_status)
+            cluster_resources[fqdn] = states[fqdn].resources
+            nodes[fqdn] = states[fqdn].nodes
             LOG.debug("Pacemaker resources status on the controller {0}: {1}."
                       .format(fqdn, cluster_resources[fqdn]))
             LOG.debug("Pacemaker nodes status on the controller {0}: {1}."
@@ -131,19 +133,10 @@ class TestPacemakerStatus(ha_base.TestPacemakerBase):
         # 7. Check that each resource started only on nodes that
         # allowed to start this resource, and not started on other nodes.
 
-        # Get pacemaker constraints
-        cmd = 'cibadmin --query --scope constraints'
-        err_msg = ('Cannot get pacemaker constraints. Execution of the "{0}" '
-                   'failed on the controller {0}.'
-                   .format(cmd, self.online_controller_names[0]))
-        constraints_xml = self.verify(
-            20, self._run_ssh_cmd, 7, err_msg, 'get pacemaker constraints',
-            self.online_controller_ips[0], cmd)[0]
-        constraints = self.get_pcs_constraints(constraints_xml)
-
-        for rsc in constraints:
-            (allowed, started, disallowed) = self.get_resource_nodes(
-                rsc, constraints, cluster_resources[fqdns[0]], orig_rsc=[])
+        # Pacemaker constraints were already fetched on the step 1
+        state = states[fqdns[0]]
+        for rsc in state.constraints:
+            (allowed, started, disallowed) = state.resource_nodes(rsc)
             # In 'started' list should be only the nodes where the resource
             # is 'allowed' to start
             self.verify_response_true(
@@ -34,7 +34,7 @@ class GlanceSmokeTests(glancemanager.GlanceTest):
         Scenario:
             1.Create image
             2.Checking image status
-            3.Check that image was created successfully
+            3.Check that image data can be downloaded completely
             4.Update image with properties
             5.Check that properties was updated successfully
             6.Delete image
@@ -54,10 +54,12 @@ class GlanceSmokeTests(glancemanager.GlanceTest):
         self.verify(200, self.check_image_status, 2, fail_msg,
                     'Checking image status', self.glance_client_v1, self.image)
 
-        fail_msg = ("Image doesn't appear at list. Please refer to "
-                    "Openstack logs for more information.")
-        self.verify(100, self.find_image_by_id, 3, fail_msg, 'Finding image',
-                    self.glance_client_v1, self.image.id)
+        fail_msg = ("Image is not found or its data can't be downloaded "
+                    "completely. Please refer to Openstack logs for more "
+                    "information.")
+        self.verify(100, self.check_image_data, 3, fail_msg,
+                    'Checking image data', self.glance_client_v1,
+                    self.image.id)
 
         group_props = rand_name("ostf_test")
         prop = rand_name("ostf-prop")
@@ -87,7 +89,7 @@ class GlanceSmokeTests(glancemanager.GlanceTest):
         Scenario:
             1.Send request to create image
             2.Checking image status
-            3.Check that image was created successfully
+            3.Check that image data can be downloaded completely
             4.Update image with properties
             5.Check that properties was updated successfully
             6.Delete image
@@ -105,10 +107,11 @@ class GlanceSmokeTests(glancemanager.GlanceTest):
         self.verify(100, self.check_image_status, 2, fail_msg,
                     'Checking image status', self.glance_client, self.image)
 
-        fail_msg = ("Image doesn't appear at list. Please refer to "
-                    "Openstack logs for more information.")
-        self.verify(100, self.find_image_by_id, 3, fail_msg, 'Finding image',
-                    self.glance_client, self.image.id)
+        fail_msg = ("Image is not found or its data can't be downloaded "
+                    "completely. Please refer to Openstack logs for more "
+                    "information.")
+        self.verify(100, self.check_image_data, 3, fail_msg,
+                    'Checking image data', self.glance_client, self.image.id)
 
         group_props = rand_name("ostf_test")
         prop = rand_name("ostf-prop")
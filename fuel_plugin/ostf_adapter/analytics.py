@@ -0,0 +1,202 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Detection of test runs whose tests or steps are slower than usual.
+
+Durations of finished tests and of their verified steps are stored per
+cluster in a rolling window (see models.DurationStats) as soon as test
+results arrive, so analysis of a test run never rescans the history
+of test runs.
+"""
+
+import logging
+import math
+import re
+
+from fuel_plugin import consts
+from fuel_plugin.ostf_adapter.storage import models
+
+
+LOG = logging.getLogger(__name__)
+
+# number of the most recent samples kept per test (or step)
+WINDOW_SIZE = 50
+# minimal number of samples for percentile to be trusted
+MIN_SAMPLES = 5
+PERCENTILE = 95
+
+WHOLE_TEST = ''
+
+_DURATION_PATTERN = re.compile(
+    r'(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>min|m|sec|s)?', re.IGNORECASE)
+
+
+def parse_duration(duration):
+    """Converts duration from test docstring (e.g. '180 s.', '5sec',
+    '2 min') into seconds. Returns None if duration can't be parsed.
+    """
+    if not duration:
+        return None
+    matcher = _DURATION_PATTERN.search(duration)
+    if not matcher:
+        return None
+    value = float(matcher.group('value'))
+    unit = (matcher.group('unit') or 's').lower()
+    if unit in ('m', 'min'):
+        value *= 60
+    return value
+
+
+def percentile(values, pct=PERCENTILE):
+    """Nearest-rank percentile of given values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+def _steps_durations(steps):
+    durations = {}
+    for step in steps or []:
+        if step.get('outcome') != 'success' or step.get('duration') is None:
+            continue
+        key = str(step.get('step'))
+        durations[key] = durations.get(key, 0) + step['duration']
+    return durations
+
+
+def record_result(session, test_run_id, cluster_id, test_name, status,
+                  time_taken, steps=None):
+    """Adds durations of successfully finished test and of its
+    successful steps to the rolling windows of the cluster.
+    """
+    durations = _steps_durations(steps)
+    if status == consts.TEST_STATUSES.success and time_taken is not None:
+        durations[WHOLE_TEST] = time_taken
+    if not durations:
+        return
+
+    existing = session.query(models.DurationStats)\
+        .filter_by(cluster_id=cluster_id, test_name=test_name)\
+        .filter(models.DurationStats.step.in_(durations.keys()))
+    stats = dict((item.step, item) for item in existing)
+
+    for step, duration in durations.items():
+        item = stats.get(step)
+        if item is None:
+            item = models.DurationStats(cluster_id=cluster_id,
+                                        test_name=test_name,
+                                        step=step,
+                                        samples=[])
+            session.add(item)
+        # a restarted test run replaces its sample; (re)assign the list
+        # so the change of JSON field is tracked
+        samples = [sample for sample in item.samples
+                   if sample[0] != test_run_id]
+        item.samples = (samples + [[test_run_id, duration]])[-WINDOW_SIZE:]
+
+
+def _baseline(stats_item, test_run_id):
+    """Samples collected before given test run."""
+    if stats_item is None:
+        return []
+    return [duration for run_id, duration in stats_item.samples
+            if run_id < test_run_id]
+
+
+def _compare(duration, baseline):
+    result = {
+        'samples': len(baseline),
+        'p95': None,
+        'exceeds_p95': False
+    }
+    if len(baseline) >= MIN_SAMPLES:
+        result['p95'] = percentile(baseline)
+        result['exceeds_p95'] = duration is not None and \
+            duration > result['p95']
+    return result
+
+
+def analyze_test_run(session, test_run):
+    """Compares durations of tests and steps of the test run with their
+    historical 95th percentile on the same cluster and with the expected
+    duration declared in test docstring.
+    """
+    tests = [test for test in test_run.tests
+             if test.status not in (consts.TEST_STATUSES.disabled,
+                                    consts.TEST_STATUSES.wait_running)]
+
+    stats = {}
+    if tests:
+        query = session.query(models.DurationStats)\
+            .filter_by(cluster_id=test_run.cluster_id)\
+            .filter(models.DurationStats.test_name.in_(
+                [test.name for test in tests]))
+        for item in query:
+            stats[(item.test_name, item.step)] = item
+
+    regressions = 0
+    tests_data = []
+    for test in tests:
+        expected = parse_duration(test.duration)
+        test_data = {
+            'id': test.name,
+            'status': test.status,
+            'taken': test.time_taken,
+            'duration': expected,
+            'exceeds_duration': bool(
+                expected is not None and test.time_taken is not None and
+                test.time_taken > expected),
+            'steps': []
+        }
+        test_data.update(_compare(
+            test.time_taken,
+            _baseline(stats.get((test.name, WHOLE_TEST)), test_run.id)))
+
+        # steps verified more than once are compared by their total
+        # duration, the same way as they are kept in the history
+        totals = _steps_durations(test.steps)
+        compared = {}
+        for step in test.steps or []:
+            key = str(step.get('step'))
+            if key not in compared:
+                compared[key] = _compare(
+                    totals.get(key),
+                    _baseline(stats.get((test.name, key)), test_run.id))
+                if compared[key]['exceeds_p95']:
+                    regressions += 1
+            step_data = {
+                'step': step.get('step'),
+                'action': step.get('action'),
+                'taken': step.get('duration'),
+                'total': totals.get(key),
+                'timeout': step.get('timeout'),
+                'outcome': step.get('outcome'),
+                'exceeds_timeout': step.get('outcome') == 'timeout'
+            }
+            step_data.update(compared[key])
+            test_data['steps'].append(step_data)
+
+        if test_data['exceeds_p95'] or test_data['exceeds_duration']:
+            regressions += 1
+        tests_data.append(test_data)
+
+    return {
+        'id': test_run.id,
+        'testset': test_run.test_set_id,
+        'cluster_id': test_run.cluster_id,
+        'regressions': regressions,
+        'tests': tests_data
+    }
@@ -0,0 +1,170 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Archiving of old test runs.
+
+Finished test runs older than adapter.archive_after_days are moved
+from test_runs (and results of tests in test_results) to
+archived_test_runs, which keeps them in one JSON list per test run.
+Archiving is done by the background job of the server and by the
+ostf-archive command.
+"""
+
+import collections
+import datetime
+import logging
+import sys
+import threading
+
+try:
+    from oslo.config import cfg
+except ImportError:
+    from oslo_config import cfg
+
+from fuel_plugin import consts
+from fuel_plugin.ostf_adapter import config as ostf_config
+from fuel_plugin.ostf_adapter import logger
+from fuel_plugin.ostf_adapter.storage import engine
+from fuel_plugin.ostf_adapter.storage import models
+
+
+LOG = logging.getLogger(__name__)
+
+# number of test runs moved in one transaction
+BATCH_SIZE = 200
+
+
+def _archive_batch(session, test_runs):
+    test_run_ids = [test_run.id for test_run in test_runs]
+
+    results = collections.defaultdict(list)
+    tests = session.query(models.TestResult.test_run_id,
+                          models.Test.name,
+                          models.TestResult.status,
+                          models.TestResult.time_taken,
+                          models.TestResult.message,
+                          models.TestResult.step)\
+        .join(models.Test, models.Test.id == models.TestResult.test_id)\
+        .filter(models.TestResult.test_run_id.in_(test_run_ids))\
+        .order_by(models.TestResult.test_run_id, models.Test.name)
+    for test_run_id, name, status, time_taken, message, step in tests:
+        results[test_run_id].append({
+            'name': name,
+            'status': status,
+            'taken': time_taken,
+            'message': message,
+            'step': step
+        })
+
+    session.add_all([
+        models.ArchivedTestRun(
+            id=test_run.id,
+            cluster_id=test_run.cluster_id,
+            test_set_id=test_run.test_set_id,
+            meta=test_run.meta,
+            started_at=test_run.started_at,
+            ended_at=test_run.ended_at,
+            results=results[test_run.id])
+        for test_run in test_runs])
+
+    # results of tests are deleted by the database (ON DELETE CASCADE)
+    session.query(models.TestRun)\
+        .filter(models.TestRun.id.in_(test_run_ids))\
+        .delete(synchronize_session=False)
+
+
+def archive_test_runs(session, archive_after_days, batch_size=BATCH_SIZE):
+    """Moves finished test runs older than given number of days to
+    the archive. Returns number of archived test runs.
+    """
+    if archive_after_days <= 0:
+        return 0
+    ended_before = datetime.datetime.utcnow() - \
+        datetime.timedelta(days=archive_after_days)
+
+    archived = 0
+    while True:
+        test_runs = session.query(
+            models.TestRun.id,
+            models.TestRun.cluster_id,
+            models.TestRun.test_set_id,
+            models.TestRun.meta,
+            models.TestRun.started_at,
+            models.TestRun.ended_at)\
+            .filter(models.TestRun.status ==
+                    consts.TESTRUN_STATUSES.finished)\
+            .filter(models.TestRun.ended_at < ended_before)\
+            .order_by(models.TestRun.id)\
+            .limit(batch_size)\
+            .all()
+        if not test_runs:
+            break
+
+        _archive_batch(session, test_runs)
+        session.commit()
+        archived += len(test_runs)
+
+        if len(test_runs) < batch_size:
+            break
+
+    if archived:
+        LOG.info('Archived %s test runs finished before %s.',
+                 archived, ended_before)
+    return archived
+
+
+class ArchiveJob(threading.Thread):
+    """Archives old test runs periodically in the server process."""
+
+    def __init__(self, dbpath, archive_after_days, interval):
+        super(ArchiveJob, self).__init__(name='ostf-archive')
+        self.daemon = True
+        self.dbpath = dbpath
+        self.archive_after_days = archive_after_days
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                with engine.contexted_session(self.dbpath) as session:
+                    archive_test_runs(session, self.archive_after_days)
+            except Exception:
+                LOG.exception('Archiving of test runs failed.')
+            self._stopped.wait(self.interval)
+
+
+def start_job():
+    """Starts archive job if archiving is enabled."""
+    if cfg.CONF.adapter.archive_after_days <= 0:
+        return None
+    job = ArchiveJob(cfg.CONF.adapter.dbpath,
+                     cfg.CONF.adapter.archive_after_days,
+                     cfg.CONF.adapter.archive_interval)
+    job.start()
+    return job
+
+
+def main():
+    """Entry point of ostf-archive command."""
+    ostf_config.init_config(sys.argv[1:])
+    logger.setup()
+
+    with engine.contexted_session(cfg.CONF.adapter.dbpath) as session:
+        archived = archive_test_runs(session,
+                                     cfg.CONF.adapter.archive_after_days)
+    LOG.info('Archived %s test runs in total.', archived)
@@ -0,0 +1,141 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-memory caches of API responses of the adapter.
+
+Testing patterns of a cluster are changed only by discovery check of
+the adapter itself, so responses built from them are cached in the
+server process and dropped as soon as the pattern of the cluster is
+rebuilt. Finished test runs don't change until they are restarted via
+the API of the same process, so they are cached by id.
+
+Revisions of cached payloads are used as ETags of responses; they are
+prefixed by a token of the server process, so ETags issued before
+restart of the server never match.
+"""
+
+import collections
+import threading
+import uuid
+
+# maximum number of finished test runs kept in cache
+TEST_RUNS_CACHE_SIZE = 1000
+
+PROCESS_TOKEN = uuid.uuid4().hex[:8]
+
+
+class ClusterCache(object):
+    """Responses built from testing patterns of clusters.
+
+    Every cluster has a revision which is bumped when its testing
+    pattern changes; cached entries of older revisions are stale.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._revisions = {}
+        self._entries = {}
+
+    def revision(self, cluster_id):
+        with self._lock:
+            return (self._generation,
+                    self._revisions.get(str(cluster_id), 0))
+
+    def etag(self, name, cluster_id):
+        return '{0}-{1}-{2}-{3}-{4}'.format(
+            name, PROCESS_TOKEN, cluster_id, *self.revision(cluster_id))
+
+    def get(self, name, cluster_id):
+        key = (name, str(cluster_id))
+        with self._lock:
+            entry = self._entries.get(key)
+            revision = (self._generation,
+                        self._revisions.get(str(cluster_id), 0))
+        if entry is None or entry[0] != revision:
+            return None
+        return entry[1]
+
+    def set(self, name, cluster_id, value):
+        with self._lock:
+            revision = (self._generation,
+                        self._revisions.get(str(cluster_id), 0))
+            self._entries[(name, str(cluster_id))] = (revision, value)
+
+    def invalidate(self, cluster_id=None):
+        """Drops cached responses of the cluster, or of all clusters
+        if cluster_id is not given.
+        """
+        with self._lock:
+            if cluster_id is None:
+                self._generation += 1
+                self._revisions.clear()
+                self._entries.clear()
+                return
+            cluster_id = str(cluster_id)
+            self._revisions[cluster_id] = \
+                self._revisions.get(cluster_id, 0) + 1
+            for key in [key for key in self._entries
+                        if key[1] == cluster_id]:
+                del self._entries[key]
+
+
+class TestRunCache(object):
+    """Serialized finished test runs by id, least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, size=TEST_RUNS_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._generation = 0
+        # number of changes (restarts) of test runs
+        self._revisions = {}
+        self._entries = collections.OrderedDict()
+
+    def etag(self, test_run_id):
+        """Stays the same while finished test run isn't changed."""
+        with self._lock:
+            return 'testrun-{0}-{1}-{2}-{3}'.format(
+                PROCESS_TOKEN, self._generation, test_run_id,
+                self._revisions.get(test_run_id, 0))
+
+    def get(self, test_run_id):
+        with self._lock:
+            value = self._entries.pop(test_run_id, None)
+            if value is not None:
+                self._entries[test_run_id] = value
+            return value
+
+    def set(self, test_run_id, value):
+        with self._lock:
+            self._entries.pop(test_run_id, None)
+            self._entries[test_run_id] = value
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, test_run_id=None):
+        with self._lock:
+            if test_run_id is None:
+                self._generation += 1
+                self._revisions.clear()
+                self._entries.clear()
+            else:
+                self._revisions[test_run_id] = \
+                    self._revisions.get(test_run_id, 0) + 1
+                self._entries.pop(test_run_id, None)
+
+
+CLUSTERS = ClusterCache()
+TEST_RUNS = TestRunCache()
@@ -53,6 +53,41 @@ adapter_opts = [
     cfg.BoolOpt('auth_enable',
                 default=False,
                 help="Set True to enable auth."),
+    cfg.StrOpt('results_log_dir',
+               default='/var/log/ostf',
+               help="Directory of logs of test results."),
+    cfg.StrOpt('results_log_format',
+               default='text',
+               choices=['text', 'json'],
+               help="Format of logs of test results: 'text' lines or "
+                    "newline-delimited JSON records."),
+    cfg.IntOpt('results_log_max_bytes',
+               default=10 * 1024 * 1024,
+               help="Size of JSON log of test results after which "
+                    "the log is rotated."),
+    cfg.IntOpt('results_log_backup_count',
+               default=5,
+               help="Number of rotated JSON logs of test results kept."),
+    cfg.BoolOpt('results_log_compress',
+                default=False,
+                help="Set True to gzip rotated JSON logs of test results."),
+    cfg.IntOpt('archive_after_days',
+               default=30,
+               help="Finished test runs older than this number of days "
+                    "are moved to the archive. 0 disables archiving."),
+    cfg.IntOpt('archive_interval',
+               default=3600,
+               help="Interval in seconds between runs of the archive "
+                    "job of the server."),
+    cfg.BoolOpt('sql_profiling',
+                default=False,
+                help="Set True to profile DB statements of every API "
+                     "request. Profiling of a single request can be "
+                     "enabled by the X-OSTF-Profile-SQL header."),
+    cfg.IntOpt('sql_profiling_repeat_threshold',
+               default=5,
+               help="Statement executed more times than this during "
+                    "a request is reported as a possible N+1 query."),
 ]
 
 cli_opts = [
@@ -12,32 +12,66 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+import glob
+import gzip
+import json
 import logging
 import logging.handlers
 import os
+import re
+import shutil
+
+try:
+    from oslo.config import cfg
+except ImportError:
+    from oslo_config import cfg
 
 
 _LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# size of JSON records buffered before they are written to the file
+RESULTS_BUFFER_SIZE = 64 * 1024
+
+_RESULTS_FILE = re.compile(
+    r'^cluster_(?P<cluster_id>[^_]+)_(?P<testset>.+)\.ndjson'
+    r'(?:\.(?P<backup>\d+))?(?:\.gz)?$')
+
 
 class ResultsLogger(object):
     """Logger used to log results of OSTF tests. Resutls are stored in
-    /var/log/ostf/ dir. Each cluster has one log file per each set of tests.
+    results_log_dir (/var/log/ostf/ by default). Each cluster has one log
+    file per each set of tests.
+
+    With 'json' results_log_format results are written as one JSON
+    record per test (see ResultsWriter and read_results).
     """
 
-    def __init__(self, testset, cluster_id):
+    def __init__(self, testset, cluster_id, test_run_id=None,
+                 log_dir=None, log_format=None):
         self.testset = testset
         self.cluster_id = cluster_id
+        self.test_run_id = test_run_id
+        self.log_dir = log_dir or cfg.CONF.adapter.results_log_dir
+        self.log_format = log_format or cfg.CONF.adapter.results_log_format
         self.filename = self._make_filename()
-        self._logger = self._init_file_logger()
+        if self.log_format == 'json':
+            self._writer = ResultsWriter(
+                os.path.join(self.log_dir, self.filename),
+                max_bytes=cfg.CONF.adapter.results_log_max_bytes,
+                backup_count=cfg.CONF.adapter.results_log_backup_count,
+                compress=cfg.CONF.adapter.results_log_compress)
+            self._logger = None
+        else:
+            self._writer = None
+            self._logger = self._init_file_logger()
 
     def _init_file_logger(self):
         logger = logging.getLogger('ostf-results-log-{0}-{1}'.format(
             self.cluster_id, self.testset))
 
         if not logger.handlers:
-            log_dir = '/var/log/ostf'
-            log_file = os.path.join(log_dir, self.filename)
+            log_file = os.path.join(self.log_dir, self.filename)
 
             file_handler = logging.handlers.WatchedFileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)
@@ -54,16 +88,145 @@ class ResultsLogger(object):
         return logger
 
     def _make_filename(self):
-        return 'cluster_{cluster_id}_{testset}.log'.format(
-            testset=self.testset, cluster_id=self.cluster_id)
+        extension = 'ndjson' if self.log_format == 'json' else 'log'
+        return 'cluster_{cluster_id}_{testset}.{extension}'.format(
+            testset=self.testset, cluster_id=self.cluster_id,
+            extension=extension)
+
+    def log_results(self, test_id, test_name, status, message, traceback,
+                    time_taken=None, step=None):
+        if self._writer is not None:
+            self._writer.write({
+                'time': datetime.datetime.utcnow().strftime(
+                    _LOG_TIME_FORMAT),
+                'cluster_id': self.cluster_id,
+                'testset': self.testset,
+                'test_run_id': self.test_run_id,
+                'test_id': test_id,
+                'test_name': test_name,
+                'status': status,
+                'time_taken': time_taken,
+                'step': step,
+                'message': message,
+                'traceback': traceback,
+            })
+            return
 
-    def log_results(self, test_id, test_name, status, message, traceback):
         status = status.upper()
         msg = "{status} {test_name} ({test_id}) {message} {traceback}".format(
             test_name=test_name, test_id=test_id, status=status,
             message=message, traceback=traceback)
         self._logger.info(msg)
 
+    def close(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+
+class ResultsWriter(object):
+    """Buffered writer of newline-delimited JSON records with size based
+    rotation. Rotated files get .1, .2, ... suffixes (and are gzipped
+    if compress is set), as with RotatingFileHandler.
+
+    There is one writer per file at a time, as only one test run of
+    a test set is running on a cluster, so the size of the file is
+    tracked by the writer instead of checking it on every write.
+    """
+
+    def __init__(self, path, max_bytes=0, backup_count=0, compress=False,
+                 buffer_size=RESULTS_BUFFER_SIZE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._size = None
+
+    def write(self, record):
+        line = json.dumps(record, default=str) + '\n'
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        data = ''.join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+
+        if self._size is None:
+            self._size = os.path.getsize(self.path) \
+                if os.path.exists(self.path) else 0
+        if self.max_bytes and self._size and \
+                self._size + len(data) > self.max_bytes:
+            self.rotate()
+
+        with open(self.path, 'a') as log_file:
+            log_file.write(data)
+        self._size += len(data)
+
+    def _backup_name(self, index):
+        name = '{0}.{1}'.format(self.path, index)
+        return name + '.gz' if self.compress else name
+
+    def rotate(self):
+        self._size = 0
+        if not os.path.exists(self.path):
+            return
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(self._backup_name(index)):
+                os.rename(self._backup_name(index),
+                          self._backup_name(index + 1))
+
+        if self.compress:
+            with open(self.path, 'rb') as source:
+                with gzip.open(self._backup_name(1), 'wb') as target:
+                    shutil.copyfileobj(source, target)
+            os.remove(self.path)
+        else:
+            os.rename(self.path, self._backup_name(1))
+
+
+def read_results(log_dir=None, cluster_id=None, testset=None, status=None):
+    """Yields JSON records of test results from the logs (rotated ones
+    first) matching given cluster, test set and status. Files of other
+    clusters and test sets aren't opened, files are read line by line.
+    """
+    log_dir = log_dir or cfg.CONF.adapter.results_log_dir
+
+    files = []
+    for path in glob.glob(os.path.join(log_dir, 'cluster_*.ndjson*')):
+        matcher = _RESULTS_FILE.match(os.path.basename(path))
+        if matcher is None:
+            continue
+        if cluster_id is not None and \
+                matcher.group('cluster_id') != str(cluster_id):
+            continue
+        if testset is not None and matcher.group('testset') != testset:
+            continue
+        # the oldest backups go first
+        files.append((matcher.group('cluster_id'), matcher.group('testset'),
+                      -int(matcher.group('backup') or 0), path))
+
+    for _, _, _, path in sorted(files):
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as log_file:
+            for line in log_file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if status is not None and record.get('status') != status:
+                    continue
+                yield record
+
 
 def setup(log_file=None):
     formatter = logging.Formatter(
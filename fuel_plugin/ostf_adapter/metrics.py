@@ -0,0 +1,242 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Runtime metrics of the adapter exposed in Prometheus text format.
+
+Metrics are kept in memory of the server process. Metrics which describe
+test runs (running processes, durations of test sets) are collected from
+the database when metrics are requested, because test runs are executed
+in separate processes.
+"""
+
+import abc
+import bisect
+import threading
+
+from sqlalchemy import and_
+
+from fuel_plugin import consts
+from fuel_plugin.ostf_adapter.storage import models
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0)
+QUERIES_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+TEST_SET_BUCKETS = (10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200)
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{{{0}}}'.format(','.join(
+        '{0}="{1}"'.format(
+            name, str(value).replace('\\', r'\\').replace('"', r'\"'))
+        for name, value in pairs))
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Metric(object):
+    """Base class of metrics. Subclasses define type of the metric and
+    render its samples.
+    """
+
+    __metaclass__ = abc.ABCMeta
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    @abc.abstractmethod
+    def _samples(self):
+        """Lines of samples of the metric, called under the lock."""
+
+    def render(self):
+        lines = ['# HELP {0} {1}'.format(self.name, self.documentation),
+                 '# TYPE {0} {1}'.format(self.name, self.type)]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        return ['{0}{1} {2}'.format(self.name,
+                                    _format_labels(self.labelnames, key),
+                                    _format_value(value))
+                for key, value in sorted(self._values.items())]
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets=DEFAULT_BUCKETS):
+        super(Histogram, self).__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(
+                key, ([0] * len(self.buckets), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels):
+        counts, _ = self._values.get(self._key(labels), ([], 0.0))
+        return sum(counts)
+
+    def _samples(self):
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append('{0}_bucket{1} {2}'.format(
+                    self.name,
+                    _format_labels(self.labelnames, key,
+                                   [('le', _format_value(bound))]),
+                    cumulative))
+            labels = _format_labels(self.labelnames, key)
+            lines.append('{0}_sum{1} {2}'.format(self.name, labels,
+                                                 _format_value(total)))
+            lines.append('{0}_count{1} {2}'.format(self.name, labels,
+                                                   cumulative))
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    'ostf_request_duration_seconds',
+    'Time spent to process API request by controller method.',
+    ['controller', 'status'])
+REQUEST_DB_QUERIES = Histogram(
+    'ostf_request_db_queries',
+    'Number of DB statements executed per API request.',
+    ['controller'], buckets=QUERIES_BUCKETS)
+DISCOVERY_LATENCY = Histogram(
+    'ostf_discovery_check_duration_seconds',
+    'Time spent to discover tests available for a cluster.')
+NAILGUN_REQUESTS = Counter(
+    'ostf_nailgun_requests_total',
+    'Number of requests sent to Nailgun API.',
+    ['endpoint'])
+ACTIVE_TEST_RUNS = Gauge(
+    'ostf_test_run_processes',
+    'Number of running test run processes.')
+QUEUED_TEST_RUNS = Gauge(
+    'ostf_test_runs_queued',
+    'Number of running test runs which have not started any test yet '
+    '(e.g. wait for exclusive test sets to finish).')
+TEST_SET_DURATION = Histogram(
+    'ostf_test_set_run_duration_seconds',
+    'Duration of finished test runs by test set.',
+    ['testset'], buckets=TEST_SET_BUCKETS)
+
+REGISTRY = [
+    REQUEST_LATENCY,
+    REQUEST_DB_QUERIES,
+    DISCOVERY_LATENCY,
+    NAILGUN_REQUESTS,
+    ACTIVE_TEST_RUNS,
+    QUEUED_TEST_RUNS,
+    TEST_SET_DURATION,
+]
+
+# end time of the last finished test runs accounted in TEST_SET_DURATION
+# and ids of test runs which finished at that time
+_last_finished_run = {'ended_at': None, 'ids': set()}
+
+
+def collect_test_runs(session):
+    """Updates metrics of test runs from the database."""
+    running = session.query(models.TestRun.id)\
+        .filter_by(status=consts.TESTRUN_STATUSES.running)
+
+    ACTIVE_TEST_RUNS.set(
+        running.filter(models.TestRun.pid.isnot(None)).count())
+
+    started_tests = session.query(models.TestResult.id)\
+        .filter(and_(models.TestResult.test_run_id == models.TestRun.id,
+                     models.TestResult.status.notin_(
+                         [consts.TEST_STATUSES.wait_running,
+                          consts.TEST_STATUSES.disabled])))
+    QUEUED_TEST_RUNS.set(running.filter(~started_tests.exists()).count())
+
+    finished = session.query(models.TestRun.id,
+                             models.TestRun.test_set_id,
+                             models.TestRun.started_at,
+                             models.TestRun.ended_at)\
+        .filter_by(status=consts.TESTRUN_STATUSES.finished)\
+        .filter(models.TestRun.ended_at.isnot(None))
+    # test runs may finish at the same time as the last accounted one,
+    # so that time is included and test runs are told apart by id
+    if _last_finished_run['ended_at'] is not None:
+        finished = finished.filter(
+            models.TestRun.ended_at >= _last_finished_run['ended_at'])
+    for test_run_id, test_set_id, started_at, ended_at in finished.order_by(
+            models.TestRun.ended_at, models.TestRun.id):
+        if ended_at != _last_finished_run['ended_at']:
+            _last_finished_run['ended_at'] = ended_at
+            _last_finished_run['ids'] = set()
+        elif test_run_id in _last_finished_run['ids']:
+            continue
+        _last_finished_run['ids'].add(test_run_id)
+        if started_at is not None:
+            TEST_SET_DURATION.observe(
+                (ended_at - started_at).total_seconds(), testset=test_set_id)
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
@@ -13,6 +13,7 @@
 #    under the License.
 
 import logging
+import time
 
 try:
     from oslo.config import cfg
@@ -27,6 +28,8 @@ except ImportError:
 import requests
 from sqlalchemy.orm import joinedload
 
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter import metrics
 from fuel_plugin.ostf_adapter.nose_plugin import nose_utils
 from fuel_plugin.ostf_adapter.storage import models
 
@@ -44,6 +47,8 @@ def delete_db_data(session):
     session.query(models.TestSet).delete()
 
     session.commit()
+    cache.CLUSTERS.invalidate()
+    cache.TEST_RUNS.invalidate()
 
 
 def cache_test_repository(session):
@@ -70,6 +75,14 @@ def cache_test_repository(session):
 
 
 def discovery_check(session, cluster_id, token=None):
+    started_at = time.time()
+    try:
+        _discovery_check(session, cluster_id, token=token)
+    finally:
+        metrics.DISCOVERY_LATENCY.observe(time.time() - started_at)
+
+
+def _discovery_check(session, cluster_id, token=None):
     cluster_attrs = _get_cluster_attrs(cluster_id, token=token)
 
     cluster_data = {
@@ -95,6 +108,7 @@ def discovery_check(session, cluster_id, token=None):
         session.flush()
 
         _add_cluster_testing_pattern(session, cluster_data)
+        cache.CLUSTERS.invalidate(cluster_id)
 
         return
 
@@ -105,6 +119,7 @@ def discovery_check(session, cluster_id, token=None):
             .delete()
 
         _add_cluster_testing_pattern(session, cluster_data)
+        cache.CLUSTERS.invalidate(cluster_id)
 
         cluster_state.deployment_tags = \
             list(cluster_data['deployment_tags'])
@@ -118,12 +133,17 @@ def get_version_string(token=None):
     request_url = NAILGUN_VERSION_API_URL.format(cfg.CONF.adapter.nailgun_host,
                                                  cfg.CONF.adapter.nailgun_port)
     try:
-        response = requests_session.get(request_url).json()
+        response = _nailgun_get(requests_session, request_url, 'version')
         return jsonutils.dumps(response)
     except (ValueError, IOError, requests.exceptions.HTTPError):
         return "Can't obtain version via Nailgun API"
 
 
+def _nailgun_get(requests_session, url, endpoint):
+    metrics.NAILGUN_REQUESTS.inc(endpoint=endpoint)
+    return requests_session.get(url).json()
+
+
 def _get_cluster_attrs(cluster_id, token=None):
     cluster_attrs = {}
 
@@ -142,7 +162,7 @@ def _get_cluster_attrs(cluster_id, token=None):
                              cfg.CONF.adapter.nailgun_port,
                              cluster_url)
 
-    response = REQ_SES.get(request_url).json()
+    response = _nailgun_get(REQ_SES, request_url, 'clusters')
     release_id = response.get('release_id', 'failed to get id')
 
     release_url = URL.format(
@@ -152,7 +172,7 @@ def _get_cluster_attrs(cluster_id, token=None):
     nodes_url = URL.format(
         cfg.CONF.adapter.nailgun_host, cfg.CONF.adapter.nailgun_port,
         'api/nodes?cluster_id={0}'.format(cluster_id))
-    nodes_response = REQ_SES.get(nodes_url).json()
+    nodes_response = _nailgun_get(REQ_SES, nodes_url, 'nodes')
     if 'objects' in nodes_response:
         nodes_response = nodes_response['objects']
     enable_without_ceph = filter(lambda node: 'ceph-osd' in node['roles'],
@@ -166,7 +186,7 @@ def _get_cluster_attrs(cluster_id, token=None):
         ifaces_url = URL.format(
             cfg.CONF.adapter.nailgun_host, cfg.CONF.adapter.nailgun_port,
             'api/nodes/{id}/interfaces'.format(id=compute_id))
-        ifaces_resp = REQ_SES.get(ifaces_url).json()
+        ifaces_resp = _nailgun_get(REQ_SES, ifaces_url, 'interfaces')
         for iface in ifaces_resp:
             if 'interface_properties' in iface:
                 if ('sriov' in iface['interface_properties'] and
@@ -202,7 +222,7 @@ def _get_cluster_attrs(cluster_id, token=None):
     if fuel_version:
         deployment_tags.add(fuel_version)
 
-    release_data = REQ_SES.get(release_url).json()
+    release_data = _nailgun_get(REQ_SES, release_url, 'releases')
 
     if 'version' in release_data:
         cluster_attrs['release_version'] = release_data['version']
@@ -219,7 +239,7 @@ def _get_cluster_attrs(cluster_id, token=None):
 
     # info about murano/sahara clients installation
     request_url += '/' + 'attributes'
-    response = REQ_SES.get(request_url).json()
+    response = _nailgun_get(REQ_SES, request_url, 'attributes')
 
     public_assignment = response['editable'].get('public_network_assignment')
     if not public_assignment or \
@@ -58,7 +58,8 @@ class NoseDriver(object):
         else:
             argv_add = [test_set.test_path] + test_set.additional_arguments
 
-        results_log = logger.ResultsLogger(test_set.id, test_run.cluster_id)
+        results_log = logger.ResultsLogger(test_set.id, test_run.cluster_id,
+                                           test_run_id=test_run.id)
 
         lock_path = cfg.CONF.adapter.lock_dir
         test_run.pid = nose_utils.run_proc(self._run_tests,
@@ -121,6 +122,8 @@ class NoseDriver(object):
                 models.TestRun.update_test_run(
                     session, test_run_id, updated_data)
 
+                results_log.close()
+
                 for fd in aquired_locks:
                     fcntl.flock(fd, fcntl.LOCK_UN)
                     fd.close()
@@ -23,6 +23,7 @@ except ImportError:
     from oslo_config import cfg
 
 from fuel_plugin import consts
+from fuel_plugin.ostf_adapter import analytics
 from fuel_plugin.ostf_adapter.nose_plugin import nose_utils
 from fuel_plugin.ostf_adapter.storage import models
 
@@ -67,12 +68,16 @@ class StoragePlugin(plugins.Plugin):
     def _add_test_results(self, test, data):
         test_id = test.id()
 
-        models.Test.add_result(
+        models.TestResult.add_result(
             self.session,
             self.test_run_id,
             test_id,
             data
         )
+        if data['status'] in (consts.TEST_STATUSES.success,
+                              consts.TEST_STATUSES.failure):
+            self._record_durations(test_id, data)
+
         if data['status'] != consts.TEST_STATUSES.running:
             test_name = nose_utils.get_description(test)["title"]
             self.results_log.log_results(
@@ -81,8 +86,27 @@ class StoragePlugin(plugins.Plugin):
                 status=data['status'],
                 message=data['message'],
                 traceback=data['traceback'],
+                time_taken=data.get('time_taken'),
+                step=data.get('step'),
             )
 
+    def _record_durations(self, test_id, data):
+        # statistics are written in a savepoint, so their failure rolls
+        # back only the savepoint and the result of the test is kept
+        try:
+            with self.session.begin_nested():
+                analytics.record_result(
+                    self.session,
+                    self.test_run_id,
+                    int(self.cluster_id),
+                    test_id,
+                    data['status'],
+                    data['time_taken'],
+                    data.get('steps')
+                )
+        except Exception:
+            LOG.exception('Unable to record durations of %s', test_id)
+
     def _add_message(self, test, err=None, status=None):
         data = {
             'status': status,
@@ -104,6 +128,7 @@ class StoragePlugin(plugins.Plugin):
         tests_to_update = nose_utils.get_tests_to_update(test)
 
         for test in tests_to_update:
+            data['steps'] = nose_utils.get_steps_timeline(test)
             self._add_test_results(test, data)
         self.session.commit()
 
@@ -113,6 +113,15 @@ def get_description(test_obj):
     return test_data
 
 
+def get_steps_timeline(test_obj):
+    """Returns timeline of scenario steps recorded by
+    FuelTestAssertMixin.verify while the test was running.
+    """
+    if isinstance(test_obj, case.Test):
+        return getattr(test_obj.test, 'steps_timeline', None)
+    return None
+
+
 def modify_test_name_for_nose(test_path):
     test_module, test_class, test_method = test_path.rsplit('.', 2)
     return '{0}:{1}.{2}'.format(test_module, test_class, test_method)
@@ -0,0 +1,272 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Serialization of API responses of test sets, tests and test runs.
+
+Payloads are built from selected columns instead of ORM objects and
+encoded to JSON right away, so the encoded form of payloads which don't
+change (see the cache module) is reused between requests. The format
+is the same as of 'frontend' properties of models.
+"""
+
+import collections
+import datetime
+import json
+
+from sqlalchemy import and_
+from sqlalchemy import func
+
+from fuel_plugin import consts
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter.storage import models
+
+
+CONTENT_TYPE = 'application/json'
+
+TEMPLATE_COLUMNS = (
+    ('id', models.Test.name),
+    ('testset', models.Test.test_set_id),
+    ('name', models.Test.title),
+    ('description', models.Test.description),
+    ('duration', models.Test.duration),
+)
+
+RESULT_COLUMNS = (
+    ('message', models.TestResult.message),
+    ('step', models.TestResult.step),
+    ('status', models.TestResult.status),
+    ('taken', models.TestResult.time_taken),
+    ('steps', models.TestResult.steps),
+)
+
+# results of tests are joined with tests they belong to
+TEST_COLUMNS = TEMPLATE_COLUMNS + RESULT_COLUMNS
+
+TEST_RUN_COLUMNS = (
+    ('id', models.TestRun.id),
+    ('testset', models.TestRun.test_set_id),
+    ('meta', models.TestRun.meta),
+    ('cluster_id', models.TestRun.cluster_id),
+    ('status', models.TestRun.status),
+    ('started_at', models.TestRun.started_at),
+    ('ended_at', models.TestRun.ended_at),
+)
+
+
+def _default(obj):
+    # same representation of dates as pecan's JSON encoder uses
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return str(obj)
+    raise TypeError('{0!r} is not JSON serializable'.format(obj))
+
+
+dumps = json.JSONEncoder(default=_default).encode
+
+
+def join(fragments):
+    """Encodes list of already encoded JSON values."""
+    return '[{0}]'.format(', '.join(fragments))
+
+
+def _columns(columns):
+    return [column for _, column in columns]
+
+
+def _as_dict(columns, row):
+    return dict(zip([key for key, _ in columns], row))
+
+
+def test_sets(session, cluster_id):
+    """Encoded test sets available for the cluster."""
+    result = cache.CLUSTERS.get('testsets', cluster_id)
+    if result is None:
+        needed_testsets = session\
+            .query(models.ClusterTestingPattern.test_set_id)\
+            .filter_by(cluster_id=cluster_id)
+
+        rows = session.query(models.TestSet.id, models.TestSet.description)\
+            .filter(models.TestSet.id.in_(needed_testsets))\
+            .order_by(models.TestSet.test_runs_ordering_priority)
+
+        result = dumps([{'id': test_set_id, 'name': description}
+                        for test_set_id, description in rows] or {})
+        cache.CLUSTERS.set('testsets', cluster_id, result)
+    return result
+
+
+def _template(row):
+    test = dict.fromkeys(key for key, _ in RESULT_COLUMNS)
+    test.update(_as_dict(TEMPLATE_COLUMNS, row))
+    return test
+
+
+def tests(session, cluster_id):
+    """Encoded tests enabled for the cluster, without results."""
+    result = cache.CLUSTERS.get('tests', cluster_id)
+    if result is None:
+        pattern = models.ClusterTestingPattern
+        rows = session.query(*_columns(TEMPLATE_COLUMNS))\
+            .join(pattern,
+                  and_(pattern.test_set_id == models.Test.test_set_id,
+                       pattern.cluster_id == cluster_id,
+                       pattern.tests.any(models.Test.name)))\
+            .order_by(models.Test.name)
+
+        result = dumps([_template(row) for row in rows] or {})
+        cache.CLUSTERS.set('tests', cluster_id, result)
+    return result
+
+
+def _test_runs(session, *criterion):
+    """Pairs of id and encoded test run matching given criterion
+    ordered by id.
+
+    Tests of all test runs which aren't cached are fetched with one
+    query.
+    """
+    rows = session.query(*_columns(TEST_RUN_COLUMNS))\
+        .filter(*criterion)\
+        .order_by(models.TestRun.id)\
+        .all()
+
+    fragments = {}
+    for row in rows:
+        if row.status == consts.TESTRUN_STATUSES.finished:
+            fragment = cache.TEST_RUNS.get(row.id)
+            if fragment is not None:
+                fragments[row.id] = fragment
+
+    missing = [row for row in rows if row.id not in fragments]
+    if missing:
+        tests_by_run = collections.defaultdict(list)
+        tests_rows = session.query(models.TestResult.test_run_id,
+                                   *_columns(TEST_COLUMNS))\
+            .join(models.Test, models.Test.id == models.TestResult.test_id)\
+            .filter(models.TestResult.test_run_id.in_(
+                [row.id for row in missing]))\
+            .order_by(models.TestResult.test_run_id, models.Test.name)
+        for test_row in tests_rows:
+            tests_by_run[test_row[0]].append(
+                _as_dict(TEST_COLUMNS, test_row[1:]))
+
+        for row in missing:
+            test_run = _as_dict(TEST_RUN_COLUMNS, row)
+            test_run['tests'] = tests_by_run[row.id]
+            fragments[row.id] = dumps(test_run)
+            if row.status == consts.TESTRUN_STATUSES.finished:
+                cache.TEST_RUNS.set(row.id, fragments[row.id])
+
+    return [(row.id, fragments[row.id]) for row in rows]
+
+
+def _archived_test_runs(session, *criterion):
+    """Pairs of id and encoded archived test run matching given
+    criterion ordered by id. Static data of tests is taken from
+    tests by name.
+    """
+    archived = models.ArchivedTestRun
+    ids = [test_run_id for test_run_id, in session.query(archived.id)
+           .filter(*criterion)
+           .order_by(archived.id)]
+
+    fragments = dict((test_run_id, cache.TEST_RUNS.get(test_run_id))
+                     for test_run_id in ids)
+    missing = [test_run_id for test_run_id in ids
+               if fragments[test_run_id] is None]
+    if missing:
+        rows = session.query(archived).filter(archived.id.in_(missing)).all()
+
+        names = set(result['name'] for row in rows
+                    for result in row.results or [])
+        templates = {}
+        if names:
+            templates = dict(
+                (name, (title, description, duration))
+                for name, title, description, duration in session.query(
+                    models.Test.name, models.Test.title,
+                    models.Test.description, models.Test.duration)
+                .filter(models.Test.name.in_(names)))
+
+        for row in rows:
+            tests = []
+            for result in row.results or []:
+                title, description, duration = templates.get(
+                    result['name'], (None, None, None))
+                tests.append({
+                    'id': result['name'],
+                    'testset': row.test_set_id,
+                    'name': title,
+                    'description': description,
+                    'duration': duration,
+                    'message': result['message'],
+                    'step': result['step'],
+                    'status': result['status'],
+                    'taken': result['taken'],
+                    'steps': None
+                })
+            fragments[row.id] = dumps({
+                'id': row.id,
+                'testset': row.test_set_id,
+                'meta': row.meta,
+                'cluster_id': row.cluster_id,
+                'status': consts.TESTRUN_STATUSES.finished,
+                'started_at': row.started_at,
+                'ended_at': row.ended_at,
+                'tests': tests
+            })
+            cache.TEST_RUNS.set(row.id, fragments[row.id])
+
+    return [(test_run_id, fragments[test_run_id]) for test_run_id in ids]
+
+
+def test_runs(session, *criterion):
+    """Encoded live test runs matching given criterion ordered by id."""
+    return [fragment for _, fragment in _test_runs(session, *criterion)]
+
+
+def history(session):
+    """Encoded live and archived test runs ordered by id."""
+    return [fragment for _, fragment in sorted(
+        _test_runs(session) + _archived_test_runs(session))]
+
+
+def test_run(session, test_run_id):
+    """Encoded live or archived test run, None if there is no such."""
+    for fragments in (
+            _test_runs(session, models.TestRun.id == test_run_id),
+            _archived_test_runs(
+                session, models.ArchivedTestRun.id == test_run_id)):
+        if fragments:
+            return fragments[0][1]
+    return None
+
+
+def last_test_runs(session, cluster_id):
+    """Encoded last test run of every test set of the cluster. Archived
+    test runs are taken for test sets which have no live test runs.
+    """
+    live_ids = session.query(func.max(models.TestRun.id))\
+        .filter_by(cluster_id=cluster_id)\
+        .group_by(models.TestRun.test_set_id)
+    live_test_sets = session.query(models.TestRun.test_set_id)\
+        .filter_by(cluster_id=cluster_id)
+    archived_ids = session.query(func.max(models.ArchivedTestRun.id))\
+        .filter_by(cluster_id=cluster_id)\
+        .filter(~models.ArchivedTestRun.test_set_id.in_(live_test_sets))\
+        .group_by(models.ArchivedTestRun.test_set_id)
+
+    return [fragment for _, fragment in sorted(
+        _test_runs(session, models.TestRun.id.in_(live_ids)) +
+        _archived_test_runs(
+            session, models.ArchivedTestRun.id.in_(archived_ids)))]
@@ -24,6 +24,7 @@ try:
 except ImportError:
     from oslo_config import cfg
 
+from fuel_plugin.ostf_adapter import archive
 from fuel_plugin.ostf_adapter import config as ostf_config
 from fuel_plugin.ostf_adapter import logger
 from fuel_plugin.ostf_adapter import mixins
@@ -71,6 +72,10 @@ def main():
         mixins.cache_test_repository(session)
 
     log.info('Discovery is completed')
+
+    if archive.start_job():
+        log.info('Started archiving of test runs older than %s days.',
+                 CONF.adapter.archive_after_days)
     host, port = CONF.adapter.server_host, CONF.adapter.server_port
     srv = pywsgi.WSGIServer((host, port), root)
 
@@ -0,0 +1,46 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""duration_stats
+
+Revision ID: 1d5ab3c5b4c1
+Revises: 4e9905279776
+Create Date: 2016-10-18 15:21:09.503412
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '1d5ab3c5b4c1'
+down_revision = '4e9905279776'
+
+from alembic import op
+import sqlalchemy as sa
+
+from fuel_plugin.ostf_adapter.storage import fields
+
+
+def upgrade():
+    op.create_table(
+        'duration_stats',
+        sa.Column('cluster_id', sa.Integer(), autoincrement=False,
+                  nullable=False),
+        sa.Column('test_name', sa.String(length=512), nullable=False),
+        sa.Column('step', sa.String(length=64), nullable=False),
+        sa.Column('samples', fields.JsonField(), nullable=True),
+        sa.PrimaryKeyConstraint('cluster_id', 'test_name', 'step')
+    )
+
+
+def downgrade():
+    op.drop_table('duration_stats')
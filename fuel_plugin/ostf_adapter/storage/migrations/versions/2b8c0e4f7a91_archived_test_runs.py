@@ -0,0 +1,53 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""archived_test_runs
+
+Revision ID: 2b8c0e4f7a91
+Revises: 1d5ab3c5b4c1
+Create Date: 2016-10-20 11:42:17.318205
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '2b8c0e4f7a91'
+down_revision = '1d5ab3c5b4c1'
+
+from alembic import op
+import sqlalchemy as sa
+
+from fuel_plugin.ostf_adapter.storage import fields
+
+
+def upgrade():
+    op.create_table(
+        'archived_test_runs',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('cluster_id', sa.Integer(), nullable=False),
+        sa.Column('test_set_id', sa.String(length=128), nullable=True),
+        sa.Column('meta', fields.JsonField(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('ended_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.Column('results', fields.JsonField(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_test_runs_cluster_id', 'archived_test_runs',
+                    ['cluster_id'])
+
+
+def downgrade():
+    op.drop_index('ix_archived_test_runs_cluster_id',
+                  table_name='archived_test_runs')
+    op.drop_table('archived_test_runs')
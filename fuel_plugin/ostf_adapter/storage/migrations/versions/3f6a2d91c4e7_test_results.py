@@ -0,0 +1,113 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""test_results
+
+Revision ID: 3f6a2d91c4e7
+Revises: 2b8c0e4f7a91
+Create Date: 2016-10-21 09:17:45.502318
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3f6a2d91c4e7'
+down_revision = '2b8c0e4f7a91'
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from fuel_plugin.ostf_adapter.storage import fields
+
+
+# type is already created by the initial migration
+test_states = postgresql.ENUM('wait_running', 'running', 'failure',
+                              'success', 'error', 'stopped', 'disabled',
+                              'skipped', name='test_states',
+                              create_type=False)
+
+
+def upgrade():
+    op.create_table(
+        'test_results',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('traceback', sa.Text(), nullable=True),
+        sa.Column('status', test_states, nullable=True),
+        sa.Column('step', sa.Integer(), nullable=True),
+        sa.Column('time_taken', sa.Float(), nullable=True),
+        sa.Column('steps', fields.JsonField(), nullable=True),
+        sa.Column('test_run_id', sa.Integer(), nullable=True),
+        sa.Column('test_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['test_run_id'], ['test_runs.id'],
+                                ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['test_id'], ['tests.id'],
+                                ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_test_results_test_run_id', 'test_results',
+                    ['test_run_id'])
+
+    # copies of tests made for test runs become results bound to
+    # the discovered tests of the same name
+    op.execute("""
+        INSERT INTO test_results (message, traceback, status, step,
+                                  time_taken, steps, test_run_id, test_id)
+        SELECT copy.message, copy.traceback, copy.status, copy.step,
+               copy.time_taken, copy.steps, copy.test_run_id, test.id
+        FROM tests AS copy
+        JOIN tests AS test ON test.name = copy.name
+            AND test.test_set_id = copy.test_set_id
+            AND test.test_run_id IS NULL
+        WHERE copy.test_run_id IS NOT NULL
+        ORDER BY copy.test_run_id, copy.name
+    """)
+    op.execute('DELETE FROM tests WHERE test_run_id IS NOT NULL')
+
+    for column in ('test_run_id', 'message', 'traceback', 'status',
+                   'step', 'time_taken', 'steps'):
+        op.drop_column('tests', column)
+
+
+def downgrade():
+    op.add_column('tests', sa.Column('test_run_id', sa.Integer(),
+                                     nullable=True))
+    op.create_foreign_key('tests_test_run_id_fkey', 'tests', 'test_runs',
+                          ['test_run_id'], ['id'], ondelete='CASCADE')
+    op.add_column('tests', sa.Column('message', sa.Text(), nullable=True))
+    op.add_column('tests', sa.Column('traceback', sa.Text(), nullable=True))
+    op.add_column('tests', sa.Column('status', test_states, nullable=True))
+    op.add_column('tests', sa.Column('step', sa.Integer(), nullable=True))
+    op.add_column('tests', sa.Column('time_taken', sa.Float(),
+                                     nullable=True))
+    op.add_column('tests', sa.Column('steps', fields.JsonField(),
+                                     nullable=True))
+
+    op.execute("""
+        INSERT INTO tests (name, title, description, duration, meta,
+                           deployment_tags, available_since_release,
+                           test_set_id, test_run_id, message, traceback,
+                           status, step, time_taken, steps)
+        SELECT test.name, test.title, test.description, test.duration,
+               test.meta, test.deployment_tags,
+               test.available_since_release, test.test_set_id,
+               result.test_run_id, result.message, result.traceback,
+               result.status, result.step, result.time_taken, result.steps
+        FROM test_results AS result
+        JOIN tests AS test ON test.id = result.test_id
+        ORDER BY result.id
+    """)
+
+    op.drop_index('ix_test_results_test_run_id', table_name='test_results')
+    op.drop_table('test_results')
@@ -0,0 +1,39 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""steps_timeline
+
+Revision ID: 4e9905279776
+Revises: 36e3fd684a9e
+Create Date: 2016-10-18 12:04:31.227183
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '4e9905279776'
+down_revision = '36e3fd684a9e'
+
+from alembic import op
+import sqlalchemy as sa
+
+from fuel_plugin.ostf_adapter.storage import fields
+
+
+def upgrade():
+    op.add_column('tests', sa.Column('steps', fields.JsonField(),
+                                     nullable=True))
+
+
+def downgrade():
+    op.drop_column('tests', 'steps')
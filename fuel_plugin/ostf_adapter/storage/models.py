@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import datetime
 import logging
 
@@ -20,7 +21,7 @@ from sqlalchemy import desc
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import joinedload, relationship, object_mapper
+from sqlalchemy.orm import joinedload, relationship
 
 from fuel_plugin import consts
 from fuel_plugin.ostf_adapter import nose_plugin
@@ -113,6 +114,9 @@ class TestSet(BASE):
 
 
 class Test(BASE):
+    """Test discovered in test repository. Results of the test in test
+    runs are kept in TestResult.
+    """
 
     __tablename__ = 'tests'
 
@@ -121,31 +125,71 @@ class Test(BASE):
     title = sa.Column(sa.String(512))
     description = sa.Column(sa.Text())
     duration = sa.Column(sa.String(512))
+    meta = sa.Column(fields.JsonField())
+    deployment_tags = sa.Column(ARRAY(sa.String(64)))
+    available_since_release = sa.Column(sa.String(64), default="")
+
+    test_set_id = sa.Column(
+        sa.String(length=128),
+        sa.ForeignKey(
+            'test_sets.id',
+            ondelete='CASCADE'
+        )
+    )
+
+    def new_result(self, test_run, predefined_tests):
+        """Creates result of the test for newly created
+        test_run.
+        """
+        if predefined_tests and self.name not in predefined_tests:
+            status = consts.TEST_STATUSES.disabled
+        else:
+            status = consts.TEST_STATUSES.wait_running
+        return TestResult(test_run_id=test_run.id, test=self, status=status)
+
+
+class TestResult(BASE):
+    """State of a test in a test run. Static data of the test (name,
+    title, description etc.) is taken from the test itself.
+    """
+
+    __tablename__ = 'test_results'
+
+    id = sa.Column(sa.Integer(), primary_key=True)
     message = sa.Column(sa.Text())
     traceback = sa.Column(sa.Text())
     status = sa.Column(sa.Enum(consts.TEST_STATUSES, name='test_states'))
     step = sa.Column(sa.Integer())
     time_taken = sa.Column(sa.Float())
-    meta = sa.Column(fields.JsonField())
-    deployment_tags = sa.Column(ARRAY(sa.String(64)))
-    available_since_release = sa.Column(sa.String(64), default="")
+    # timeline of scenario steps verified during the test
+    steps = sa.Column(fields.JsonField())
 
     test_run_id = sa.Column(
         sa.Integer(),
         sa.ForeignKey(
             'test_runs.id',
             ondelete='CASCADE'
-        )
+        ),
+        index=True
     )
 
-    test_set_id = sa.Column(
-        sa.String(length=128),
+    test_id = sa.Column(
+        sa.Integer(),
         sa.ForeignKey(
-            'test_sets.id',
+            'tests.id',
             ondelete='CASCADE'
-        )
+        ),
+        nullable=False
     )
 
+    test = relationship('Test', lazy='joined', innerjoin=True)
+
+    name = association_proxy('test', 'name')
+    title = association_proxy('test', 'title')
+    description = association_proxy('test', 'description')
+    duration = association_proxy('test', 'duration')
+    test_set_id = association_proxy('test', 'test_set_id')
+
     @property
     def frontend(self):
         return {
@@ -157,13 +201,19 @@ class Test(BASE):
             'message': self.message,
             'step': self.step,
             'status': self.status,
-            'taken': self.time_taken
+            'taken': self.time_taken,
+            'steps': self.steps
         }
 
+    @classmethod
+    def _named(cls, session, tests_names):
+        return cls.test_id.in_(
+            session.query(Test.id).filter(Test.name.in_(tests_names)))
+
     @classmethod
     def add_result(cls, session, test_run_id, test_name, data):
         session.query(cls).\
-            filter(cls.name == test_name,
+            filter(cls._named(session, [test_name]),
                    cls.test_run_id == test_run_id).\
             update(data, synchronize_session='fetch')
 
@@ -182,27 +232,27 @@ class Test(BASE):
                               tests_names,
                               status=consts.TEST_STATUSES.wait_running):
         session.query(cls). \
-            filter(cls.name.in_(tests_names),
+            filter(cls._named(session, tests_names),
                    cls.test_run_id == test_run_id). \
-            update({'status': status, 'time_taken': None},
+            update({'status': status, 'time_taken': None, 'steps': None},
                    synchronize_session='fetch')
 
-    def copy_test(self, test_run, predefined_tests):
-        """Performs copying of tests for newly created
-        test_run.
-        """
-        new_test = self.__class__()
-        mapper = object_mapper(self)
-        primary_keys = set([col.key for col in mapper.primary_key])
-        for column in mapper.iterate_properties:
-            if column.key not in primary_keys:
-                setattr(new_test, column.key, getattr(self, column.key))
-        new_test.test_run_id = test_run.id
-        if predefined_tests and new_test.name not in predefined_tests:
-            new_test.status = consts.TEST_STATUSES.disabled
-        else:
-            new_test.status = consts.TEST_STATUSES.wait_running
-        return new_test
+
+class DurationStats(BASE):
+    """Rolling window of recent durations of a test (or of one of its
+    steps) on a cluster. Is updated incrementally as results of tests
+    arrive and is used for detection of slow test runs.
+    """
+
+    __tablename__ = 'duration_stats'
+
+    cluster_id = sa.Column(sa.Integer(), primary_key=True,
+                           autoincrement=False)
+    test_name = sa.Column(sa.String(512), primary_key=True)
+    # empty string stands for the whole test
+    step = sa.Column(sa.String(64), primary_key=True, default='')
+    # list of [test_run_id, duration] pairs, the oldest go first
+    samples = sa.Column(fields.JsonField())
 
 
 class TestRun(BASE):
@@ -237,10 +287,11 @@ class TestRun(BASE):
         'cluster_testing_pattern', 'test_set'
     )
 
+    # results are created in order of names of tests
     tests = relationship(
-        'Test',
+        'TestResult',
         backref='test_run',
-        order_by='Test.name',
+        order_by='TestResult.id',
         cascade='delete'
     )
 
@@ -278,9 +329,9 @@ class TestRun(BASE):
                      status=consts.TESTRUN_STATUSES.running,
                      tests=None):
         """Creates new test_run object with given data
-        and makes copy of tests that will be bound
-        with this test_run. Copying is performed by
-        copy_test method of Test class.
+        and makes results of tests that will be bound
+        with this test_run. Results are created by
+        new_result method of Test class.
         """
         predefined_tests = tests or []
         tests_names = session.query(ClusterTestingPattern.tests)\
@@ -290,16 +341,16 @@ class TestRun(BASE):
         tests = session.query(Test)\
             .filter(Test.name.in_(tests_names))\
             .filter_by(test_set_id=test_set)\
-            .filter_by(test_run_id=None)
+            .order_by(Test.name)
 
         test_run = cls(test_set_id=test_set, cluster_id=cluster_id,
                        status=status)
         session.add(test_run)
 
         for test in tests:
-            new_test = test.copy_test(test_run, predefined_tests)
-            session.add(new_test)
-            test_run.tests.append(new_test)
+            test_result = test.new_result(test_run, predefined_tests)
+            session.add(test_result)
+            test_run.tests.append(test_result)
             # NOTE(akostrikov) Seems there is a problem with transaction
             # isolation, so we need not only to flush, but also to commit.
             # We fork and then in forks we flush sql items. But it seems that
@@ -373,6 +424,99 @@ class TestRun(BASE):
             return test_run.frontend
         return {}
 
+    @classmethod
+    def start_many(cls, session, test_runs, dbpath, token=None):
+        """Starts test runs for many (test set, cluster) pairs at once.
+
+        Takes items of POST request to test runs API (dicts with
+        'testset', 'metadata' and optional 'tests'). Test sets, states
+        of the last test runs and testing patterns are fetched with
+        a query each, all test runs are created in one transaction and
+        then passed to the plugins. Returns frontend representation of
+        each started test run, or empty dict if the last test run of
+        the pair isn't finished yet.
+        """
+        test_set_ids = set(item['testset'] for item in test_runs)
+        cluster_ids = set(int(item['metadata']['cluster_id'])
+                          for item in test_runs)
+
+        # also puts test sets into identity map for results of tests
+        test_sets = dict((test_set.id, test_set) for test_set in
+                         session.query(TestSet)
+                         .filter(TestSet.id.in_(test_set_ids)))
+
+        last_test_runs = session.query(sa.func.max(cls.id))\
+            .filter(cls.cluster_id.in_(cluster_ids),
+                    cls.test_set_id.in_(test_set_ids))\
+            .group_by(cls.cluster_id, cls.test_set_id)
+        busy = set(session.query(cls.cluster_id, cls.test_set_id)
+                   .filter(cls.id.in_(last_test_runs))
+                   .filter(cls.status != consts.TESTRUN_STATUSES.finished))
+
+        patterns = dict(
+            ((cluster_id, test_set_id), set(tests or []))
+            for cluster_id, test_set_id, tests in session.query(
+                ClusterTestingPattern.cluster_id,
+                ClusterTestingPattern.test_set_id,
+                ClusterTestingPattern.tests)
+            .filter(ClusterTestingPattern.cluster_id.in_(cluster_ids),
+                    ClusterTestingPattern.test_set_id.in_(test_set_ids)))
+
+        templates = collections.defaultdict(list)
+        for test in session.query(Test)\
+                .filter(Test.test_set_id.in_(test_set_ids))\
+                .order_by(Test.name):
+            templates[test.test_set_id].append(test)
+
+        started = []
+        for item in test_runs:
+            key = (int(item['metadata']['cluster_id']), item['testset'])
+            if key in busy:
+                started.append(None)
+                continue
+            busy.add(key)
+            test_run = cls(cluster_id=key[0], test_set_id=key[1],
+                           status=consts.TESTRUN_STATUSES.running)
+            session.add(test_run)
+            started.append((test_run, item))
+        if not any(started):
+            return [{} for _ in started]
+        # ids of test runs are needed for results of their tests
+        session.flush()
+
+        test_run_ids = []
+        for test_run, item in filter(None, started):
+            test_run_ids.append(test_run.id)
+            names = patterns.get((test_run.cluster_id, test_run.test_set_id),
+                                 set())
+            for test in templates[test_run.test_set_id]:
+                if test.name in names:
+                    test_result = test.new_result(test_run,
+                                                  item.get('tests'))
+                    session.add(test_result)
+                    test_run.tests.append(test_result)
+        # test runs have to be visible to forked processes
+        session.commit()
+
+        # refresh objects expired by commit with one query per model
+        session.query(cls).options(joinedload('tests'))\
+            .filter(cls.id.in_(test_run_ids)).all()
+        session.query(TestSet).filter(TestSet.id.in_(test_set_ids)).all()
+
+        result = []
+        for entry in started:
+            if entry is None:
+                result.append({})
+                continue
+            test_run, item = entry
+            test_set = test_sets[test_run.test_set_id]
+            plugin = nose_plugin.get_plugin(test_set.driver)
+            plugin.run(test_run, test_set, dbpath,
+                       item['metadata'].get('ostf_os_access_creds'),
+                       token=token)
+            result.append(test_run.frontend)
+        return result
+
     def restart(self, session, dbpath,
                 ostf_os_access_creds, tests=None, token=None):
         """Restart test run with
@@ -385,7 +529,7 @@ class TestRun(BASE):
 
             self.update(consts.TEST_STATUSES.running)
             if tests:
-                Test.update_test_run_tests(
+                TestResult.update_test_run_tests(
                     session, self.id, tests)
 
             plugin.run(self, self.test_set, dbpath,
@@ -399,6 +543,28 @@ class TestRun(BASE):
         plugin = nose_plugin.get_plugin(self.test_set.driver)
         killed = plugin.kill(self)
         if killed:
-            Test.update_running_tests(
+            TestResult.update_running_tests(
                 session, self.id, status=consts.TEST_STATUSES.stopped)
         return self.frontend
+
+
+class ArchivedTestRun(BASE):
+    """Finished test run moved out of test_runs by the archive job.
+
+    Only results which vary per test run are kept (in one JSON list per
+    test run); title, description and duration of tests are taken from
+    tests by test name.
+    """
+
+    __tablename__ = 'archived_test_runs'
+
+    # the same id as the test run had
+    id = sa.Column(sa.Integer(), primary_key=True, autoincrement=False)
+    cluster_id = sa.Column(sa.Integer(), nullable=False, index=True)
+    test_set_id = sa.Column(sa.String(128))
+    meta = sa.Column(fields.JsonField())
+    started_at = sa.Column(sa.DateTime)
+    ended_at = sa.Column(sa.DateTime)
+    archived_at = sa.Column(sa.DateTime, default=datetime.datetime.utcnow)
+    # list of dicts with name, status, taken, message and step of tests
+    results = sa.Column(fields.JsonField())
@@ -56,6 +56,7 @@ def setup_app(config=None, session=None):
     setup_config(config or {})
     session = session or engine.get_session(pecan.conf.dbpath)
     app_hooks = [
+        hooks.MetricsHook(),
         hooks.CustomTransactionalHook(session),
         hooks.AddTokenHook()
     ]
@@ -23,12 +23,14 @@ except ImportError:
 from pecan import abort
 from pecan import expose
 from pecan import request
+from pecan import response
 from pecan import rest
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
 
 from fuel_plugin import consts
+from fuel_plugin.ostf_adapter import analytics
+from fuel_plugin.ostf_adapter import cache
 from fuel_plugin.ostf_adapter import mixins
+from fuel_plugin.ostf_adapter import serializers
 from fuel_plugin.ostf_adapter.storage import models
 
 
@@ -47,82 +49,90 @@ class BaseRestController(rest.RestController):
                                                            request)
 
 
-class TestsetsController(BaseRestController):
+def etag_matches(etag):
+    """Whether If-None-Match of the request lists given ETag. '*' is
+    not taken as a match: it doesn't prove that the client has the
+    actual representation.
+    """
+    return etag in getattr(request.if_none_match, 'etags', ())
 
-    @expose('json')
-    def get(self, cluster):
-        mixins.discovery_check(request.session, cluster, request.token)
 
-        needed_testsets = request.session\
-            .query(models.ClusterTestingPattern.test_set_id)\
-            .filter_by(cluster_id=cluster)
+def not_modified(etag):
+    """Sets ETag of the response. Returns True and sets 304 status
+    if the client already has the actual representation.
+    """
+    response.etag = etag
+    if etag_matches(etag):
+        response.status = 304
+        return True
+    return False
 
-        test_sets = request.session.query(models.TestSet)\
-            .filter(models.TestSet.id.in_(needed_testsets))\
-            .order_by(models.TestSet.test_runs_ordering_priority)\
-            .all()
 
-        if test_sets:
-            return [item.frontend for item in test_sets]
-        return {}
-
-
-class TestsController(BaseRestController):
+class TestsetsController(BaseRestController):
 
-    @expose('json')
+    @expose(content_type=serializers.CONTENT_TYPE)
     def get(self, cluster):
         mixins.discovery_check(request.session, cluster, request.token)
-        needed_tests_list = request.session\
-            .query(models.ClusterTestingPattern.tests)\
-            .filter_by(cluster_id=cluster)
-
-        result = []
-        for tests in needed_tests_list:
-            tests_to_return = request.session.query(models.Test)\
-                .filter(models.Test.name.in_(tests[0]))\
-                .all()
+        if not_modified(cache.CLUSTERS.etag('testsets', cluster)):
+            return ''
+        return serializers.test_sets(request.session, cluster)
 
-            result.extend(tests_to_return)
 
-        result.sort(key=lambda test: test.name)
-
-        if result:
-            return [item.frontend for item in result]
+class TestsController(BaseRestController):
 
-        return {}
+    @expose(content_type=serializers.CONTENT_TYPE)
+    def get(self, cluster):
+        mixins.discovery_check(request.session, cluster, request.token)
+        if not_modified(cache.CLUSTERS.etag('tests', cluster)):
+            return ''
+        return serializers.tests(request.session, cluster)
 
 
 class TestrunsController(BaseRestController):
 
     _custom_actions = {
         'last': ['GET'],
+        'analysis': ['GET'],
     }
 
-    @expose('json')
+    @expose(content_type=serializers.CONTENT_TYPE)
     def get_all(self):
-        test_runs = request.session.query(models.TestRun).all()
+        return serializers.join(serializers.history(request.session))
 
-        return [item.frontend for item in test_runs]
-
-    @expose('json')
+    @expose(content_type=serializers.CONTENT_TYPE)
     def get_one(self, test_run_id):
-        test_run = request.session.query(models.TestRun)\
-            .filter_by(id=test_run_id).first()
-        if test_run and isinstance(test_run, models.TestRun):
-            return test_run.frontend
-        return {}
+        try:
+            test_run_id = int(test_run_id)
+        except ValueError:
+            abort(400)
 
-    @expose('json')
+        # only finished test runs are cached and get ETag; the ETag
+        # changes as soon as the test run is restarted
+        etag = cache.TEST_RUNS.etag(test_run_id)
+        test_run = cache.TEST_RUNS.get(test_run_id)
+        if test_run is not None and not_modified(etag):
+            return ''
+
+        if test_run is None:
+            test_run = serializers.test_run(request.session, test_run_id)
+        if test_run is None:
+            return serializers.dumps({})
+        if cache.TEST_RUNS.get(test_run_id) is not None:
+            response.etag = etag
+        return test_run
+
+    @expose(content_type=serializers.CONTENT_TYPE)
     def get_last(self, cluster_id):
-        test_run_ids = request.session.query(func.max(models.TestRun.id)) \
-            .group_by(models.TestRun.test_set_id)\
-            .filter_by(cluster_id=cluster_id)
-
-        test_runs = request.session.query(models.TestRun)\
-            .options(joinedload('tests'))\
-            .filter(models.TestRun.id.in_(test_run_ids))
+        return serializers.join(
+            serializers.last_test_runs(request.session, cluster_id))
 
-        return [item.frontend for item in test_runs]
+    @expose('json')
+    def get_analysis(self, test_run_id):
+        test_run = models.TestRun.get_test_run(request.session, test_run_id,
+                                               joined=True)
+        if test_run is None:
+            return {}
+        return analytics.analyze_test_run(request.session, test_run)
 
     @expose('json')
     def post(self):
@@ -142,34 +152,18 @@ class TestrunsController(BaseRestController):
                                        request.token)
             nedded_testsets.add(test_run['testset'])
         # Validate testsets from request
-        test_sets = set([testset.id for testset in request.
-                        session.query(models.TestSet).all()])
+        test_sets = set(test_set_id for test_set_id, in request.session
+                        .query(models.TestSet.id)
+                        .filter(models.TestSet.id.in_(nedded_testsets)))
         if nedded_testsets - test_sets:
             abort(400)
 
-        res = []
-        for test_run in test_runs:
-            test_set = test_run['testset']
-            metadata = test_run['metadata']
-            tests = test_run.get('tests', [])
-
-            test_set = models.TestSet.get_test_set(
-                request.session,
-                test_set
-            )
-
-            test_run = models.TestRun.start(
-                request.session,
-                test_set,
-                metadata,
-                tests,
-                cfg.CONF.adapter.dbpath,
-                token=request.token
-            )
-
-            res.append(test_run)
-
-        return res
+        return models.TestRun.start_many(
+            request.session,
+            test_runs,
+            cfg.CONF.adapter.dbpath,
+            token=request.token
+        )
 
     @expose('json')
     def put(self):
@@ -186,6 +180,9 @@ class TestrunsController(BaseRestController):
 
                 test_run = models.TestRun.get_test_run(request.session,
                                                        test_run['id'])
+                # cached representation is dropped by the transaction
+                # hook once the change is committed
+                request.changed_test_runs.append(test_run.id)
                 if status == consts.TESTRUN_STATUSES.stopped:
                     data.append(test_run.stop(request.session))
                 elif status == consts.TESTRUN_STATUSES.restarted:
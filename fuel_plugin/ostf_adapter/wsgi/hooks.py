@@ -12,17 +12,84 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import logging
+import re
+import time
 
+try:
+    from oslo.config import cfg
+except ImportError:
+    from oslo_config import cfg
 from pecan import hooks
+from sqlalchemy import event
+
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter import metrics
 
 
 LOG = logging.getLogger(__name__)
 
+PROFILE_SQL_HEADER = 'X-OSTF-Profile-SQL'
+SQL_PROFILE_HEADER = 'X-OSTF-SQL-Profile'
+
+# key of the request in info of the session and of its connections
+REQUEST_INFO_KEY = 'ostf_request'
+
+# lists of bound parameters, e.g. expanded IN clauses
+_PARAMS_LIST = re.compile(r'\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,?)+\)')
+
+
+def controller_name(state):
+    """Name of the controller method which handles the request,
+    e.g. 'TestrunsController.get_last'.
+    """
+    controller = getattr(state, 'controller', None)
+    if controller is None:
+        return 'unknown'
+    owner = getattr(controller, '__self__', None)
+    if owner is None:
+        return controller.__name__
+    return '{0}.{1}'.format(type(owner).__name__, controller.__name__)
+
+
+def statement_shape(statement):
+    """Statement text which doesn't depend on number of parameters."""
+    return _PARAMS_LIST.sub('(?)', ' '.join(statement.split()))
+
+
+class SQLProfile(object):
+    """Statements executed during a request and time spent on them."""
+
+    def __init__(self, repeat_threshold):
+        self.repeat_threshold = repeat_threshold
+        self.statements = 0
+        self.duration = 0.0
+        self.shapes = collections.Counter()
+
+    def record(self, statement, duration):
+        self.statements += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self):
+        """Statements which were probably issued in a loop (N+1)."""
+        return [(shape, count) for shape, count in self.shapes.most_common()
+                if count > self.repeat_threshold]
+
+    def summary(self):
+        return 'statements={0}; time_ms={1:.1f}; repeated={2}'.format(
+            self.statements, self.duration * 1000, len(self.repeated()))
+
 
 class CustomTransactionalHook(hooks.TransactionHook):
     def __init__(self, session):
         self.session = session
+        # statements are counted on the request itself: the server runs
+        # requests in greenlets which share one thread, so thread local
+        # counters would be mixed up
+        self._binds = set()
+        event.listen(self.session, 'after_begin', self._after_begin)
 
         def start():
             pass
@@ -45,9 +112,91 @@ class CustomTransactionalHook(hooks.TransactionHook):
                                                       rollback,
                                                       clear)
 
+    @staticmethod
+    def _after_begin(session, transaction, connection):
+        # connections used by the session are bound to its request,
+        # so statements can be attributed to the request
+        request = session.info.get(REQUEST_INFO_KEY)
+        if request is not None:
+            connection.info[REQUEST_INFO_KEY] = request
+            request.sql_connections_info.append(connection.info)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters,
+                               context, executemany):
+        request = conn.info.get(REQUEST_INFO_KEY)
+        if request is None:
+            return
+        request.sql_statements += 1
+        if request.sql_profile is not None:
+            conn.info.setdefault('ostf_query_started_at', []).append(
+                time.time())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters,
+                              context, executemany):
+        request = conn.info.get(REQUEST_INFO_KEY)
+        started_at = conn.info.get('ostf_query_started_at')
+        if request is not None and request.sql_profile is not None \
+                and started_at:
+            request.sql_profile.record(statement,
+                                       time.time() - started_at.pop())
+
+    def _listen_bind(self):
+        bind = self.session.get_bind()
+        if bind not in self._binds:
+            event.listen(bind, 'before_cursor_execute',
+                         self._before_cursor_execute)
+            event.listen(bind, 'after_cursor_execute',
+                         self._after_cursor_execute)
+            self._binds.add(bind)
+
+    @staticmethod
+    def is_profiled(state):
+        header = state.request.headers.get(PROFILE_SQL_HEADER, '')
+        return cfg.CONF.adapter.sql_profiling or \
+            header.lower() in ('1', 'true', 'yes', 'on')
+
     def before(self, state):
         super(CustomTransactionalHook, self).before(state)
         state.request.session = self.session
+        # ids of test runs whose cached representation is stale
+        # after commit of the request
+        state.request.changed_test_runs = []
+        state.request.sql_statements = 0
+        state.request.sql_profile = None
+        if self.is_profiled(state):
+            state.request.sql_profile = SQLProfile(
+                cfg.CONF.adapter.sql_profiling_repeat_threshold)
+        state.request.sql_connections_info = []
+        self._listen_bind()
+        self.session.info[REQUEST_INFO_KEY] = state.request
+
+    def _report_profile(self, state, profile):
+        controller = controller_name(state)
+        summary = profile.summary()
+        state.response.headers[SQL_PROFILE_HEADER] = summary
+        LOG.info('SQL profile of %s %s (%s): %s', state.request.method,
+                 state.request.path, controller, summary)
+        for shape, count in profile.repeated():
+            LOG.warning('Possible N+1 query in %s, statement executed '
+                        '%d times: %s', controller, count, shape)
+
+    def after(self, state):
+        metrics.REQUEST_DB_QUERIES.observe(
+            getattr(state.request, 'sql_statements', 0),
+            controller=controller_name(state))
+        profile = getattr(state.request, 'sql_profile', None)
+        if profile is not None:
+            self._report_profile(state, profile)
+        self.session.info.pop(REQUEST_INFO_KEY, None)
+        super(CustomTransactionalHook, self).after(state)
+        # pooled connections keep their info after the request
+        for info in getattr(state.request, 'sql_connections_info', ()):
+            if info.get(REQUEST_INFO_KEY) is state.request:
+                del info[REQUEST_INFO_KEY]
+        # invalidated only after commit, otherwise a concurrent request
+        # could cache the old state of the test run again
+        for test_run_id in getattr(state.request, 'changed_test_runs', ()):
+            cache.TEST_RUNS.invalidate(test_run_id)
 
     def on_error(self, state, exc):
         super(CustomTransactionalHook, self).on_error(state, exc)
@@ -59,3 +208,23 @@ class AddTokenHook(hooks.PecanHook):
     def before(self, state):
         # (dshulyak) just utility to get token
         state.request.token = state.request.headers.get('X-Auth-Token', None)
+
+
+class MetricsHook(hooks.PecanHook):
+
+    def before(self, state):
+        state.request.started_at = time.time()
+
+    def on_error(self, state, exc):
+        # response isn't updated yet for errors not handled by pecan
+        state.request.error_status = getattr(exc, 'code', 500)
+
+    def after(self, state):
+        started_at = getattr(state.request, 'started_at', None)
+        if started_at is None:
+            return
+        status = getattr(state.request, 'error_status',
+                         state.response.status_int)
+        metrics.REQUEST_LATENCY.observe(time.time() - started_at,
+                                        controller=controller_name(state),
+                                        status=status)
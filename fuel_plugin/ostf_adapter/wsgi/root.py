@@ -12,8 +12,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from fuel_plugin.ostf_adapter import metrics as ostf_metrics
 from fuel_plugin.ostf_adapter.wsgi import controllers
 from pecan import expose
+from pecan import request
 
 
 class V1Controller(object):
@@ -29,3 +31,8 @@ class RootController(object):
     @expose('json', generic=True)
     def index(self):
         return {}
+
+    @expose(content_type=ostf_metrics.CONTENT_TYPE)
+    def metrics(self):
+        ostf_metrics.collect_test_runs(request.session)
+        return ostf_metrics.render()
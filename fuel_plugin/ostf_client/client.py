@@ -12,18 +12,33 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import requests
+from multiprocessing import pool
 import time
 
+import requests
+from requests import adapters
+
 try:
     from oslo.serialization import jsonutils
 except ImportError:
     from oslo_serialization import jsonutils
 
 
+# number of concurrent requests of MultiClusterRunner
+DEFAULT_WORKERS = 10
+
+
 class TestingAdapterClient(object):
-    def __init__(self, url):
+    def __init__(self, url, session=None, pool_size=DEFAULT_WORKERS):
         self.url = url
+        # keep-alive connections are reused by all requests of the client
+        if session is None:
+            session = requests.Session()
+            adapter = adapters.HTTPAdapter(pool_connections=1,
+                                           pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
 
     def _request(self, method, url, data=None):
         headers = {'content-type': 'application/json'}
@@ -44,7 +59,7 @@ class TestingAdapterClient(object):
 
             data = jsonutils.dumps({'objects': data})
 
-        r = requests.request(
+        r = self.session.request(
             method,
             url,
             data=data,
@@ -110,6 +125,33 @@ class TestingAdapterClient(object):
         ]
         return self._request('POST', url, data)
 
+    def start_testruns(self, testruns):
+        """Starts test runs of many clusters with one request.
+
+        Takes list of (testset, cluster_id, tests) tuples.
+        """
+        url = ''.join([self.url, '/testruns'])
+        data = [
+            {
+                'testset': testset,
+                'tests': tests or [],
+                'metadata': {'cluster_id': str(cluster_id)}
+            }
+            for testset, cluster_id, tests in testruns
+        ]
+        return self._request('POST', url, data)
+
+    def stop_testruns(self, testrun_ids):
+        url = ''.join([self.url, '/testruns'])
+        data = [
+            {
+                'id': testrun_id,
+                'status': 'stopped'
+            }
+            for testrun_id in testrun_ids
+        ]
+        return self._request('PUT', url, data)
+
     def stop_testrun(self, testrun_id):
         url = ''.join([self.url, '/testruns'])
         data = [
@@ -207,3 +249,122 @@ class TestingAdapterClient(object):
     def restart_with_timeout(self, testset, tests, cluster_id, timeout):
         action = lambda: self.restart_tests_last(testset, tests, cluster_id)
         return self._with_timeout(action, testset, cluster_id, timeout)
+
+
+class MultiClusterRunner(object):
+    """Runs test sets on many clusters at once.
+
+    All test runs are started with one request. Then the last test runs
+    of every cluster are polled with one request per cluster per tick,
+    requests to different clusters are sent concurrently. Test runs not
+    finished in time are stopped with one request.
+    """
+
+    def __init__(self, client, testruns, timeout, polling=5,
+                 workers=DEFAULT_WORKERS, polling_hook=None):
+        """Takes list of (testset, cluster_id) or
+        (testset, cluster_id, tests) tuples.
+        """
+        self.client = client
+        self.testruns = [(item[0], str(item[1]),
+                          item[2] if len(item) > 2 else [])
+                         for item in testruns]
+        self.timeout = timeout
+        self.polling = polling
+        self.workers = workers
+        self.polling_hook = polling_hook
+        # the latest state of test runs by (testset, cluster_id)
+        self.results = {}
+        self.timed_out = set()
+        # thread pool for concurrent requests, it lives during run()
+        self._pool = None
+
+    @property
+    def clusters(self):
+        return sorted(set(cluster_id for _, cluster_id, _ in self.testruns))
+
+    @property
+    def unfinished(self):
+        return [(testset, cluster_id)
+                for testset, cluster_id, _ in self.testruns
+                if (testset, cluster_id) not in self.timed_out and
+                self.results.get((testset, cluster_id), {})
+                .get('status') != 'finished']
+
+    def _map(self, func, items):
+        if self._pool is None:
+            self._pool = pool.ThreadPool(
+                min(self.workers, len(self.clusters)) or 1)
+        return self._pool.map(func, items)
+
+    def close(self):
+        """Stops threads of the pool used for requests."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def poll(self):
+        """Fetches the last test runs of all clusters."""
+        def last(cluster_id):
+            return cluster_id, self.client.testruns_last(cluster_id)
+
+        for cluster_id, response in self._map(last, self.clusters):
+            if self.polling_hook:
+                self.polling_hook(response)
+            for item in response.json():
+                key = (item['testset'], str(item['cluster_id']))
+                self.results[key] = item
+
+    def stop(self, keys):
+        """Stops the last test runs of given (testset, cluster_id)."""
+        testrun_ids = [self.results[key]['id'] for key in keys
+                       if key in self.results]
+        if testrun_ids:
+            return self.client.stop_testruns(testrun_ids)
+
+    def start(self):
+        started = self.client.start_testruns(self.testruns).json()
+
+        # the last test run of the test set is still running
+        busy = [testrun for testrun, result in zip(self.testruns, started)
+                if not result]
+        if busy:
+            self.poll()
+            self.stop([(testset, cluster_id)
+                       for testset, cluster_id, _ in busy])
+            time.sleep(1)
+            restarted = self.client.start_testruns(busy).json()
+            # the old test run is still running even after it was stopped,
+            # its state must not be taken for the result of this run
+            self.timed_out.update(
+                (testset, cluster_id) for (testset, cluster_id, _), result
+                in zip(busy, restarted) if not result)
+
+    def wait(self):
+        start_time = time.time()
+        while time.time() - start_time <= self.timeout:
+            time.sleep(self.polling)
+            self.poll()
+            if not self.unfinished:
+                break
+        else:
+            unfinished = self.unfinished
+            self.timed_out.update(unfinished)
+            stopped_response = self.stop(unfinished)
+            if self.polling_hook and stopped_response is not None:
+                self.polling_hook(stopped_response)
+            self.poll()
+        return self.results
+
+    def run(self):
+        """Returns the last state of test runs by (testset, cluster_id).
+        Test runs which weren't finished in time (or couldn't be started
+        because the previous test run of the test set didn't stop) are
+        in timed_out.
+        """
+        try:
+            self.start()
+            return self.wait()
+        finally:
+            self.close()
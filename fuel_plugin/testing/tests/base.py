@@ -22,6 +22,7 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 import unittest2
 import webtest
 
+from fuel_plugin.ostf_adapter import cache
 from fuel_plugin.ostf_adapter import config
 from fuel_plugin.ostf_adapter import mixins
 from fuel_plugin.ostf_adapter.nose_plugin import nose_discovery
@@ -396,6 +397,8 @@ class BaseIntegrationTest(BaseUnitTest):
     def discovery(self):
         """Discover dummy tests used for testsing."""
         mixins.TEST_REPOSITORY = []
+        cache.CLUSTERS.invalidate()
+        cache.TEST_RUNS.invalidate()
         nose_discovery.discovery(path=TEST_PATH, session=self.session)
         mixins.cache_test_repository(self.session)
         self.session.flush()
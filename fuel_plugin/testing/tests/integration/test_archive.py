@@ -0,0 +1,135 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+
+import mock
+
+from fuel_plugin.ostf_adapter import archive
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter.storage import models
+from fuel_plugin.testing.tests import base
+
+
+class TestArchivedTestRuns(base.BaseWSGITest):
+
+    def setUp(self):
+        super(TestArchivedTestRuns, self).setUp()
+        self.nose_plugin_patcher = mock.patch(
+            'fuel_plugin.ostf_adapter.storage.models.nose_plugin.get_plugin',
+            lambda *args: mock.Mock()
+        )
+        self.nose_plugin_patcher.start()
+
+        self.cluster_id = self.expected['cluster']['id']
+        self.mock_api_for_cluster(self.cluster_id)
+
+    def tearDown(self):
+        super(TestArchivedTestRuns, self).tearDown()
+        self.nose_plugin_patcher.stop()
+
+    def start(self, test_set_id):
+        resp = self.app.post_json('/v1/testruns/', (
+            {
+                'testset': test_set_id,
+                'metadata': {'cluster_id': self.cluster_id}
+            },
+        ))
+        return resp.json[0]['id']
+
+    def finish(self, test_run_id, days_ago):
+        ended_at = datetime.datetime.utcnow().replace(microsecond=0) - \
+            datetime.timedelta(days=days_ago)
+
+        test_run = self.session.query(models.TestRun).get(test_run_id)
+        test_run.status = 'finished'
+        test_run.meta = {'release_version': '2015.2-1.0'}
+        test_run.started_at = ended_at - datetime.timedelta(minutes=5)
+        test_run.ended_at = ended_at
+        for step, test_result in enumerate(test_run.tests, 1):
+            test_result.status = 'failure'
+            test_result.time_taken = 1.5
+            test_result.message = 'Failed on step {0}'.format(step)
+            test_result.step = step
+        self.session.commit()
+        return test_run
+
+    def test_archived_test_run(self):
+        old_id = self.start('general_test')
+        old = self.finish(old_id, days_ago=31)
+        started_at, ended_at = old.started_at, old.ended_at
+        recent_id = self.start('stopped_test')
+        self.finish(recent_id, days_ago=1)
+
+        live = self.app.get('/v1/testruns/{0}'.format(old_id)).json
+        expected_results = [
+            {'name': test['id'],
+             'status': 'failure',
+             'taken': 1.5,
+             'message': test['message'],
+             'step': test['step']}
+            for test in live['tests']]
+        self.assertTrue(expected_results)
+
+        self.assertEqual(archive.archive_test_runs(self.session, 30), 1)
+        # drop the representation cached while the test run was live
+        cache.TEST_RUNS.invalidate()
+
+        self.assertIsNone(self.session.query(models.TestRun)
+                          .filter_by(id=old_id).first())
+        self.assertEqual(self.session.query(models.TestResult)
+                         .filter_by(test_run_id=old_id).count(), 0)
+        self.assertIsNotNone(self.session.query(models.TestRun)
+                             .filter_by(id=recent_id).first())
+
+        archived = self.session.query(models.ArchivedTestRun).get(old_id)
+        self.assertEqual(archived.cluster_id, self.cluster_id)
+        self.assertEqual(archived.test_set_id, 'general_test')
+        self.assertEqual(archived.meta, {'release_version': '2015.2-1.0'})
+        self.assertEqual(archived.started_at, started_at)
+        self.assertEqual(archived.ended_at, ended_at)
+        self.assertEqual(archived.results, expected_results)
+
+        resp = self.app.get('/v1/testruns/{0}'.format(old_id))
+        self.assertEqual(resp.json, live)
+        self.assertEqual(resp.json['started_at'], str(started_at))
+        self.assertEqual(resp.json['ended_at'], str(ended_at))
+
+        resp = self.app.get('/v1/testruns/')
+        self.assertEqual([test_run['id'] for test_run in resp.json],
+                         [old_id, recent_id])
+        self.assertEqual(resp.json[0], live)
+
+    def test_last_test_runs(self):
+        general_id = self.start('general_test')
+        self.finish(general_id, days_ago=31)
+        stopped_id = self.start('stopped_test')
+        self.finish(stopped_id, days_ago=31)
+
+        self.assertEqual(archive.archive_test_runs(self.session, 30), 2)
+
+        resp = self.app.get('/v1/testruns/last/{0}'.format(self.cluster_id))
+        self.assertEqual(
+            [(test_run['id'], test_run['testset']) for test_run in resp.json],
+            [(general_id, 'general_test'), (stopped_id, 'stopped_test')])
+
+        # archived test run is ignored once its test set runs again
+        live_id = self.start('general_test')
+
+        resp = self.app.get('/v1/testruns/last/{0}'.format(self.cluster_id))
+        self.assertEqual(
+            [(test_run['id'], test_run['testset'],
+              test_run['status']) for test_run in resp.json],
+            [(stopped_id, 'stopped_test', 'finished'),
+             (live_id, 'general_test', 'running')])
@@ -53,9 +53,8 @@ class TestModelTestMethods(base.BaseIntegrationTest):
 
     @property
     def test_to_check(self):
-        return self.session.query(models.Test)\
-            .filter_by(test_run_id=self.test_run.id)\
-            .filter_by(name=self.test_obj.name)\
+        return self.session.query(models.TestResult)\
+            .filter_by(test_run_id=self.test_run.id, test_id=self.test_obj.id)\
             .first()
 
     def check_model_obj_attrs(self, obj, attrs):
@@ -69,47 +68,49 @@ class TestModelTestMethods(base.BaseIntegrationTest):
             'time_taken': 10.4
         }
 
-        models.Test.add_result(self.session,
-                               self.test_run.id,
-                               self.test_obj.name,
-                               expected_data)
+        models.TestResult.add_result(self.session,
+                                     self.test_run.id,
+                                     self.test_obj.name,
+                                     expected_data)
 
         self.check_model_obj_attrs(self.test_to_check, expected_data)
 
     def test_update_running_tests_default_status(self):
-        models.Test.update_running_tests(self.session,
-                                         self.test_run.id)
+        models.TestResult.update_running_tests(self.session,
+                                               self.test_run.id)
 
         self.assertEqual(self.test_to_check.status, 'stopped')
 
     def test_update_running_tests_with_status(self):
         expected_status = 'success'
 
-        models.Test.update_running_tests(self.session,
-                                         self.test_run.id,
-                                         status=expected_status)
+        models.TestResult.update_running_tests(self.session,
+                                               self.test_run.id,
+                                               status=expected_status)
 
         self.assertEqual(self.test_to_check.status, expected_status)
 
     def test_update_only_running_tests(self):
         # the method should update only running tests
         expected_status = 'error'
-        models.Test.add_result(self.session, self.test_run.id,
-                               self.test_obj.name,
-                               {'status': expected_status})
+        models.TestResult.add_result(self.session, self.test_run.id,
+                                     self.test_obj.name,
+                                     {'status': expected_status})
 
-        models.Test.update_running_tests(self.session, self.test_run.id)
+        models.TestResult.update_running_tests(self.session,
+                                               self.test_run.id)
 
         # check that status of test is not updated to 'stopped'
         self.assertEqual(self.test_to_check.status, expected_status)
 
     def test_update_test_run_tests_default_status(self):
-        models.Test.add_result(self.session, self.test_run.id,
-                               self.test_obj.name,
-                               {'time_taken': 10.4})
+        models.TestResult.add_result(self.session, self.test_run.id,
+                                     self.test_obj.name,
+                                     {'time_taken': 10.4})
 
-        models.Test.update_test_run_tests(self.session, self.test_run.id,
-                                          [self.test_obj.name])
+        models.TestResult.update_test_run_tests(self.session,
+                                                self.test_run.id,
+                                                [self.test_obj.name])
 
         expected_attrs = {
             'status': 'wait_running',
@@ -118,38 +119,25 @@ class TestModelTestMethods(base.BaseIntegrationTest):
 
         self.check_model_obj_attrs(self.test_to_check, expected_attrs)
 
-    def test_properly_copied_test(self):
-        new_test = self.test_obj.copy_test(self.test_run, predefined_tests=[])
-
-        copied_attrs_list = [
-            'name',
-            'title',
-            'description',
-            'duration',
-            'message',
-            'traceback',
-            'step',
-            'time_taken',
-            'meta',
-            'deployment_tags',
-            'available_since_release',
-            'test_set_id',
-        ]
-        attrs = {}
-        for attr_name in copied_attrs_list:
-            attrs[attr_name] = getattr(self.test_obj, attr_name)
+    def test_new_result(self):
+        test_result = self.test_obj.new_result(self.test_run,
+                                               predefined_tests=[])
 
-        self.check_model_obj_attrs(new_test, attrs)
+        self.assertIs(test_result.test, self.test_obj)
+        for attr_name in ('name', 'title', 'description', 'duration',
+                          'test_set_id'):
+            self.assertEqual(getattr(self.test_obj, attr_name),
+                             getattr(test_result, attr_name))
 
-        self.assertEqual(new_test.test_run_id, self.test_run.id)
-        self.assertEqual(new_test.status, 'wait_running')
+        self.assertEqual(test_result.test_run_id, self.test_run.id)
+        self.assertEqual(test_result.status, 'wait_running')
 
-    def test_copy_test_with_predefined_list(self):
+    def test_new_result_with_predefined_list(self):
         predefined_tests_names = ['some_other_test']
-        new_test = self.test_obj.copy_test(self.test_run,
-                                           predefined_tests_names)
+        test_result = self.test_obj.new_result(self.test_run,
+                                               predefined_tests_names)
 
-        self.assertEqual(new_test.status, 'disabled')
+        self.assertEqual(test_result.status, 'disabled')
 
 
 class TestModelTestSetMethods(base.BaseIntegrationTest):
@@ -216,8 +204,7 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
         self.assertEqual(test_run.status, 'running')
 
         unassigned_tests = self.session.query(models.Test)\
-            .filter_by(test_set_id=self.test_set_id)\
-            .filter_by(test_run_id=None)
+            .filter_by(test_set_id=self.test_set_id)
 
         test_names_from_test_set = [
             test.name for test in unassigned_tests
@@ -241,7 +228,6 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
             test.name for test in
             self.session.query(models.Test)
                 .filter_by(test_set_id=self.test_set_id)
-                .filter_by(test_run_id=None)
         ][:3]
 
         test_run = models.TestRun.add_test_run(
@@ -255,7 +241,6 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
             test.name for test in
             self.session.query(models.Test)
                 .filter_by(test_set_id=self.test_set_id)
-                .filter_by(test_run_id=None)
         ][:3]
 
         additional_test = self.session.query(models.Test)\
@@ -383,6 +368,61 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
 
         self.assertEqual(frontend, {})
 
+    @mock.patch('fuel_plugin.ostf_adapter.storage.models.nose_plugin')
+    def test_start_many_test_runs(self, nose_plugin_mock):
+        plugin_inst_mock = mock.Mock()
+        nose_plugin_mock.get_plugin = mock.Mock(
+            return_value=plugin_inst_mock
+        )
+        models.TestRun.add_test_run(
+            self.session, 'stopped_test', self.cluster_id)
+        self.session.flush()
+
+        test_name = self.session.query(models.Test.name)\
+            .filter_by(test_set_id=self.test_set_id)\
+            .first()[0]
+        test_runs = [
+            {'testset': self.test_set_id,
+             'metadata': {'cluster_id': self.cluster_id},
+             'tests': [test_name]},
+            # the last test run of the test set isn't finished yet
+            {'testset': 'stopped_test',
+             'metadata': {'cluster_id': self.cluster_id}},
+            # duplicate of the first test run
+            {'testset': self.test_set_id,
+             'metadata': {'cluster_id': self.cluster_id}},
+        ]
+
+        frontend = models.TestRun.start_many(
+            self.session, test_runs, 'fake_db_path', token='fake_token')
+
+        added_test_run = self.session.query(models.TestRun)\
+            .filter_by(test_set_id=self.test_set_id).one()
+        self.assertEqual(frontend, [added_test_run.frontend, {}, {}])
+        self.check_enabled([test_name], added_test_run.tests)
+        self.assertEqual(plugin_inst_mock.run.call_count, 1)
+
+    @mock.patch('fuel_plugin.ostf_adapter.storage.models.nose_plugin')
+    def test_start_many_nothing_started(self, nose_plugin_mock):
+        models.TestRun.add_test_run(
+            self.session, 'stopped_test', self.cluster_id)
+        self.session.flush()
+
+        test_runs = [
+            {'testset': 'stopped_test',
+             'metadata': {'cluster_id': self.cluster_id}},
+            {'testset': 'stopped_test',
+             'metadata': {'cluster_id': self.cluster_id}},
+        ]
+
+        with mock.patch.object(self.session, 'commit') as commit_mock:
+            frontend = models.TestRun.start_many(
+                self.session, test_runs, 'fake_db_path')
+
+        self.assertEqual(frontend, [{}, {}])
+        self.assertFalse(commit_mock.called)
+        self.assertFalse(nose_plugin_mock.get_plugin.called)
+
     @mock.patch('fuel_plugin.ostf_adapter.storage.models.nose_plugin')
     def test_restart_test_run(self, nose_plugin_mock):
         test_run = models.TestRun.add_test_run(
@@ -407,8 +447,9 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
                 models.TestRun, 'is_last_running',
                 new=mock.Mock(return_value=True)) as is_last_run_mock:
 
-            with mock.patch.object(
-                    models.Test, 'update_test_run_tests') as update_tests_mock:
+            with mock.patch.object(models.TestResult,
+                                   'update_test_run_tests') \
+                    as update_tests_mock:
                 frontend = test_run.restart(**kwargs)
 
         self.assertEqual(test_run.frontend, frontend)
@@ -471,8 +512,8 @@ class TestModelTestRunMethods(base.BaseIntegrationTest):
             return_value=plugin_inst_mock
         )
 
-        with mock.patch.object(
-                models.Test, 'update_running_tests') as update_tests_mock:
+        with mock.patch.object(models.TestResult,
+                               'update_running_tests') as update_tests_mock:
             frontend = test_run.stop(self.session)
 
         self.assertEqual(frontend, test_run.frontend)
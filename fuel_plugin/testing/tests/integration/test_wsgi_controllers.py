@@ -138,9 +138,7 @@ class TestTestRunsController(base.BaseWSGITest):
             .filter_by(cluster_id=self.expected['testrun_post']['cluster_id'])\
             .one()
 
-        testrun_tests = self.session.query(models.Test)\
-            .filter(models.Test.test_run_id != (None))\
-            .all()
+        testrun_tests = self.session.query(models.TestResult).all()
 
         tests_names = [
             test.name for test in testrun_tests
@@ -159,7 +157,7 @@ class TestTestRunsController(base.BaseWSGITest):
         ))
         resp_testrun = resp.json[0]
 
-        self.session.query(models.Test)\
+        self.session.query(models.TestResult)\
             .filter_by(test_run_id=resp_testrun['id'])\
             .update({'status': 'running'})
 
@@ -201,7 +199,7 @@ class TestTestRunsController(base.BaseWSGITest):
                     self.expected['testrun_put'][key], resp_testrun[key]
                 )
 
-        testrun_tests = self.session.query(models.Test)\
+        testrun_tests = self.session.query(models.TestResult)\
             .filter_by(test_run_id=self.expected['testrun_put']['id'])\
             .all()
 
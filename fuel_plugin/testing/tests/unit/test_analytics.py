@@ -0,0 +1,124 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from fuel_plugin.ostf_adapter import analytics
+from fuel_plugin.ostf_adapter.storage import models
+from fuel_plugin.testing.tests import base
+
+
+class TestDurationHelpers(base.BaseUnitTest):
+
+    def test_parse_duration(self):
+        self.assertEqual(analytics.parse_duration('180 s.'), 180)
+        self.assertEqual(analytics.parse_duration('25sec'), 25)
+        self.assertEqual(analytics.parse_duration('2 min'), 120)
+        self.assertIsNone(analytics.parse_duration(''))
+        self.assertIsNone(analytics.parse_duration('unknown'))
+
+    def test_percentile(self):
+        self.assertEqual(analytics.percentile(range(1, 101)), 95)
+        self.assertEqual(analytics.percentile([3, 1, 2]), 3)
+        self.assertIsNone(analytics.percentile([]))
+
+
+class TestAnalyzeTestRun(base.BaseUnitTest):
+
+    def setUp(self):
+        self.test_name = 'fuel_health.tests.smoke.Test.test_boot'
+        self.stats = [
+            models.DurationStats(
+                cluster_id=1, test_name=self.test_name,
+                step=analytics.WHOLE_TEST,
+                samples=[[run_id, 10.0] for run_id in range(1, 11)]),
+            models.DurationStats(
+                cluster_id=1, test_name=self.test_name, step='2',
+                samples=[[run_id, 2.0] for run_id in range(1, 11)]),
+        ]
+        self.session = mock.Mock()
+        self.session.query.return_value.filter_by.return_value\
+            .filter.return_value = self.stats
+
+    def build_run(self, time_taken, *step_durations, **kwargs):
+        run_id = kwargs.get('run_id', 11)
+        test_result = models.TestResult(
+            test=models.Test(name=self.test_name, duration='30 s.'),
+            status='success', time_taken=time_taken,
+            steps=[{'step': 2, 'action': 'boot', 'duration': duration,
+                    'timeout': 60, 'outcome': 'success'}
+                   for duration in step_durations])
+        return models.TestRun(id=run_id, cluster_id=1,
+                              test_set_id='smoke', tests=[test_result])
+
+    def test_no_regressions(self):
+        result = analytics.analyze_test_run(
+            self.session, self.build_run(10.0, 2.0))
+
+        self.assertEqual(result['regressions'], 0)
+        self.assertEqual(result['tests'][0]['p95'], 10.0)
+        self.assertEqual(result['tests'][0]['samples'], 10)
+
+    def test_slow_test_and_step(self):
+        result = analytics.analyze_test_run(
+            self.session, self.build_run(40.0, 5.0))
+
+        test = result['tests'][0]
+        self.assertEqual(result['regressions'], 2)
+        self.assertTrue(test['exceeds_p95'])
+        self.assertTrue(test['exceeds_duration'])
+        self.assertTrue(test['steps'][0]['exceeds_p95'])
+
+    def test_later_samples_are_ignored(self):
+        result = analytics.analyze_test_run(
+            self.session, self.build_run(40.0, 5.0, run_id=3))
+
+        self.assertEqual(result['tests'][0]['samples'], 2)
+        self.assertIsNone(result['tests'][0]['p95'])
+        self.assertFalse(result['tests'][0]['exceeds_p95'])
+
+    def test_repeated_step_is_compared_by_total(self):
+        # each check is within 2.0 s., but the step took 3.0 s. in total
+        result = analytics.analyze_test_run(
+            self.session, self.build_run(10.0, 1.5, 1.5))
+
+        steps = result['tests'][0]['steps']
+        self.assertEqual(result['regressions'], 1)
+        self.assertEqual([step['total'] for step in steps], [3.0, 3.0])
+        self.assertTrue(all(step['exceeds_p95'] for step in steps))
+
+        result = analytics.analyze_test_run(
+            self.session, self.build_run(10.0, 1.0, 1.0))
+        self.assertEqual(result['regressions'], 0)
+
+
+class TestRecordResult(base.BaseUnitTest):
+
+    def setUp(self):
+        self.item = models.DurationStats(
+            cluster_id=1, test_name='test', step=analytics.WHOLE_TEST,
+            samples=[[1, 10.0], [2, 12.0]])
+        self.session = mock.Mock()
+        self.session.query.return_value.filter_by.return_value\
+            .filter.return_value = [self.item]
+
+    def test_sample_is_appended(self):
+        analytics.record_result(self.session, 3, 1, 'test', 'success', 11.0)
+
+        self.assertEqual(self.item.samples, [[1, 10.0], [2, 12.0], [3, 11.0]])
+
+    def test_restarted_run_replaces_its_sample(self):
+        analytics.record_result(self.session, 2, 1, 'test', 'success', 20.0)
+
+        self.assertEqual(self.item.samples, [[1, 10.0], [2, 20.0]])
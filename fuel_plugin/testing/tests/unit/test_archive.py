@@ -0,0 +1,53 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from fuel_plugin.ostf_adapter import archive
+from fuel_plugin.testing.tests import base
+
+
+class TestArchiveTestRuns(base.BaseUnitTest):
+
+    def setUp(self):
+        batch_patcher = mock.patch.object(archive, '_archive_batch')
+        self.archive_batch = batch_patcher.start()
+        self.addCleanup(batch_patcher.stop)
+
+    def mock_session(self, *batches):
+        session = mock.Mock()
+        query = session.query.return_value
+        query.filter.return_value.filter.return_value.order_by.\
+            return_value.limit.return_value.all.side_effect = batches
+        return session
+
+    def test_archived_by_batches(self):
+        session = self.mock_session([1, 2], [3, 4], [5])
+
+        self.assertEqual(
+            archive.archive_test_runs(session, 30, batch_size=2), 5)
+        self.assertEqual(self.archive_batch.call_count, 3)
+        self.assertEqual(session.commit.call_count, 3)
+
+    def test_nothing_to_archive(self):
+        session = self.mock_session([])
+
+        self.assertEqual(archive.archive_test_runs(session, 30), 0)
+        self.assertFalse(session.commit.called)
+
+    def test_archiving_disabled(self):
+        session = mock.Mock()
+
+        self.assertEqual(archive.archive_test_runs(session, 0), 0)
+        self.assertFalse(session.query.called)
@@ -0,0 +1,83 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.testing.tests import base
+
+
+class TestClusterCache(base.BaseUnitTest):
+
+    def setUp(self):
+        self.cache = cache.ClusterCache()
+        self.cache.set('tests', 1, ['test_a'])
+        self.cache.set('tests', 2, ['test_b'])
+
+    def test_get(self):
+        self.assertEqual(self.cache.get('tests', '1'), ['test_a'])
+        self.assertIsNone(self.cache.get('testsets', 1))
+
+    def test_invalidate_cluster(self):
+        revision = self.cache.revision(1)
+        self.cache.invalidate(1)
+
+        self.assertNotEqual(self.cache.revision(1), revision)
+        self.assertIsNone(self.cache.get('tests', 1))
+        self.assertEqual(self.cache.get('tests', 2), ['test_b'])
+
+    def test_invalidate_all(self):
+        self.cache.invalidate(1)
+        revision = self.cache.revision(1)
+        self.cache.invalidate()
+
+        self.assertNotEqual(self.cache.revision(1), revision)
+        self.assertIsNone(self.cache.get('tests', 1))
+        self.assertIsNone(self.cache.get('tests', 2))
+
+    def test_etag(self):
+        etag = self.cache.etag('tests', 1)
+        self.assertEqual(self.cache.etag('tests', '1'), etag)
+        self.assertNotEqual(self.cache.etag('testsets', 1), etag)
+
+        self.cache.invalidate(2)
+        self.assertEqual(self.cache.etag('tests', 1), etag)
+        self.cache.invalidate(1)
+        self.assertNotEqual(self.cache.etag('tests', 1), etag)
+
+
+class TestTestRunCache(base.BaseUnitTest):
+
+    def setUp(self):
+        self.cache = cache.TestRunCache(size=2)
+
+    def test_eviction(self):
+        for test_run_id in (1, 2, 3):
+            self.cache.set(test_run_id, str(test_run_id))
+
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual(self.cache.get(2), '2')
+        self.assertEqual(self.cache.get(3), '3')
+
+    def test_etag(self):
+        etag = self.cache.etag(1)
+        self.cache.set(1, '{}')
+        self.cache.set(1, '{}')
+        self.assertEqual(self.cache.etag(1), etag)
+
+        self.cache.invalidate(1)
+        self.assertIsNone(self.cache.get(1))
+        restarted_etag = self.cache.etag(1)
+        self.assertNotEqual(restarted_etag, etag)
+
+        self.cache.invalidate()
+        self.assertNotIn(self.cache.etag(1), (etag, restarted_etag))
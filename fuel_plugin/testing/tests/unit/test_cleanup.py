@@ -0,0 +1,87 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+import mock
+
+from fuel_health import cleanup
+from fuel_health import exceptions
+from fuel_plugin.testing.tests import base
+
+
+class TestWaitForServersTermination(base.BaseUnitTest):
+
+    def setUp(self):
+        time_patcher = mock.patch.object(cleanup, 'time')
+        time_mock = time_patcher.start()
+        time_mock.time.return_value = 0
+        self.addCleanup(time_patcher.stop)
+
+        self.compute = mock.Mock()
+        self.manager = cleanup.CleanUpClientManager.__new__(
+            cleanup.CleanUpClientManager)
+        self.manager.config = mock.Mock()
+        self.manager.config.compute.build_timeout = 60
+        self.manager._clients = {'compute': self.compute}
+        self.manager._clients_lock = threading.Lock()
+
+    def server(self, server_id, status):
+        return mock.Mock(id=server_id, status=status)
+
+    def test_error_server_does_not_stop_waiting(self):
+        self.compute.servers.list.side_effect = [
+            [self.server('broken', 'ERROR'), self.server('vm', 'ACTIVE')],
+            [self.server('broken', 'ERROR'), self.server('vm', 'DELETED')],
+            [self.server('broken', 'ERROR')],
+        ]
+
+        self.assertRaises(exceptions.BuildErrorException,
+                          self.manager.wait_for_servers_termination,
+                          ['broken', 'vm'])
+        # the last round confirmed that 'vm' is gone
+        self.assertEqual(self.compute.servers.list.call_count, 3)
+
+    def test_all_servers_are_gone(self):
+        self.compute.servers.list.side_effect = [
+            [self.server('vm', 'ACTIVE')], []]
+
+        self.manager.wait_for_servers_termination(['vm'])
+        self.assertEqual(self.compute.servers.list.call_count, 2)
+
+
+class TestCleanupServers(base.BaseUnitTest):
+
+    def test_failed_delete_still_waits_for_termination(self):
+        manager = mock.Mock()
+        compute = manager.get_client.return_value
+        server = mock.Mock(id='vm')
+        server.name = 'ost1_test-vm'
+        compute.servers.list.return_value = [server]
+        compute.floating_ips.list.return_value = []
+        compute.servers.delete.side_effect = Exception('conflict')
+
+        self.assertEqual(cleanup._cleanup_servers(manager), ['ost1_test-vm'])
+        manager.wait_for_servers_termination.assert_called_once_with(['vm'])
+
+
+class TestPhases(base.BaseUnitTest):
+
+    def test_identity_waits_for_servers_and_volumes(self):
+        phases = dict((phase.name, phase)
+                      for phase in cleanup._get_phases(mock.Mock(), []))
+
+        for name in ('tenants', 'roles'):
+            self.assertTrue(set(['users', 'servers', 'volumes'])
+                            .issubset(phases[name].requires))
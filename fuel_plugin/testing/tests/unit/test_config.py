@@ -0,0 +1,73 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from fuel_health import config
+from fuel_plugin.testing.tests import base
+
+
+NODES = [
+    {'id': 1, 'ip': '10.0.0.1', 'fqdn': 'node-1.domain.tld',
+     'hostname': 'node-1', 'online': True, 'roles': ['controller'],
+     'network_data': [{'name': 'public', 'ip': '172.16.0.1/24'}]},
+    {'id': 2, 'ip': '10.0.0.2', 'fqdn': 'node-2.domain.tld',
+     'hostname': 'node-2', 'online': False, 'roles': ['controller']},
+    {'id': 3, 'ip': '10.0.0.3', 'fqdn': 'node-3.domain.tld',
+     'hostname': 'node-3', 'online': True,
+     'roles': ['compute', 'ceph-osd']},
+    {'id': 4, 'ip': '10.0.0.4', 'fqdn': 'node-4.domain.tld',
+     'hostname': 'node-4', 'online': True, 'roles': ['cinder']},
+]
+
+
+class TestNodesIndex(base.BaseUnitTest):
+
+    def test_index_is_built_for_each_node_list(self):
+        self.assertEqual(len(config.NodesIndex([])), 0)
+
+        nodes = config.NodesIndex(NODES)
+        self.assertEqual(len(nodes), 4)
+        self.assertEqual([node['id'] for node in nodes.by_role('controller')],
+                         [1, 2])
+        self.assertEqual(
+            [node['id'] for node in nodes.by_role('controller', online=True)],
+            [1])
+        self.assertEqual(nodes.public_ip(NODES[0]), '172.16.0.1')
+        self.assertTrue(nodes.is_online('node-3'))
+        self.assertFalse(nodes.is_online('node-2'))
+
+    def test_parsed_node_lists(self):
+        def get(url):
+            if url.endswith('/api/nodes?cluster_id=1'):
+                return mock.Mock(status_code=200,
+                                 **{'json.return_value': NODES})
+            return mock.Mock(**{'json.return_value': []})
+
+        nailgun_config = config.NailgunConfig(parse=False)
+        nailgun_config.cluster_id = 1
+        nailgun_config.req_session = mock.Mock(**{'get.side_effect': get})
+        nailgun_config._parse_nodes_cluster_id()
+
+        self.assertEqual(nailgun_config.compute.controller_nodes,
+                         ['10.0.0.1', '10.0.0.2'])
+        self.assertEqual(nailgun_config.compute.online_controllers,
+                         ['10.0.0.1'])
+        self.assertEqual(nailgun_config.compute.public_ips,
+                         ['172.16.0.1', None])
+        self.assertEqual(nailgun_config.compute.online_computes,
+                         ['10.0.0.3'])
+        self.assertEqual(nailgun_config.compute.compute_nodes, ['10.0.0.3'])
+        self.assertEqual([node['id'] for node in
+                          nailgun_config.compute.ceph_nodes], [3])
@@ -0,0 +1,116 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+
+import mock
+
+from fuel_plugin.ostf_adapter import metrics
+from fuel_plugin.ostf_adapter.wsgi import hooks
+from fuel_plugin.testing.tests import base
+
+
+class TestMetrics(base.BaseUnitTest):
+
+    def test_counter(self):
+        counter = metrics.Counter('requests_total', 'Requests.', ['endpoint'])
+        counter.inc(endpoint='nodes')
+        counter.inc(2, endpoint='nodes')
+        counter.inc(endpoint='clusters')
+
+        self.assertEqual(counter.value(endpoint='nodes'), 3)
+        self.assertEqual(counter.render(), [
+            '# HELP requests_total Requests.',
+            '# TYPE requests_total counter',
+            'requests_total{endpoint="clusters"} 1.0',
+            'requests_total{endpoint="nodes"} 3.0',
+        ])
+
+    def test_gauge(self):
+        gauge = metrics.Gauge('processes', 'Processes.')
+        gauge.set(5)
+        gauge.set(2)
+
+        self.assertEqual(gauge.render()[-1], 'processes 2.0')
+
+    def test_histogram(self):
+        histogram = metrics.Histogram('latency', 'Latency.', ['controller'],
+                                      buckets=(1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value, controller='Root.index')
+
+        self.assertEqual(histogram.count(controller='Root.index'), 4)
+        self.assertEqual(histogram.render()[2:], [
+            'latency_bucket{controller="Root.index",le="1.0"} 2',
+            'latency_bucket{controller="Root.index",le="5.0"} 3',
+            'latency_bucket{controller="Root.index",le="+Inf"} 4',
+            'latency_sum{controller="Root.index"} 14.5',
+            'latency_count{controller="Root.index"} 4',
+        ])
+
+    def test_labels_escaping(self):
+        self.assertEqual(
+            metrics._format_labels(['name'], ['a"b\\c']),
+            '{name="a\\"b\\\\c"}')
+
+    def test_metric_is_abstract(self):
+        self.assertRaises(TypeError, metrics.Metric, 'metric', 'Metric.')
+
+
+class TestCollectTestRuns(base.BaseUnitTest):
+
+    def setUp(self):
+        for metric in (metrics.ACTIVE_TEST_RUNS, metrics.QUEUED_TEST_RUNS,
+                       metrics.TEST_SET_DURATION):
+            self.addCleanup(metric.clear)
+        self.addCleanup(metrics._last_finished_run.update,
+                        dict(metrics._last_finished_run))
+        metrics._last_finished_run.update(ended_at=None, ids=set())
+        metrics.TEST_SET_DURATION.clear()
+
+    def collect(self, *finished):
+        finished_query = mock.MagicMock()
+        query = finished_query.filter_by.return_value.filter.return_value
+        query.order_by.return_value = finished
+        query.filter.return_value.order_by.return_value = finished
+        session = mock.Mock()
+        session.query.side_effect = [
+            mock.MagicMock(), mock.MagicMock(), finished_query]
+        metrics.collect_test_runs(session)
+
+    def test_runs_finished_at_the_same_time(self):
+        started_at = datetime.datetime(2016, 10, 1, 12, 0, 0)
+        ended_at = datetime.datetime(2016, 10, 1, 12, 1, 0)
+
+        self.collect((1, 'smoke', started_at, ended_at))
+        # the second test run finished in the same second as the first one
+        self.collect((1, 'smoke', started_at, ended_at),
+                     (2, 'smoke', started_at, ended_at))
+
+        self.assertEqual(metrics.TEST_SET_DURATION.count(testset='smoke'), 2)
+
+
+class TestControllerName(base.BaseUnitTest):
+
+    def test_controller_name(self):
+        class TestrunsController(object):
+            def get_last(self):
+                pass
+
+        state = mock.Mock(controller=TestrunsController().get_last)
+        self.assertEqual(hooks.controller_name(state),
+                         'TestrunsController.get_last')
+
+        state = mock.Mock(controller=None)
+        self.assertEqual(hooks.controller_name(state), 'unknown')
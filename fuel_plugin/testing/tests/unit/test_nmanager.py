@@ -0,0 +1,144 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from fuel_health import nmanager
+from fuel_plugin.testing.tests import base
+
+
+class FakeManager(object):
+    """Keeps listing deleted resources for given number of polls."""
+
+    def __init__(self, events, polls_before_gone=0):
+        self.events = events
+        self.polls_before_gone = polls_before_gone
+        self.resources = []
+
+    def list(self):
+        if self.polls_before_gone:
+            self.polls_before_gone -= 1
+        else:
+            for thing in [thing for thing in self.resources
+                          if thing.deleted]:
+                self.resources.remove(thing)
+                self.events.append(('gone', type(thing).__name__))
+        return list(self.resources)
+
+
+class Resource(object):
+
+    def __init__(self, manager, resource_id):
+        self.manager = manager
+        self.id = resource_id
+        self.deleted = False
+        manager.resources.append(self)
+
+    def delete(self):
+        self.manager.events.append(('delete', type(self).__name__))
+        self.deleted = True
+
+
+class Volume(Resource):
+    pass
+
+
+class Snapshot(Resource):
+    pass
+
+
+class TestTearDownClass(base.BaseUnitTest):
+
+    def setUp(self):
+        sleep_patcher = mock.patch('fuel_health.test.time.sleep')
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_volume_is_deleted_after_its_snapshot(self):
+        events = []
+        volume = Volume(FakeManager(events), 'vol')
+        snapshot = Snapshot(FakeManager(events, polls_before_gone=2), 'snap')
+
+        class SomeTest(nmanager.OfficialClientTest):
+            os_resources = [volume, snapshot]
+
+        SomeTest.tearDownClass()
+
+        self.assertLess(events.index(('gone', 'Snapshot')),
+                        events.index(('delete', 'Volume')))
+        self.assertIn(('gone', 'Volume'), events)
+        self.assertEqual(SomeTest.error_msg, [])
+
+    def test_deletion_tiers(self):
+        tier = nmanager.OfficialClientTest._deletion_tier
+        self.assertLess(tier(Snapshot(FakeManager([]), 1)),
+                        tier(Volume(FakeManager([]), 2)))
+        self.assertLess(tier(Volume(FakeManager([]), 1)),
+                        tier({'port': {'id': 3}}))
+        self.assertEqual(tier({'port': {'id': 3}}) + 1, tier(object()))
+
+
+class Server(object):
+    pass
+
+
+class TestComputeCapacity(base.BaseUnitTest):
+
+    def setUp(self):
+        nmanager.PlatformServicesBaseClass.invalidate_compute_capacity()
+        self.addCleanup(
+            nmanager.PlatformServicesBaseClass.invalidate_compute_capacity)
+
+        class SomeTest(nmanager.PlatformServicesBaseClass):
+            compute_client = mock.Mock()
+            resource_keys = {}
+            os_resources = []
+
+            def runTest(self):
+                pass
+
+        self.hypervisors = SomeTest.compute_client.hypervisors
+        self.hypervisors.list.return_value = [self.hypervisor(1024)]
+        self.test = SomeTest()
+
+    def hypervisor(self, free_ram_mb):
+        return mock.Mock(hypervisor_hostname='compute-1',
+                         free_ram_mb=free_ram_mb, free_disk_gb=100,
+                         vcpus=4, vcpus_used=0)
+
+    def test_snapshot_is_shared(self):
+        self.assertEqual(self.test.get_max_free_compute_node_ram(512), 1024)
+        self.assertEqual(self.test.get_max_free_compute_node_ram(512), 1024)
+        self.assertEqual(self.hypervisors.list.call_count, 1)
+
+    def test_snapshot_is_refreshed_if_not_enough_ram(self):
+        self.test.get_max_free_compute_node_ram(512)
+        self.hypervisors.list.return_value = [self.hypervisor(4096)]
+
+        self.assertEqual(self.test.get_max_free_compute_node_ram(2048), 4096)
+
+    def test_snapshot_is_dropped_on_new_server(self):
+        self.test.get_max_free_compute_node_ram(512)
+        self.test.set_resource('server', Server())
+        self.hypervisors.list.return_value = [self.hypervisor(256)]
+
+        self.assertEqual(self.test.get_max_free_compute_node_ram(128), 256)
+
+    def test_vms_count_takes_fresh_snapshot(self):
+        self.assertEqual(
+            self.test.get_info_about_available_resources(512, 10, 1), 2)
+        self.hypervisors.list.return_value = [self.hypervisor(512)]
+
+        self.assertEqual(
+            self.test.get_info_about_available_resources(512, 10, 1), 1)
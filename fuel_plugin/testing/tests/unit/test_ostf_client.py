@@ -0,0 +1,123 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import mock
+import requests_mock
+
+from fuel_plugin.ostf_client import client
+from fuel_plugin.testing.tests import base
+
+
+URL = 'http://127.0.0.1:8777/v1'
+
+
+class TestMultiClusterRunner(base.BaseUnitTest):
+
+    def setUp(self):
+        self.client = client.TestingAdapterClient(URL)
+        self.runner = client.MultiClusterRunner(
+            self.client,
+            [('general_test', 1), ('ha', 1), ('general_test', 2)],
+            timeout=10, polling=0)
+        self.addCleanup(self.runner.close)
+
+    def last_response(self, cluster_id, status):
+        return {'json': [
+            {'id': cluster_id * 10, 'testset': 'general_test',
+             'cluster_id': cluster_id, 'status': status},
+            {'id': cluster_id * 10 + 1, 'testset': 'ha',
+             'cluster_id': cluster_id, 'status': status}]}
+
+    @mock.patch('fuel_plugin.ostf_client.client.time')
+    def test_run(self, time_mock):
+        time_mock.time.return_value = 0
+        with requests_mock.Mocker() as m:
+            post = m.post(URL + '/testruns',
+                          json=[{'id': 10}, {'id': 11}, {'id': 20}])
+            last_1 = m.get(URL + '/testruns/last/1', [
+                self.last_response(1, 'running'),
+                self.last_response(1, 'finished')])
+            last_2 = m.get(URL + '/testruns/last/2',
+                           **self.last_response(2, 'finished'))
+
+            results = self.runner.run()
+
+        objects = json.loads(post.last_request.body)['objects']
+        self.assertEqual(post.call_count, 1)
+        self.assertEqual([(item['testset'], item['metadata']['cluster_id'])
+                          for item in objects],
+                         [('general_test', '1'), ('ha', '1'),
+                          ('general_test', '2')])
+        self.assertEqual(last_1.call_count, 2)
+        self.assertEqual(last_2.call_count, 2)
+        self.assertEqual(results[('ha', '1')]['status'], 'finished')
+        self.assertFalse(self.runner.timed_out)
+
+    @mock.patch('fuel_plugin.ostf_client.client.time')
+    def test_wait_timeout(self, time_mock):
+        time_mock.time.side_effect = [0, 1, 100]
+        with requests_mock.Mocker() as m:
+            m.get(URL + '/testruns/last/1', **self.last_response(1, 'running'))
+            m.get(URL + '/testruns/last/2',
+                  **self.last_response(2, 'finished'))
+            put = m.put(URL + '/testruns', json=[])
+
+            self.runner.wait()
+
+        self.assertEqual(self.runner.timed_out,
+                         set([('general_test', '1'), ('ha', '1')]))
+        stopped = json.loads(put.last_request.body)['objects']
+        self.assertItemsEqual([item['id'] for item in stopped], [10, 11])
+
+    @mock.patch('fuel_plugin.ostf_client.client.time')
+    def test_busy_after_stop(self, time_mock):
+        time_mock.time.return_value = 0
+        with requests_mock.Mocker() as m:
+            post = m.post(URL + '/testruns', [
+                {'json': [{'id': 10}, {}, {'id': 20}]},
+                {'json': [{}]}])
+            m.get(URL + '/testruns/last/1', **self.last_response(1, 'running'))
+            m.get(URL + '/testruns/last/2',
+                  **self.last_response(2, 'finished'))
+            m.put(URL + '/testruns', json=[])
+
+            self.runner.start()
+
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(self.runner.timed_out, set([('ha', '1')]))
+        self.assertNotIn(('ha', '1'), self.runner.unfinished)
+
+    @mock.patch('fuel_plugin.ostf_client.client.time')
+    def test_pool_is_reused(self, time_mock):
+        time_mock.time.return_value = 0
+        with requests_mock.Mocker() as m:
+            m.post(URL + '/testruns',
+                   json=[{'id': 10}, {'id': 11}, {'id': 20}])
+            m.get(URL + '/testruns/last/1', [
+                self.last_response(1, 'running'),
+                self.last_response(1, 'finished')])
+            m.get(URL + '/testruns/last/2',
+                  **self.last_response(2, 'finished'))
+
+            with mock.patch.object(client.pool, 'ThreadPool') as pool_mock:
+                pool_mock.return_value.map.side_effect = map
+                self.runner.run()
+
+        # one pool for all polling ticks, joined when run is over
+        self.assertEqual(pool_mock.call_count, 1)
+        self.assertEqual(pool_mock.return_value.map.call_count, 2)
+        pool_mock.return_value.join.assert_called_once_with()
+        self.assertIsNone(self.runner._pool)
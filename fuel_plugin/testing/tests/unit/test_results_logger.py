@@ -14,6 +14,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
 import mock
 
 from fuel_plugin.ostf_adapter import logger
@@ -73,3 +79,70 @@ class TestResultsLogger(base.BaseUnitTest):
         expected = ('ERROR Error test (tests.error.test) '
                     'Message after error TRACEBACK')
         logger._logger.info.assert_called_once_with(expected)
+
+
+class TestJSONResults(base.BaseUnitTest):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.log_dir)
+
+    def get_logger(self, testset='general_test', cluster_id=1):
+        return logger.ResultsLogger(testset, cluster_id, test_run_id=7,
+                                    log_dir=self.log_dir, log_format='json')
+
+    def test_log_results(self):
+        results_log = self.get_logger()
+        results_log.log_results(
+            test_id='tests.failing.test', test_name='Failing test',
+            status='failure', message='Message after fail',
+            traceback='TRACEBACK', time_taken=1.5, step=2)
+        path = os.path.join(self.log_dir, 'cluster_1_general_test.ndjson')
+        # records are buffered until the log is closed
+        self.assertFalse(os.path.exists(path))
+
+        results_log.close()
+
+        with open(path) as log_file:
+            record = json.loads(log_file.read())
+        self.assertEqual(record['test_run_id'], 7)
+        self.assertEqual(record['status'], 'failure')
+        self.assertEqual(record['time_taken'], 1.5)
+        self.assertEqual(record['step'], 2)
+
+    def test_rotation(self):
+        path = os.path.join(self.log_dir, 'cluster_1_general_test.ndjson')
+        writer = logger.ResultsWriter(path, max_bytes=30, backup_count=2,
+                                      compress=True, buffer_size=1)
+        for index in range(4):
+            writer.write({'index': index, 'status': 'success'})
+
+        self.assertItemsEqual(
+            os.listdir(self.log_dir),
+            ['cluster_1_general_test.ndjson',
+             'cluster_1_general_test.ndjson.1.gz',
+             'cluster_1_general_test.ndjson.2.gz'])
+        with gzip.open(path + '.1.gz') as log_file:
+            self.assertEqual(json.loads(log_file.read())['index'], 2)
+
+    def test_read_results(self):
+        for testset, cluster_id in (('general_test', 1), ('ha', 1),
+                                    ('general_test', 2)):
+            results_log = self.get_logger(testset, cluster_id)
+            for status in ('success', 'failure'):
+                results_log.log_results('test', 'Test', status, '', '')
+            results_log.close()
+        path = os.path.join(self.log_dir, 'cluster_1_general_test.ndjson')
+        os.rename(path, path + '.1')
+        results_log = self.get_logger()
+        results_log.log_results('test_new', 'Test', 'failure', '', '')
+        results_log.close()
+
+        records = list(logger.read_results(
+            self.log_dir, cluster_id=1, testset='general_test',
+            status='failure'))
+
+        self.assertEqual([record['test_id'] for record in records],
+                         ['test', 'test_new'])
+        self.assertEqual(
+            len(list(logger.read_results(self.log_dir, cluster_id=1))), 5)
@@ -0,0 +1,164 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import datetime
+import json
+
+import mock
+
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter import serializers
+from fuel_plugin.testing.tests import base
+
+
+RunRow = collections.namedtuple(
+    'RunRow', [key for key, _ in serializers.TEST_RUN_COLUMNS])
+
+
+class TestTestRunsSerializer(base.BaseUnitTest):
+
+    def setUp(self):
+        cache.TEST_RUNS.invalidate()
+        self.addCleanup(cache.TEST_RUNS.invalidate)
+
+        started_at = datetime.datetime(2016, 1, 1, 10, 0, 0)
+        self.rows = [
+            RunRow(1, 'general_test', {}, 1, 'finished', started_at,
+                   started_at + datetime.timedelta(minutes=1)),
+            RunRow(2, 'ha', {}, 1, 'running', started_at, None),
+        ]
+        self.tests_rows = [
+            (1, 'test_a', 'general_test', 'Test A', '', '10 s.', None, 0,
+             'success', 1.0, []),
+            (2, 'test_b', 'ha', 'Test B', '', '10 s.', None, 0,
+             'running', None, []),
+        ]
+
+    def mock_session(self, *results):
+        session = mock.Mock()
+        queries = []
+        for result in results:
+            query = mock.Mock()
+            query.filter.return_value.order_by.return_value.all.\
+                return_value = result
+            query.filter.return_value.order_by.return_value.__iter__ = \
+                lambda self, result=result: iter(result)
+            query.join.return_value = query
+            queries.append(query)
+        session.query.side_effect = queries
+        return session
+
+    def test_test_runs(self):
+        session = self.mock_session(self.rows, self.tests_rows)
+
+        result = [json.loads(item)
+                  for item in serializers.test_runs(session)]
+
+        self.assertEqual([item['id'] for item in result], [1, 2])
+        self.assertEqual(result[0]['started_at'], '2016-01-01 10:00:00')
+        self.assertEqual(result[0]['tests'][0]['id'], 'test_a')
+        self.assertEqual(result[0]['tests'][0]['taken'], 1.0)
+        self.assertEqual(result[1]['tests'][0]['status'], 'running')
+
+    def test_finished_test_runs_are_cached(self):
+        serializers.test_runs(
+            self.mock_session(self.rows, self.tests_rows))
+
+        session = self.mock_session(self.rows, self.tests_rows[1:])
+        result = [json.loads(item)
+                  for item in serializers.test_runs(session)]
+
+        self.assertEqual(result[0]['tests'][0]['id'], 'test_a')
+        # tests are fetched only for the running test run
+        tests_query = session.query.call_args_list[1]
+        self.assertEqual(len(tests_query[0]),
+                         len(serializers.TEST_COLUMNS) + 1)
+
+    def test_tests_have_no_results(self):
+        cache.CLUSTERS.invalidate()
+        self.addCleanup(cache.CLUSTERS.invalidate)
+        session = mock.Mock()
+        session.query.return_value.join.return_value.order_by.\
+            return_value = [('test_a', 'general_test', 'Test A', '', '10 s.')]
+
+        result = json.loads(serializers.tests(session, 1))
+
+        self.assertEqual(result[0]['name'], 'Test A')
+        self.assertIsNone(result[0]['status'])
+        self.assertIsNone(result[0]['steps'])
+
+    def test_join(self):
+        self.assertEqual(json.loads(serializers.join(['{"id": 1}', '{}'])),
+                         [{'id': 1}, {}])
+        self.assertEqual(serializers.join([]), '[]')
+
+
+class TestArchivedTestRunsSerializer(base.BaseUnitTest):
+
+    def setUp(self):
+        cache.TEST_RUNS.invalidate()
+        self.addCleanup(cache.TEST_RUNS.invalidate)
+
+        self.archived = mock.Mock(
+            id=3, test_set_id='general_test', meta={}, cluster_id=1,
+            started_at=datetime.datetime(2016, 1, 1, 10, 0, 0),
+            ended_at=datetime.datetime(2016, 1, 1, 10, 1, 0),
+            results=[{'name': 'test_a', 'status': 'success', 'taken': 1.0,
+                      'message': None, 'step': 0}])
+
+    def mock_session(self, ids, rows=(), templates=()):
+        ids_query, rows_query, templates_query = \
+            mock.Mock(), mock.Mock(), mock.Mock()
+        ids_query.filter.return_value.order_by.return_value.__iter__ = \
+            lambda self: iter(ids)
+        rows_query.filter.return_value.all.return_value = list(rows)
+        templates_query.filter.return_value.__iter__ = \
+            lambda self: iter(templates)
+
+        session = mock.Mock()
+        session.query.side_effect = [ids_query, rows_query, templates_query]
+        return session
+
+    def test_archived_test_runs(self):
+        session = self.mock_session(
+            [(3,)], [self.archived],
+            [('test_a', 'Test A', 'Description', '10 s.')])
+
+        result = json.loads(serializers._archived_test_runs(session)[0][1])
+
+        self.assertEqual(result['status'], 'finished')
+        self.assertEqual(result['tests'], [{
+            'id': 'test_a', 'testset': 'general_test', 'name': 'Test A',
+            'description': 'Description', 'duration': '10 s.',
+            'message': None, 'step': 0, 'status': 'success', 'taken': 1.0,
+            'steps': None}])
+
+    def test_archived_test_runs_are_cached(self):
+        serializers._archived_test_runs(self.mock_session(
+            [(3,)], [self.archived], []))
+
+        session = self.mock_session([(3,)])
+        result = serializers._archived_test_runs(session)
+
+        self.assertEqual(result[0][0], 3)
+        self.assertEqual(session.query.call_count, 1)
+
+    def test_history_is_ordered_by_id(self):
+        with mock.patch.object(serializers, '_test_runs',
+                               return_value=[(1, 'a'), (4, 'd')]):
+            with mock.patch.object(serializers, '_archived_test_runs',
+                                   return_value=[(2, 'b'), (3, 'c')]):
+                self.assertEqual(serializers.history(mock.Mock()),
+                                 ['a', 'b', 'c', 'd'])
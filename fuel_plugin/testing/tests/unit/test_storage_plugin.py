@@ -0,0 +1,71 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from nose import case
+import unittest2
+
+from fuel_plugin.ostf_adapter import analytics
+from fuel_plugin.ostf_adapter.nose_plugin import nose_storage_plugin
+from fuel_plugin.ostf_adapter.storage import models
+from fuel_plugin.testing.tests import base
+
+
+class FakeScenario(unittest2.TestCase):
+
+    def test_scenario(self):
+        """Fake scenario"""
+
+
+@mock.patch.object(models.TestResult, 'add_result')
+class TestStoragePlugin(base.BaseUnitTest):
+
+    def setUp(self):
+        self.plugin = nose_storage_plugin.StoragePlugin(
+            session=mock.MagicMock(), test_run_id=1, cluster_id=1,
+            ostf_os_access_creds={}, token=None, results_log=mock.Mock())
+        self.scenario = FakeScenario('test_scenario')
+        self.test = case.Test(self.scenario)
+
+    def test_steps_timeline_is_saved(self, m_add_result):
+        timeline = [{'step': 1, 'action': 'create server', 'duration': 1.5,
+                     'timeout': 10, 'outcome': 'success'}]
+        self.scenario.steps_timeline = timeline
+
+        self.plugin.addSuccess(self.test)
+
+        data = m_add_result.call_args[0][3]
+        self.assertEqual(data['steps'], timeline)
+        self.assertEqual(data['status'], 'success')
+
+    def test_steps_timeline_is_empty_without_verify(self, m_add_result):
+        self.plugin.beforeTest(self.test)
+
+        data = m_add_result.call_args[0][3]
+        self.assertIsNone(data['steps'])
+
+    @mock.patch.object(analytics, 'record_result',
+                       side_effect=Exception('duplicate key'))
+    def test_failed_durations_keep_result(self, m_record, m_add_result):
+        session = self.plugin.session
+        savepoint = session.begin_nested.return_value
+
+        self.plugin.addSuccess(self.test)
+
+        self.assertTrue(m_record.called)
+        # the savepoint is rolled back and the result is committed
+        self.assertIsNotNone(savepoint.__exit__.call_args[0][0])
+        self.assertTrue(m_add_result.called)
+        self.assertTrue(session.commit.called)
+        self.assertFalse(session.rollback.called)
@@ -0,0 +1,74 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from webob import etag as webob_etag
+
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter.wsgi import controllers
+from fuel_plugin.testing.tests import base
+
+
+class TestTestrunsGetOne(base.BaseUnitTest):
+
+    def setUp(self):
+        cache.TEST_RUNS.invalidate()
+        self.addCleanup(cache.TEST_RUNS.invalidate)
+
+        self.request = mock.Mock()
+        self.response = mock.Mock(status=200)
+        for name in ('request', 'response'):
+            patcher = mock.patch.object(controllers, name,
+                                        getattr(self, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        serializers_patcher = mock.patch.object(
+            controllers.serializers, 'test_run', return_value=None)
+        self.test_run = serializers_patcher.start()
+        self.addCleanup(serializers_patcher.stop)
+
+        self.controller = controllers.TestrunsController()
+
+    def test_actual_etag_of_finished_test_run(self):
+        cache.TEST_RUNS.set(1, '{"id": 1}')
+        self.request.if_none_match = webob_etag.ETagMatcher(
+            [cache.TEST_RUNS.etag(1)])
+
+        self.assertEqual(self.controller.get_one('1'), '')
+        self.assertEqual(self.response.status, 304)
+        self.assertFalse(self.test_run.called)
+
+    def test_any_etag_of_finished_test_run(self):
+        cache.TEST_RUNS.set(1, '{"id": 1}')
+        self.request.if_none_match = webob_etag.AnyETag
+
+        self.assertEqual(self.controller.get_one('1'), '{"id": 1}')
+        self.assertEqual(self.response.status, 200)
+
+    def test_any_etag_of_running_test_run(self):
+        self.test_run.return_value = '{"id": 1, "status": "running"}'
+        self.request.if_none_match = webob_etag.AnyETag
+
+        self.assertEqual(self.controller.get_one('1'),
+                         '{"id": 1, "status": "running"}')
+        self.assertEqual(self.response.status, 200)
+
+    def test_etag_of_unknown_test_run(self):
+        for if_none_match in (webob_etag.AnyETag, webob_etag.ETagMatcher(
+                [cache.TEST_RUNS.etag(404)])):
+            self.request.if_none_match = if_none_match
+
+            self.assertEqual(self.controller.get_one('404'), '{}')
+            self.assertEqual(self.response.status, 200)
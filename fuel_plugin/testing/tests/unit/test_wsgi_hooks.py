@@ -0,0 +1,102 @@
+#    Copyright 2016 Mirantis, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from sqlalchemy import orm
+
+from fuel_plugin.ostf_adapter import cache
+from fuel_plugin.ostf_adapter.wsgi import hooks
+from fuel_plugin.testing.tests import base
+
+
+class TestSQLProfile(base.BaseUnitTest):
+
+    def test_statement_shape(self):
+        self.assertEqual(
+            hooks.statement_shape(
+                'SELECT tests.id FROM tests\n'
+                'WHERE tests.name IN (%(name_1)s, %(name_2)s)'),
+            'SELECT tests.id FROM tests WHERE tests.name IN (?)')
+        self.assertEqual(
+            hooks.statement_shape('SELECT * FROM tests WHERE id IN (?, ?)'),
+            hooks.statement_shape('SELECT * FROM tests WHERE id IN (?)'))
+
+    def test_repeated_statements(self):
+        profile = hooks.SQLProfile(repeat_threshold=2)
+        for name in ('a', 'b', 'c'):
+            profile.record('SELECT * FROM tests WHERE test_run_id = ?', 0.01)
+        profile.record('SELECT * FROM test_runs', 0.02)
+
+        self.assertEqual(profile.statements, 4)
+        self.assertEqual(
+            profile.repeated(),
+            [('SELECT * FROM tests WHERE test_run_id = ?', 3)])
+        self.assertEqual(profile.summary(),
+                         'statements=4; time_ms=50.0; repeated=1')
+
+
+class TestCustomTransactionalHook(base.BaseUnitTest):
+
+    def setUp(self):
+        self.session = orm.scoped_session(orm.sessionmaker())
+        self.session.commit = mock.Mock()
+        self.hook = hooks.CustomTransactionalHook(self.session)
+
+    def request(self):
+        return mock.Mock(sql_statements=0, sql_profile=None,
+                         sql_connections_info=[], changed_test_runs=[],
+                         transactional=True, error=False)
+
+    def test_statements_are_counted_per_request(self):
+        first, second = self.request(), self.request()
+        first_conn, second_conn = mock.Mock(info={}), mock.Mock(info={})
+
+        self.session.info[hooks.REQUEST_INFO_KEY] = first
+        self.hook._after_begin(self.session, None, first_conn)
+        self.session.info[hooks.REQUEST_INFO_KEY] = second
+        self.hook._after_begin(self.session, None, second_conn)
+        for conn in (first_conn, second_conn, first_conn):
+            self.hook._before_cursor_execute(
+                conn, None, 'SELECT 1', {}, None, False)
+
+        self.assertEqual(first.sql_statements, 2)
+        self.assertEqual(second.sql_statements, 1)
+        self.assertEqual(first.sql_connections_info, [first_conn.info])
+
+    def test_connections_are_released_after_request(self):
+        state = mock.Mock(controller=None, request=self.request())
+        conn = mock.Mock(info={})
+        self.session.info[hooks.REQUEST_INFO_KEY] = state.request
+        self.hook._after_begin(self.session, None, conn)
+
+        self.hook.after(state)
+
+        self.assertNotIn(hooks.REQUEST_INFO_KEY, conn.info)
+        self.hook._before_cursor_execute(
+            conn, None, 'SELECT 1', {}, None, False)
+        self.assertEqual(state.request.sql_statements, 0)
+
+    def test_test_runs_invalidated_after_commit(self):
+        state = mock.Mock(controller=None, request=self.request())
+        state.request.changed_test_runs = [1]
+        cache.TEST_RUNS.set(1, 'finished')
+        self.addCleanup(cache.TEST_RUNS.invalidate)
+
+        cached_on_commit = []
+        self.session.commit.side_effect = \
+            lambda: cached_on_commit.append(cache.TEST_RUNS.get(1))
+        self.hook.after(state)
+
+        self.assertEqual(cached_on_commit[0], 'finished')
+        self.assertIsNone(cache.TEST_RUNS.get(1))